@@ -5,6 +5,7 @@ from models.daily_log import DailyLog
 from models.feeding_log import FeedingLog
 from models.sleep_log import SleepLog
 from models.diaper_log import DiaperLog
+from utils.date_utils import parse_date_time
 
 class DailyLogController:
     def __init__(self, data_service):
@@ -15,6 +16,16 @@ class DailyLogController:
             data_service: Service for data persistence
         """
         self.data_service = data_service
+        self.listeners = []
+        
+    def add_listener(self, listener):
+        """
+        Register a callback to run after new logs are saved
+
+        Args:
+            listener (callable): Called as listener(baby_id, logs) with the list of new logs
+        """
+        self.listeners.append(listener)
         
     def add_feeding_log(self, baby_id, date, time, feeding_type, amount = None, duration = None, notes = None):
         """
@@ -58,6 +69,7 @@ class DailyLogController:
             baby.daily_logs = []
         baby.daily_logs.append(log)
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [log])
         
         return log
     
@@ -103,6 +115,7 @@ class DailyLogController:
             baby.daily_logs = []
         baby.daily_logs.append(log)
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [log])
         
         return log
     
@@ -143,9 +156,121 @@ class DailyLogController:
             baby.daily_logs = []
         baby.daily_logs.append(log)
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [log])
         
         return log
     
+    def add_logs(self, baby_id, entries):
+        """
+        Add several logs of any type to baby with a single load and save
+
+        Args:
+            baby_id (str): UUID of baby
+            entries (list): Log specs as dicts with a 'log_type' key ('feeding', 'sleep', 'diaper')
+                plus the keyword arguments of the matching add_*_log method,
+                e.g. {"log_type": "feeding", "date": "2024-01-01", "time": "08:30", "feeding_type": "bottle"}
+
+        Returns:
+            list: Created logs in the order given, or None if baby not found
+            
+        Raises:
+            ValueError: If any entry is invalid. Nothing is saved in that case.
+        """
+        # Validate and build every log before touching storage
+        logs = [self._build_log(baby_id, entry) for entry in entries]
+        
+        # Get baby
+        baby = self.data_service.load_baby(baby_id)
+        if not baby:
+            return None
+        
+        # Add to baby and save
+        if not hasattr(baby, 'daily_logs'):
+            baby.daily_logs = []
+        baby.daily_logs.extend(logs)
+        self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, logs)
+        
+        return logs
+    
+    def get_daily_logs(self, baby_id, date = None):
+        """
+        Get daily logs for baby in chronological order
+
+        Args:
+            baby_id (str): UUID of baby
+            date (datetime or str, optional): Only return logs from this day. Defaults to None.
+
+        Returns:
+            list: List of logs sorted by date and time, or None if baby not found
+        """
+        if date is not None:
+            date, _ = self._parse_date_time(date, None)
+        
+        # Archived logs are only decompressed when the date reaches into them
+        return self.data_service.load_daily_logs(baby_id, date, date)
+
+    def iter_daily_logs(self, baby_id):
+        """
+        Iterate over all of a baby's logs in chronological order, building each one only when reached.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Yields:
+            DailyLog: Next log, archived ones included; nothing if baby not found
+        """
+        return self.data_service.iter_records(baby_id, "daily_logs")
+    
+    # Helper method to run registered listeners
+    def _notify_listeners(self, baby_id, logs):
+        """
+        Pass newly saved logs to every registered listener.
+
+        Args:
+            baby_id (str): UUID of baby
+            logs (list): Logs that were just saved
+        """
+        for listener in self.listeners:
+            listener(baby_id, logs)
+    
+    # Helper method to build a log from a batch entry
+    def _build_log(self, baby_id, entry):
+        """
+        Build a log from a batch entry.
+
+        Args:
+            baby_id (str): UUID of baby
+            entry (dict): Log spec (see add_logs)
+
+        Returns:
+            DailyLog: FeedingLog, SleepLog or DiaperLog
+        """
+        fields = dict(entry)
+        log_type = fields.pop("log_type", None)
+        
+        try:
+            if log_type == "feeding":
+                date, time = self._parse_date_time(fields.pop("date"), fields.pop("time"))
+                return FeedingLog(baby_id, date, time, **fields)
+            
+            if log_type == "sleep":
+                date, start_time = self._parse_date_time(fields.pop("date"), fields.pop("start_time"))
+                end_time = fields.pop("end_time", None)
+                if end_time:
+                    _, end_time = self._parse_date_time(date, end_time)
+                return SleepLog(baby_id, date, start_time, end_time, **fields)
+            
+            if log_type == "diaper":
+                date, time = self._parse_date_time(fields.pop("date"), fields.pop("time"))
+                return DiaperLog(baby_id, date, time, **fields)
+        except KeyError as e:
+            raise ValueError(f"Missing field {e} in {log_type} log entry") from e
+        except TypeError as e:
+            raise ValueError(f"Invalid {log_type} log entry: {e}") from e
+        
+        raise ValueError(f"Unknown log type: {log_type}")
+    
     # Helper method to parse date/time strings
     def _parse_date_time(self, date, time):
         """
@@ -158,14 +283,4 @@ class DailyLogController:
         Returns:
             tuple: (datetime.date, datetime.time)
         """
-        if isinstance(date, str):
-            date = datetime.strptime(date, "%Y-%m-%d").date()
-        elif isinstance(date, datetime):
-            date = date.date()
-        
-        if isinstance(time, str):
-            time = datetime.strptime(time, "%H:%M").time()
-        elif isinstance(time, datetime):
-            time = time.time()
-        
-        return date, time
\ No newline at end of file
+        return parse_date_time(date, time)
\ No newline at end of file
@@ -12,6 +12,17 @@ class GrowthController:
             data_service: Service for data persistence
         """
         self.data_service = data_service
+        self.listeners = []
+    
+    def add_listener(self, listener):
+        """
+        Register a callback to run after growth records are saved or deleted
+
+        Args:
+            listener (callable): Called as listener(baby_id, records, removed_ids) with the
+                added or updated records and the IDs of deleted records
+        """
+        self.listeners.append(listener)
     
     def add_growth_record(self, baby_id, date, weight = None, height = None, head_circumference = None, notes = None):
         """
@@ -51,9 +62,52 @@ class GrowthController:
         # Add to baby and save
         baby.add_growth_record(growth_record)
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [growth_record])
         
         return growth_record
     
+    def add_growth_records(self, baby_id, records):
+        """
+        Add several growth records for baby with a single load and save
+
+        Args:
+            baby_id (str): UUID of baby
+            records (list): Dicts of add_growth_record keyword arguments
+                (date, weight, height, head_circumference, notes)
+
+        Returns:
+            list: Created growth records in the order given, or None if baby not found
+            
+        Raises:
+            ValueError: If any record is invalid. Nothing is saved in that case.
+        """
+        # Validate and build every record before touching storage
+        growth_records = []
+        for fields in records:
+            fields = dict(fields)
+            try:
+                date = fields.pop("date")
+                if isinstance(date, str):
+                    date = datetime.strptime(date, "%Y-%m-%d")
+                growth_records.append(GrowthRecord(baby_id, date, **fields))
+            except KeyError as e:
+                raise ValueError("Missing field 'date' in growth record") from e
+            except TypeError as e:
+                raise ValueError(f"Invalid growth record: {e}") from e
+        
+        # Get the baby
+        baby = self.data_service.load_baby(baby_id)
+        if not baby:
+            return None
+        
+        # Add to baby and save
+        for growth_record in growth_records:
+            baby.add_growth_record(growth_record)
+        self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, growth_records)
+        
+        return growth_records
+    
     def get_growth_records(self, baby_id):
         """
         Get all growth records for baby.
@@ -69,6 +123,18 @@ class GrowthController:
             return None
         
         return sorted(baby.growth_records, key = lambda r: r.date)
+
+    def iter_growth_records(self, baby_id):
+        """
+        Iterate over a baby's growth records in date order, building each one only when reached.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Yields:
+            GrowthRecord: Next record; nothing if baby not found
+        """
+        return self.data_service.iter_records(baby_id, "growth_records")
     
     def update_growth_record(self, baby_id, record_id, **kwargs):
         """
@@ -99,6 +165,7 @@ class GrowthController:
                 
         # Save changes
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [record])
         
         return record
     
@@ -126,5 +193,19 @@ class GrowthController:
         
         # Save changes
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [], [record_id])
         
-        return True
\ No newline at end of file
+        return True
+    
+    # Helper method to run registered listeners
+    def _notify_listeners(self, baby_id, records, removed_ids = ()):
+        """
+        Pass saved and deleted growth records to every registered listener.
+
+        Args:
+            baby_id (str): UUID of baby
+            records (list): Records that were added or updated
+            removed_ids (list, optional): IDs of records that were deleted. Defaults to ().
+        """
+        for listener in self.listeners:
+            listener(baby_id, records, list(removed_ids))
\ No newline at end of file
@@ -13,6 +13,7 @@ class MilestoneController:
         """
         
         self.data_service = data_service
+        self.listeners = []
         
         # TODO: Do research of worldwide standard / approved milestones for babies (WHO/UN?)
         # TODO: Evaluate if standard_milestones data should be kept in data service and not directly in controller
@@ -58,6 +59,16 @@ class MilestoneController:
                 {"name": "Engages in pretend play", "min_months": 24, "max_months": 36},
             ]
         }
+    
+    def add_listener(self, listener):
+        """
+        Register a callback to run after milestones are saved or deleted
+
+        Args:
+            listener (callable): Called as listener(baby_id, milestones, removed_ids) with the
+                added or updated milestones and the IDs of deleted milestones
+        """
+        self.listeners.append(listener)
         
     def add_milestone(self, baby_id, name, category, achieved_date = None, expected_range = None, notes = None):
         """
@@ -99,9 +110,51 @@ class MilestoneController:
             baby.milestones = []
         baby.milestones.append(milestone)
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [milestone])
         
         return milestone
         
+    def add_milestones(self, baby_id, milestones):
+        """
+        Add several milestones for a baby with a single load and save
+
+        Args:
+            baby_id (str): UUID of baby
+            milestones (list): Dicts of add_milestone keyword arguments
+                (name, category, achieved_date, expected_range, notes)
+
+        Returns:
+            list: Created milestones in the order given, or None if baby not found
+            
+        Raises:
+            ValueError: If any milestone is invalid. Nothing is saved in that case.
+        """
+        # Validate and build every milestone before touching storage
+        created = []
+        for fields in milestones:
+            fields = dict(fields)
+            achieved_date = fields.pop("achieved_date", None)
+            if isinstance(achieved_date, str) and achieved_date:
+                achieved_date = datetime.strptime(achieved_date, '%Y-%m-%d')
+            try:
+                created.append(Milestone(baby_id, achieved_date = achieved_date or None, **fields))
+            except TypeError as e:
+                raise ValueError(f"Invalid milestone: {e}") from e
+            
+        # Get baby
+        baby = self.data_service.load_baby(baby_id)
+        if not baby:
+            return None
+        
+        # Add to baby and save
+        if not hasattr(baby, 'milestones'):
+            baby.milestones = []
+        baby.milestones.extend(created)
+        self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, created)
+        
+        return created
+        
     def get_milestones(self, baby_id):
         """
         Get all milestone for baby.
@@ -156,6 +209,7 @@ class MilestoneController:
                 
         # Save changes
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [milestone])
         
         return milestone
     
@@ -189,8 +243,21 @@ class MilestoneController:
         
         # Save changes
         self.data_service.save_baby(baby)
+        self._notify_listeners(baby_id, [], [milestone_id])
         
         return True
+    
+    def _notify_listeners(self, baby_id, milestones, removed_ids = ()):
+        """
+        Pass saved and deleted milestones to every registered listener.
+
+        Args:
+            baby_id (str): UUID of baby
+            milestones (list): Milestones that were added or updated
+            removed_ids (list, optional): IDs of milestones that were deleted. Defaults to ().
+        """
+        for listener in self.listeners:
+            listener(baby_id, milestones, list(removed_ids))
         
     def get_milestone_suggestions(self, baby_age_months):
         suggestions = {}
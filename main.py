@@ -1,29 +1,122 @@
+import sys
+import time
 
-from controllers.baby_controller import BabyController
-from controllers.growth_controller import GrowthController
-from controllers.milestone_controller import MilestoneController
-from controllers.daily_log_controller import DailyLogController
-from services.data_service import DataService
-from views.cli_view import CLIView
+# Taken as early as possible so --startup-timing covers everything below
+_START = time.perf_counter()
+
+# Cold-start budget checked by --startup-timing, in milliseconds
+STARTUP_BUDGET_MS = 200
+
+# Modules the interactive menu needs, in the order they are first imported
+STARTUP_MODULES = [
+    "utils.app_context",
+    "services.data_service",
+    "services.search_service",
+    "controllers.baby_controller",
+    "controllers.growth_controller",
+    "controllers.milestone_controller",
+    "controllers.daily_log_controller",
+    "services.age_service",
+    "views.cli_view",
+]
+
+def build_cli_view(context = None):
+    """
+    Build the interactive CLI view.
+
+    Args:
+        context (AppContext, optional): Application context. Defaults to None (use "data").
+
+    Returns:
+        CLIView: View wired to the context's controllers
+    """
+    from utils.app_context import AppContext
+    from views.cli_view import CLIView
+
+    if context is None:
+        context = AppContext()
+
+    return CLIView(
+        context.baby_controller,
+        context.growth_controller,
+        context.milestone_controller,
+        context.daily_log_controller,
+        context.age_service
+    )
+
+def report_startup_timing(data_dir = None, output = None):
+    """
+    Measure cold start: import time per module and time to first menu.
+
+    The menu is printed to stdout and the report to stderr.
+
+    Args:
+        data_dir (str, optional): Data directory to start against. Defaults to None
+            (an empty temporary directory, so no data directory is created).
+        output (file, optional): Stream for the report. Defaults to sys.stderr.
+
+    Returns:
+        int: 0 if time to first menu is within STARTUP_BUDGET_MS, 1 otherwise
+    """
+    import importlib
+    import tempfile
+
+    output = output or sys.stderr
+    rows = []
+
+    for module_name in STARTUP_MODULES:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        rows.append((f"import {module_name}", (time.perf_counter() - start) * 1000))
+
+    from utils.app_context import AppContext
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        cli_view = build_cli_view(AppContext(data_dir or temp_dir))
+        rows.append(("construct services and view", (time.perf_counter() - start) * 1000))
+
+        start = time.perf_counter()
+        cli_view.print_main_menu()
+        sys.stdout.flush()
+        rows.append(("render main menu", (time.perf_counter() - start) * 1000))
+
+        total = (time.perf_counter() - _START) * 1000
+    within_budget = total <= STARTUP_BUDGET_MS
+
+    lines = ["", "===== Startup timing (ms) ====="]
+    lines.extend(f"{label:<45} {ms:8.2f}" for label, ms in rows)
+    lines.append("-" * 54)
+    lines.append(f"{'time to first menu':<45} {total:8.2f}")
+    lines.append(f"{'budget':<45} {STARTUP_BUDGET_MS:8.2f} {'OK' if within_budget else 'OVER BUDGET'}")
+    output.write("\n".join(lines) + "\n")
+
+    return 0 if within_budget else 1
 
 def main():
     """
     Main entry point for the Baby Tracker application.
+
+    With command-line arguments, runs a single command (or a --batch file)
+    and prints JSON. Without arguments, starts the interactive menu.
+    Subsystems are only imported once the chosen mode needs them.
     """
-    # Initialize services
-    data_service = DataService()
-    
-    # Initialize controllers
-    baby_controller = BabyController(data_service)
-    growth_controller = GrowthController(data_service)
-    milestone_controller = MilestoneController(data_service)
-    daily_log_controller = DailyLogController(data_service)
-    
-    # Initialize view
-    cli_view = CLIView(baby_controller, growth_controller, milestone_controller, daily_log_controller)
-    
+    argv = sys.argv[1:]
+
+    if argv[:1] == ["--startup-timing"]:
+        options = argv[1:]
+        if options and options[0].startswith("--data-dir="):
+            options = ["--data-dir", options[0].split("=", 1)[1]]
+        if options and (len(options) != 2 or options[0] != "--data-dir"):
+            sys.exit("usage: main.py --startup-timing [--data-dir DIR]")
+        sys.exit(report_startup_timing(options[1] if options else None))
+
+    if argv:
+        from views.command_view import CommandView
+        sys.exit(CommandView().run(argv))
+
     # Run the application
-    cli_view.run()
+    build_cli_view().run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
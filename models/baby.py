@@ -5,6 +5,7 @@ import re
 import uuid
 
 from models import daily_log
+from utils.date_utils import calendar_age
 
 class Baby:
     def __init__(self, name, birthdate, gender = None, notes = None) -> None:
@@ -34,24 +35,12 @@ class Baby:
             as_of_date (datetime, optional): Date to calculate age as of.
                 Defaults to current date.
         Returns:
-            dict: Contains years, months, days. 
+            dict: Contains years, months, days (calendar-accurate), total_months and total_days.
         """
         if as_of_date is None:
             as_of_date = datetime.now()
         
-        # TODO: Fix calculation to avoid standard 30 day months
-        delta = as_of_date - self.birthdate
-        years = delta.days // 365
-        remaining_days = delta.days % 365
-        months = remaining_days // 30
-        days = remaining_days % 30
-        
-        return {
-            "years": years,
-            "months": months,
-            "days": days,
-            "total_days": delta.days
-        }
+        return calendar_age(self.birthdate, as_of_date)
         
     def add_growth_record(self, growth_record) -> None:
         """
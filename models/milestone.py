@@ -3,6 +3,8 @@
 import uuid
 from datetime import datetime
 
+from utils.date_utils import months_between
+
 class Milestone:
     def __init__(self, baby_id, name, category, achieved_date = None, expected_range = None, notes = None):
         """
@@ -38,20 +40,53 @@ class Milestone:
         Returns:
             bool or None: True if on time, False if late/early, None if no expected range or not achieved
         """
-        if not self.is_achieved() or not self.expected_range:
+        status = self.achievement_status(baby_birthdate)
+        if status is None:
+            return None
+        
+        return status == "on_time"
+    
+    def age_at_achievement(self, baby_birthdate):
+        """
+        Calculate baby's age in whole calendar months when milestone was achieved.
+
+        Args:
+            baby_birthdate (datetime): Baby's birthdate
+
+        Returns:
+            int or None: Age in months, None if not achieved
+        """
+        if not self.is_achieved():
             return None
         
-        # Calculate age in months when milestone is achieved
-        delta = self.achieved_date - baby_birthdate
-        months_age = delta.days // 30
+        return months_between(baby_birthdate, self.achieved_date)
+    
+    def achievement_status(self, baby_birthdate):
+        """
+        Classify milestone achievement against the expected range.
+
+        Args:
+            baby_birthdate (datetime): Baby's birthdate
+
+        Returns:
+            str or None: 'early', 'on_time' or 'late', None if no expected range or not achieved
+        """
+        if not self.is_achieved() or not self.expected_range:
+            return None
         
         min_months = self.expected_range.get("min_months")
         max_months = self.expected_range.get("max_months")
         
-        if min_months is not None and max_months is not None:
-            return min_months <= months_age <= max_months
+        if min_months is None or max_months is None:
+            return None
+        
+        months_age = self.age_at_achievement(baby_birthdate)
         
-        return None
+        if months_age < min_months:
+            return "early"
+        if months_age > max_months:
+            return "late"
+        return "on_time"
     
     def to_dict(self):
         """
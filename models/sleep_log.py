@@ -21,6 +21,32 @@ class SleepLog(DailyLog):
         self.end_time = end_time
         self.quality = quality
     
+    @property
+    def start_datetime(self):
+        """Absolute timestamp of sleep start."""
+        if isinstance(self.start_time, datetime):
+            return self.start_time
+        return datetime.combine(self.date, self.start_time)
+    
+    @property
+    def end_datetime(self):
+        """
+        Absolute timestamp of sleep end, None if still ongoing.
+        
+        An end time before the start time is taken to be on the next day,
+        so sleeps crossing midnight get the right duration.
+        """
+        if not self.end_time:
+            return None
+        
+        if isinstance(self.end_time, datetime):
+            return self.end_time
+        
+        end = datetime.combine(self.date, self.end_time)
+        if end < self.start_datetime:
+            end += timedelta(days = 1)
+        return end
+    
     # TODO: Understand why is the @property decorator used here
     @property
     def duration(self):
@@ -28,7 +54,7 @@ class SleepLog(DailyLog):
         if not self.end_time:
             return None
         
-        delta = self.end_time - self.start_time
+        delta = self.end_datetime - self.start_datetime
         return delta.total_seconds() / 60
     
     def to_dict(self):
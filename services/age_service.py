@@ -0,0 +1,105 @@
+# services/age_service.py
+
+from datetime import date
+
+from utils.date_utils import calendar_age, to_date
+
+# Reference days kept in the cache (today plus a few explicit as-of dates)
+CACHED_DAYS = 4
+
+
+class AgeService:
+    def __init__(self):
+        """
+        Initialize the AgeService.
+
+        Ages are calendar-accurate (see utils.date_utils.calendar_age) and
+        cached per reference day, so listing many babies, or the same babies
+        on every render, computes each (birthdate, day) pair once. Today's
+        date is read once per call rather than once per baby.
+        """
+        self.cache = {}
+
+    def _day_cache(self, as_of):
+        """Get the cache for a reference day, evicting the oldest day when full."""
+        day_cache = self.cache.get(as_of)
+        if day_cache is None:
+            if len(self.cache) >= CACHED_DAYS:
+                del self.cache[next(iter(self.cache))]
+            day_cache = self.cache[as_of] = {}
+        return day_cache
+
+    def age(self, birthdate, as_of = None):
+        """
+        Get an age in calendar years, months and days.
+
+        Args:
+            birthdate (date or datetime): Date of birth
+            as_of (date or datetime, optional): Date to measure at. Defaults to None (today).
+
+        Returns:
+            dict: Contains years, months, days, total_months and total_days
+        """
+        return self.ages([birthdate], as_of)[0]
+
+    def ages(self, birthdates, as_of = None):
+        """
+        Get ages for many birthdates at one reference day.
+
+        Args:
+            birthdates (iterable): Dates of birth (date or datetime)
+            as_of (date or datetime, optional): Date to measure at. Defaults to None (today).
+
+        Returns:
+            list: Age dicts in the order of birthdates
+        """
+        as_of = to_date(as_of) if as_of is not None else date.today()
+        day_cache = self._day_cache(as_of)
+
+        results = []
+        for birthdate in birthdates:
+            birthdate = to_date(birthdate)
+            age = day_cache.get(birthdate)
+            if age is None:
+                age = day_cache[birthdate] = calendar_age(birthdate, as_of)
+            results.append(dict(age))
+        return results
+
+    def batch(self, pairs):
+        """
+        Get ages for many (birthdate, as_of) pairs.
+
+        Pairs are grouped by reference day so each day's cache is looked up once.
+
+        Args:
+            pairs (iterable): (birthdate, as_of) tuples; as_of None means today
+
+        Returns:
+            list: Age dicts in the order of pairs
+        """
+        today = date.today()
+        by_day = {}
+        pairs = list(pairs)
+        for position, (birthdate, as_of) in enumerate(pairs):
+            day = to_date(as_of) if as_of is not None else today
+            by_day.setdefault(day, []).append((position, birthdate))
+
+        results = [None] * len(pairs)
+        for day, entries in by_day.items():
+            ages = self.ages((birthdate for _, birthdate in entries), day)
+            for (position, _), age in zip(entries, ages):
+                results[position] = age
+        return results
+
+    def months_old(self, birthdate, as_of = None):
+        """
+        Get an age in whole calendar months.
+
+        Args:
+            birthdate (date or datetime): Date of birth
+            as_of (date or datetime, optional): Date to measure at. Defaults to None (today).
+
+        Returns:
+            int: Whole months of age
+        """
+        return self.age(birthdate, as_of)["total_months"]
@@ -0,0 +1,319 @@
+# services/backup_service.py
+
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+
+from services.data_service import ARCHIVE_DIRNAME, LAYOUT_FILENAME, DataService
+from utils.schema import upgrade_document
+
+# Chunk boundaries fall after a line whose CRC has these low bits clear (about 1 line in 128)
+BOUNDARY_MASK = 0x7F
+
+# Chunk size limits in bytes; the maximum also bounds chunks of data with few newlines
+MIN_CHUNK_SIZE = 2 * 1024
+MAX_CHUNK_SIZE = 64 * 1024
+
+# Snapshot IDs are their creation time, so they sort chronologically
+SNAPSHOT_ID_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+def split_chunks(data):
+    """
+    Split file contents into content-defined chunks.
+
+    Boundaries depend only on nearby lines, so an edit to one record of a
+    pretty-printed baby document changes the chunks around it while the
+    rest of the file still splits into the same chunks as before.
+
+    Args:
+        data (bytes): File contents
+
+    Returns:
+        list: Chunks (bytes) that concatenate to data
+    """
+    chunks = []
+    start = 0
+    position = 0
+    while position < len(data):
+        end = data.find(b"\n", position)
+        end = len(data) if end == -1 else end + 1
+        if end - start > MAX_CHUNK_SIZE:
+            end = start + MAX_CHUNK_SIZE
+        line = data[position:end]
+        position = end
+        size = position - start
+        if size >= MAX_CHUNK_SIZE or (size >= MIN_CHUNK_SIZE and not zlib.crc32(line) & BOUNDARY_MASK):
+            chunks.append(data[start:position])
+            start = position
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+class BackupService:
+    def __init__(self, data_service, backup_dir):
+        """
+        Initialize the BackupService.
+
+        Backups are content addressed: baby files, archive segments and the
+        layout marker are split into chunks stored once each under their
+        SHA-256, and every backup writes only chunks the repository does not
+        have yet plus a manifest listing each file's chunks. Files whose
+        mtime and size match the previous backup are not even read. Derived
+        stores (indexes, change feed, sync state) are rebuilt rather than
+        backed up.
+
+        Args:
+            data_service (DataService): Service for the data directory to back up
+            backup_dir (str): Backup repository directory (created if missing)
+        """
+        self.data_service = data_service
+        self.backup_dir = backup_dir
+        self.chunks_dir = os.path.join(backup_dir, "chunks")
+        self.manifests_dir = os.path.join(backup_dir, "manifests")
+        self.cache_path = os.path.join(backup_dir, "cache.json")
+        os.makedirs(self.chunks_dir, exist_ok = True)
+        os.makedirs(self.manifests_dir, exist_ok = True)
+
+    def _chunk_path(self, digest):
+        """Get the path a chunk is stored at."""
+        return os.path.join(self.chunks_dir, digest[:2], digest)
+
+    def _write_chunk(self, chunk):
+        """
+        Store a chunk unless the repository already has it.
+
+        Returns:
+            tuple: (digest, True if the chunk was new)
+        """
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            return digest, False
+
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(path + ".tmp", 'wb') as f:
+            f.write(zlib.compress(chunk))
+        os.replace(path + ".tmp", path)
+        return digest, True
+
+    def _read_chunk(self, digest):
+        """Read a chunk, checking it against its digest."""
+        with open(self._chunk_path(digest), 'rb') as f:
+            chunk = zlib.decompress(f.read())
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"Backup chunk {digest} is corrupt")
+        return chunk
+
+    def _iter_data_files(self):
+        """
+        Iterate over the files a backup covers.
+
+        Yields:
+            str: Path relative to the data directory
+        """
+        data_dir = self.data_service.data_dir
+        if os.path.exists(os.path.join(data_dir, LAYOUT_FILENAME)):
+            yield LAYOUT_FILENAME
+
+        for file_path in self.data_service.iter_baby_file_paths():
+            yield os.path.relpath(file_path, data_dir)
+
+        archive_root = os.path.join(data_dir, ARCHIVE_DIRNAME)
+        if os.path.isdir(archive_root):
+            for directory, _, filenames in os.walk(archive_root):
+                for filename in filenames:
+                    if not filename.endswith(".tmp"):
+                        yield os.path.relpath(os.path.join(directory, filename), data_dir)
+
+    def backup(self):
+        """
+        Take a backup of the data directory.
+
+        Returns:
+            dict: Contains snapshot (ID), files, changed_files (read this run),
+                new_chunks and new_bytes (compressed size added to the repository)
+        """
+        cache = {}
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+
+        created = datetime.now()
+        snapshot_id = created.strftime(SNAPSHOT_ID_FORMAT)
+        files = {}
+        result = {"snapshot": snapshot_id, "files": 0, "changed_files": 0, "new_chunks": 0, "new_bytes": 0}
+
+        for relative_path in self._iter_data_files():
+            path = os.path.join(self.data_service.data_dir, relative_path)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # Moved or deleted while listing
+
+            cached = cache.get(relative_path)
+            if cached and cached["stamp"] == [stat.st_mtime_ns, stat.st_size]:
+                files[relative_path] = cached
+                result["files"] += 1
+                continue
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            digests = []
+            for chunk in split_chunks(data):
+                digest, new = self._write_chunk(chunk)
+                digests.append(digest)
+                if new:
+                    result["new_chunks"] += 1
+                    result["new_bytes"] += os.path.getsize(self._chunk_path(digest))
+            files[relative_path] = {"stamp": [stat.st_mtime_ns, stat.st_size], "size": len(data), "chunks": digests}
+            result["files"] += 1
+            result["changed_files"] += 1
+
+        # Chunks are all on disk before the manifest that references them
+        manifest_path = os.path.join(self.manifests_dir, f"{snapshot_id}.json")
+        with open(manifest_path + ".tmp", 'w') as f:
+            json.dump({"id": snapshot_id, "created": created.isoformat(), "files": files}, f)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        with open(self.cache_path + ".tmp", 'w') as f:
+            json.dump(files, f)
+        os.replace(self.cache_path + ".tmp", self.cache_path)
+
+        return result
+
+    def list_snapshots(self):
+        """
+        List the backups in the repository.
+
+        Returns:
+            list: Dicts with id, created and files, oldest first
+        """
+        snapshots = []
+        for filename in sorted(os.listdir(self.manifests_dir)):
+            if filename.endswith(".json"):
+                manifest = self._load_manifest(filename[:-5])
+                snapshots.append({"id": manifest["id"], "created": manifest["created"], "files": len(manifest["files"])})
+        return snapshots
+
+    def _load_manifest(self, snapshot_id):
+        """Load a manifest, or None if there is no such snapshot."""
+        path = os.path.join(self.manifests_dir, f"{snapshot_id}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def find_snapshot(self, snapshot_id = None, as_of = None):
+        """
+        Pick the snapshot to restore.
+
+        Args:
+            snapshot_id (str, optional): Exact snapshot ID. Defaults to None.
+            as_of (datetime, optional): Latest snapshot taken at or before this time.
+                Defaults to None (latest snapshot).
+
+        Returns:
+            dict: Manifest, or None if no snapshot matches
+        """
+        if snapshot_id is not None:
+            return self._load_manifest(snapshot_id)
+
+        # Snapshot IDs are creation times, so only the chosen manifest is read
+        snapshot_ids = sorted(filename[:-5] for filename in os.listdir(self.manifests_dir) if filename.endswith(".json"))
+        if as_of is not None:
+            snapshot_ids = [
+                candidate for candidate in snapshot_ids
+                if datetime.strptime(candidate, SNAPSHOT_ID_FORMAT) <= as_of
+            ]
+        if not snapshot_ids:
+            return None
+        return self._load_manifest(snapshot_ids[-1])
+
+    def _restore_file(self, entry, target_path):
+        """Reassemble one file from its chunks."""
+        os.makedirs(os.path.dirname(target_path), exist_ok = True)
+        with open(target_path + ".tmp", 'wb') as f:
+            for digest in entry["chunks"]:
+                f.write(self._read_chunk(digest))
+        os.replace(target_path + ".tmp", target_path)
+
+    def restore_all(self, target_dir, snapshot_id = None, as_of = None):
+        """
+        Restore a whole data directory from a snapshot.
+
+        Args:
+            target_dir (str): Directory to restore into; must be empty or not exist
+            snapshot_id (str, optional): Snapshot to restore. Defaults to None.
+            as_of (datetime, optional): Restore the latest snapshot at or before this time.
+                Defaults to None (latest snapshot).
+
+        Returns:
+            dict: Contains snapshot (ID) and files restored, or None if no snapshot matches
+
+        Raises:
+            ValueError: If target_dir is not empty
+        """
+        if os.path.isdir(target_dir) and os.listdir(target_dir):
+            raise ValueError(f"Restore target is not empty: {target_dir}")
+
+        manifest = self.find_snapshot(snapshot_id, as_of)
+        if manifest is None:
+            return None
+
+        for relative_path, entry in manifest["files"].items():
+            self._restore_file(entry, os.path.join(target_dir, relative_path))
+        return {"snapshot": manifest["id"], "files": len(manifest["files"])}
+
+    def restore_baby(self, baby_id, snapshot_id = None, as_of = None):
+        """
+        Restore one baby in the live data directory from a snapshot.
+
+        Archive segments are replaced with the snapshot's, then the baby is
+        saved through the DataService, so listeners and the change feed see
+        the restore like any other save.
+
+        Args:
+            baby_id (str): UUID of baby
+            snapshot_id (str, optional): Snapshot to restore from. Defaults to None.
+            as_of (datetime, optional): Restore from the latest snapshot at or before this time.
+                Defaults to None (latest snapshot).
+
+        Returns:
+            dict: Contains snapshot (ID) and files restored, or None if no snapshot
+                matches or the baby is not in it
+        """
+        manifest = self.find_snapshot(snapshot_id, as_of)
+        if manifest is None:
+            return None
+
+        filename = f"baby_{baby_id}.json"
+        baby_entry = next(
+            (entry for path, entry in manifest["files"].items() if os.path.basename(path) == filename),
+            None
+        )
+        if baby_entry is None:
+            return None
+
+        data_dir = self.data_service.data_dir
+        archive_prefix = os.path.join(ARCHIVE_DIRNAME, baby_id) + os.sep
+        archive_entries = {
+            path: entry for path, entry in manifest["files"].items() if path.startswith(archive_prefix)
+        }
+        archive_dir = os.path.join(data_dir, ARCHIVE_DIRNAME, baby_id)
+        if os.path.isdir(archive_dir):
+            for filename in os.listdir(archive_dir):
+                if os.path.join(ARCHIVE_DIRNAME, baby_id, filename) not in archive_entries:
+                    os.remove(os.path.join(archive_dir, filename))
+        for relative_path, entry in archive_entries.items():
+            self._restore_file(entry, os.path.join(data_dir, relative_path))
+
+        baby_dict = json.loads(b"".join(self._read_chunk(digest) for digest in baby_entry["chunks"]))
+        # Saved through the DataService so the current layout and schema apply
+        upgrade_document(baby_dict)
+        self.data_service.save_baby(DataService.baby_from_dict(baby_dict))
+
+        return {"snapshot": manifest["id"], "files": 1 + len(archive_entries)}
@@ -0,0 +1,146 @@
+# services/cached_data_service.py
+
+import threading
+from services.data_service import ARCHIVE_AFTER_DAYS, DataService
+
+class CachedDataService(DataService):
+    def __init__(self, data_dir = "data", change_feed = False):
+        """
+        Initialize a DataService that keeps loaded babies in memory.
+
+        Meant for a single long-running process that owns the data
+        directory (see TrackerServer): files and archive segments are read
+        once, then served from memory. Every save still writes through to
+        disk. The stored dictionaries are cached rather than Baby objects,
+        so each load_baby returns a fresh Baby that callers may change
+        without affecting other readers.
+
+        Args:
+            data_dir (str): Directory where data will be stored. Defaults to "data".
+            change_feed (bool, optional): Record record-level change events. Defaults to False.
+        """
+        super().__init__(data_dir, change_feed)
+        self.cache = {}
+        # baby_id -> [(month, archived log dictionaries)] for each archive segment
+        self.archive_cache = {}
+        self._all_ids = None
+        # Serializes filling the caches; writers are expected to run alone (see TrackerServer)
+        self.lock = threading.RLock()
+
+    def save_baby(self, baby):
+        """
+        Save a baby instance; its stored dictionary is read again on the next load
+
+        Args:
+            baby (Baby): Baby instance to save
+
+        Returns:
+            bool: True if successful
+        """
+        result = super().save_baby(baby)
+        self.cache.pop(baby.id, None)
+        if self._all_ids is not None:
+            self._all_ids[baby.id] = None
+        return result
+
+    def load_baby_dict(self, baby_id):
+        """
+        Load a baby's stored dictionary, reading its file only the first time
+
+        The dictionary is shared by every caller and must not be modified.
+
+        Args:
+            baby_id (str): UUID of baby to load
+
+        Returns:
+            dict: Cached dictionary or None if not found
+        """
+        baby_dict = self.cache.get(baby_id)
+        if baby_dict is None:
+            with self.lock:
+                baby_dict = self.cache.get(baby_id)
+                if baby_dict is None:
+                    baby_dict = super().load_baby_dict(baby_id)
+                    if baby_dict is not None:
+                        self.cache[baby_id] = baby_dict
+        return baby_dict
+
+    def iter_archived_log_dicts(self, baby_id, start_date = None, end_date = None):
+        """
+        Iterate over archived log dictionaries, decompressing a baby's segments only the first time
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date, optional): First day (inclusive). Defaults to None.
+            end_date (date, optional): Last day (inclusive). Defaults to None.
+
+        Yields:
+            dict: Stored log dictionary (may fall outside the range within a month)
+        """
+        segments = self.archive_cache.get(baby_id)
+        if segments is None:
+            with self.lock:
+                segments = self.archive_cache.get(baby_id)
+                if segments is None:
+                    segments = [
+                        (month, self._read_archive_segment(path, codec))
+                        for month, path, codec in self._iter_archive_segments(baby_id)
+                    ]
+                    self.archive_cache[baby_id] = segments
+
+        first_month = start_date.strftime("%Y-%m") if start_date else ""
+        last_month = end_date.strftime("%Y-%m") if end_date else "9999-12"
+        for month, log_dicts in segments:
+            if first_month <= month <= last_month:
+                yield from log_dicts
+
+    def archive_daily_logs(self, baby_id, older_than_days = ARCHIVE_AFTER_DAYS, codec = "zlib", today = None):
+        """
+        Archive old daily logs (see DataService.archive_daily_logs) and drop the cached segments
+        """
+        try:
+            return super().archive_daily_logs(baby_id, older_than_days, codec, today)
+        finally:
+            self.archive_cache.pop(baby_id, None)
+
+    def delete_archived_logs(self, baby_id, log_ids):
+        """
+        Remove logs from the archive (see DataService.delete_archived_logs) and drop the cached segments
+        """
+        try:
+            return super().delete_archived_logs(baby_id, log_ids)
+        finally:
+            self.archive_cache.pop(baby_id, None)
+
+    def load_all_babies(self):
+        """
+        Load all babies, listing the data directory only the first time
+
+        Returns:
+            list: List of all Baby instances
+        """
+        if self._all_ids is None:
+            with self.lock:
+                if self._all_ids is None:
+                    babies = super().load_all_babies()
+                    # Dict keeps the directory order and gives O(1) inserts and removals
+                    self._all_ids = dict.fromkeys(baby.id for baby in babies)
+                    return babies
+
+        return [self.load_baby(baby_id) for baby_id in list(self._all_ids)]
+
+    def delete_baby(self, baby_id):
+        """
+        Delete a baby and drop it from the cache
+
+        Args:
+            baby_id (str): UUID of baby to delete
+
+        Returns:
+            bool: True if successful, False if not found
+        """
+        self.cache.pop(baby_id, None)
+        self.archive_cache.pop(baby_id, None)
+        if self._all_ids is not None:
+            self._all_ids.pop(baby_id, None)
+        return super().delete_baby(baby_id)
@@ -0,0 +1,455 @@
+# services/change_feed.py
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: only writers in this process are serialized
+    fcntl = None
+
+# Directory (under the data directory) holding the feed, snapshots and cursors
+FEED_DIRNAME = "changes"
+
+# Record lists in a baby document and the event record type for each
+RECORD_TYPES = {
+    "growth_records": "growth_record",
+    "milestones": "milestone",
+    "daily_logs": "daily_log",
+}
+
+# Baby fields that make up the baby's own record
+BABY_FIELDS = ("id", "name", "birthdate", "gender", "notes")
+
+# Events kept when the feed file is compacted; compaction runs once twice as many have piled up
+FEED_RETAIN_EVENTS = 100000
+
+
+def _hash_record(record_dict):
+    """Content hash of a stored record dictionary."""
+    return hashlib.sha1(json.dumps(record_dict, sort_keys = True, default = str).encode("utf-8")).hexdigest()
+
+
+def _copy_record(record_dict):
+    """Copy of a record dictionary that later changes to the model objects cannot reach."""
+    return {field: copy.deepcopy(value) if isinstance(value, (dict, list)) else value for field, value in record_dict.items()}
+
+
+def _line_start(f, end):
+    """Offset of the start of the line that ends at end (exclusive) in an open binary file."""
+    position = end
+    while position > 0:
+        step = min(4096, position)
+        f.seek(position - step)
+        index = f.read(step).rfind(b"\n")
+        if index != -1:
+            return position - step + index + 1
+        position -= step
+    return 0
+
+
+class ChangeEvent:
+    def __init__(self, seq, action, record_type, baby_id, record_id, data = None, timestamp = None):
+        """
+        Initialize a change event.
+
+        Args:
+            seq (int): Position in the feed; strictly increasing
+            action (str): 'create', 'update' or 'delete'
+            record_type (str): 'baby', 'growth_record', 'milestone' or 'daily_log'
+            baby_id (str): UUID of the baby the record belongs to
+            record_id (str): UUID of the record (the baby's own ID for baby events)
+            data (dict, optional): Stored record dictionary, None for deletes. Defaults to None.
+            timestamp (str, optional): When the change was recorded (ISO format). Defaults to None (now).
+        """
+        self.seq = seq
+        self.action = action
+        self.record_type = record_type
+        self.baby_id = baby_id
+        self.record_id = record_id
+        self.data = data
+        self.timestamp = timestamp or datetime.now().isoformat()
+
+    def to_dict(self):
+        """
+        Convert the event to a dictionary for serialization.
+
+        Returns:
+            dict: Dictionary representation of the event
+        """
+        return {
+            "seq": self.seq,
+            "action": self.action,
+            "record_type": self.record_type,
+            "baby_id": self.baby_id,
+            "record_id": self.record_id,
+            "data": self.data,
+            "timestamp": self.timestamp
+        }
+
+    @classmethod
+    def from_dict(cls, event_dict):
+        """Build an event from its serialized dictionary."""
+        return cls(**event_dict)
+
+
+class FeedCursor:
+    def __init__(self, feed, name = None, seq = 0, offset = 0):
+        """
+        Initialize a resumable position in a change feed.
+
+        Args:
+            feed (ChangeFeed): Feed to read
+            name (str, optional): Cursor name; its position is kept across restarts.
+                Defaults to None (an unnamed cursor, which callers persist themselves).
+            seq (int, optional): Starting sequence number of an unnamed cursor. Defaults to 0.
+            offset (int, optional): Starting byte offset of an unnamed cursor. Defaults to 0.
+        """
+        self.feed = feed
+        self.path = os.path.join(feed.cursors_dir, f"{name}.json") if name else None
+        self.seq = seq
+        self.offset = offset
+        if self.path and os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                position = json.load(f)
+            self.seq, self.offset = position["seq"], position["offset"]
+
+    def poll(self, limit = None):
+        """
+        Read events after the cursor and advance it (in memory; see commit).
+
+        Args:
+            limit (int, optional): Maximum number of events. Defaults to None (all).
+
+        Returns:
+            list: ChangeEvents in sequence order
+        """
+        if not os.path.exists(self.feed.feed_path):
+            return []
+
+        events = []
+        with open(self.feed.feed_path, 'rb') as f:
+            self._locate(f)
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Entry still being written
+                event = ChangeEvent.from_dict(json.loads(line))
+                self.offset += len(line)
+                self.seq = event.seq
+                events.append(event)
+                if limit is not None and len(events) >= limit:
+                    break
+        return events
+
+    def _locate(self, f):
+        """
+        Re-find the cursor's position if the feed was compacted since it was saved.
+
+        The offset is still valid when it starts the line of the next event
+        (or the end of the file). Otherwise the feed is scanned for the first
+        event after the cursor's sequence number; events compacted away
+        before the cursor read them are skipped.
+        """
+        if self.offset == 0:
+            return
+        size = f.seek(0, os.SEEK_END)
+        if self.offset <= size:
+            f.seek(self.offset - 1)
+            if f.read(1) == b"\n":
+                line = f.readline()
+                if not line.endswith(b"\n") or json.loads(line)["seq"] == self.seq + 1:
+                    return
+
+        f.seek(0)
+        self.offset = 0
+        for line in f:
+            if not line.endswith(b"\n") or json.loads(line)["seq"] > self.seq:
+                return
+            self.offset += len(line)
+
+    def commit(self):
+        """Persist the cursor position, so a restart resumes after the last polled event."""
+        if self.path is None:
+            raise ValueError("Only named cursors can be committed")
+        with open(self.path + ".tmp", 'w') as f:
+            json.dump({"seq": self.seq, "offset": self.offset}, f)
+        os.replace(self.path + ".tmp", self.path)
+
+
+class ChangeFeed:
+    def __init__(self, data_service):
+        """
+        Initialize the change feed for a data directory.
+
+        DataService calls record_save and record_delete after each write.
+        The saved document is diffed against a per-baby snapshot of record
+        hashes, and each created, updated or deleted record becomes a
+        ChangeEvent with the next sequence number. Events are appended to
+        a durable feed file (read with named FeedCursors) and then passed to
+        in-process subscribers.
+
+        Delivery is at least once: if a process stops between appending
+        events and updating the snapshot, the next save emits them again.
+
+        Args:
+            data_service (DataService): Service the feed is attached to
+        """
+        self.data_service = data_service
+        self.feed_dir = os.path.join(data_service.data_dir, FEED_DIRNAME)
+        self.feed_path = os.path.join(self.feed_dir, "feed.jsonl")
+        self.snapshots_dir = os.path.join(self.feed_dir, "snapshots")
+        self.cursors_dir = os.path.join(self.feed_dir, "cursors")
+        os.makedirs(self.snapshots_dir, exist_ok = True)
+        os.makedirs(self.cursors_dir, exist_ok = True)
+        self.subscribers = []
+        self.lock = threading.Lock()
+        # Per baby: (snapshot, records) as of this process's last save
+        self.last_saved = {}
+
+    def subscribe(self, callback):
+        """
+        Register a callback for new events.
+
+        Args:
+            callback (callable): Called as callback(event) for each ChangeEvent, in sequence order
+        """
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a callback registered with subscribe."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def cursor(self, name):
+        """
+        Open a named cursor on the durable feed.
+
+        Args:
+            name (str): Cursor name
+
+        Returns:
+            FeedCursor: Cursor positioned after the last event it committed
+        """
+        return FeedCursor(self, name)
+
+    def end_position(self):
+        """
+        Get the position just after the last complete event in the feed file.
+
+        Returns:
+            tuple: (seq, offset) as accepted by FeedCursor; (0, 0) for an empty feed
+        """
+        if not os.path.exists(self.feed_path):
+            return 0, 0
+
+        with open(self.feed_path, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    end = _line_start(f, end)  # Entry still being written
+            if not end:
+                return 0, 0
+            start = _line_start(f, end - 1)
+            f.seek(start)
+            return json.loads(f.read(end - start))["seq"], end
+
+    def _load_snapshot(self, baby_id):
+        """Load a baby's record hashes: {'<record_type>:<id>': hash}, None for archived logs."""
+        path = os.path.join(self.snapshots_dir, f"{baby_id}.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _save_snapshot(self, baby_id, snapshot):
+        """Persist a baby's record hashes (removed when empty)."""
+        path = os.path.join(self.snapshots_dir, f"{baby_id}.json")
+        if not snapshot:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        with open(path + ".tmp", 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(path + ".tmp", path)
+
+    def record_save(self, baby_dict):
+        """
+        Emit events for the records a save created, changed or removed.
+
+        Records equal to the ones this process saved last time are not hashed
+        again, as long as the snapshot on disk is still the one it wrote.
+        Logs the save moves into the archive tier (see DataService.archive_moves)
+        stay in the snapshot with no hash, so the archive itself is never read.
+
+        Args:
+            baby_dict (dict): Baby document as just written
+        """
+        baby_id = baby_dict["id"]
+        records = {("baby", baby_id): {field: baby_dict.get(field) for field in BABY_FIELDS}}
+        for list_name, record_type in RECORD_TYPES.items():
+            for record_dict in baby_dict.get(list_name, []):
+                records[(record_type, record_dict["id"])] = record_dict
+        moves = self.data_service.archive_moves.get(baby_id, {})
+
+        with self.lock:
+            snapshot = self._load_snapshot(baby_id)
+            last_snapshot, last_records = self.last_saved.get(baby_id, (None, {}))
+            if last_snapshot != snapshot:
+                last_records = {}
+            new_snapshot = {}
+            saved_records = {}
+            changes = []
+
+            for (record_type, record_id), record_dict in records.items():
+                key = f"{record_type}:{record_id}"
+                last_record = last_records.get((record_type, record_id))
+                if last_record == record_dict:
+                    new_snapshot[key] = snapshot[key]
+                    saved_records[(record_type, record_id)] = last_record
+                    continue
+                saved_records[(record_type, record_id)] = _copy_record(record_dict)
+                record_hash = _hash_record(record_dict)
+                new_snapshot[key] = record_hash
+                if snapshot.get(key) != record_hash:
+                    action = "update" if key in snapshot else "create"
+                    # Same JSON types subscribers would read back from the feed file
+                    data = json.loads(json.dumps(record_dict, default = str))
+                    changes.append((action, record_type, record_id, data))
+
+            for key in snapshot.keys() - new_snapshot.keys():
+                record_type, record_id = key.split(":", 1)
+                # Logs moved to the archive tier (now or earlier) still exist
+                if record_type == "daily_log" and moves.get(record_id, snapshot[key] is None):
+                    new_snapshot[key] = None
+                    continue
+                changes.append(("delete", record_type, record_id, None))
+
+            events = self._append(baby_id, changes)
+            self._save_snapshot(baby_id, new_snapshot)
+            self.last_saved[baby_id] = (new_snapshot, saved_records)
+
+        self._publish(events)
+
+    def record_delete(self, baby_id):
+        """
+        Emit delete events for a deleted baby and all of its records.
+
+        Args:
+            baby_id (str): UUID of the deleted baby
+        """
+        with self.lock:
+            snapshot = self._load_snapshot(baby_id)
+            keys = sorted(snapshot, key = lambda key: key.startswith("baby:"))
+            changes = [("delete",) + tuple(key.split(":", 1)) + (None,) for key in keys]
+            events = self._append(baby_id, changes)
+            self._save_snapshot(baby_id, {})
+            self.last_saved.pop(baby_id, None)
+
+        self._publish(events)
+
+    def _append(self, baby_id, changes):
+        """
+        Number and append events to the feed file. Caller holds self.lock.
+
+        Args:
+            baby_id (str): UUID of baby
+            changes (list): (action, record_type, record_id, data) tuples
+
+        Returns:
+            list: Appended ChangeEvents
+        """
+        if not changes:
+            return []
+
+        while True:
+            f = open(self.feed_path, 'a+b')
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            # Another process may have compacted (replaced) the file while this one waited
+            if os.fstat(f.fileno()).st_ino == os.stat(self.feed_path).st_ino:
+                break
+            f.close()
+
+        with f:
+            try:
+                seq = self._repair_tail(f)
+                events = []
+                lines = []
+                for action, record_type, record_id, data in changes:
+                    seq += 1
+                    event = ChangeEvent(seq, action, record_type, baby_id, record_id, data)
+                    events.append(event)
+                    lines.append(json.dumps(event.to_dict(), default = str) + "\n")
+                f.write("".join(lines).encode("utf-8"))
+                f.flush()
+
+                f.seek(0)
+                first_line = f.readline()
+                if first_line and seq - json.loads(first_line)["seq"] >= 2 * FEED_RETAIN_EVENTS:
+                    self._compact(f, seq - FEED_RETAIN_EVENTS)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+        return events
+
+    @staticmethod
+    def _repair_tail(f):
+        """
+        Get the sequence number of the last event in an open feed file. Caller holds the lock.
+
+        A process that stopped mid-append leaves an unterminated or
+        unparsable last line; it is truncated away (cursors never read
+        unterminated lines), so the next append starts on a fresh line.
+
+        Returns:
+            int: Last sequence number, 0 for an empty feed
+        """
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        seq = 0
+        while end > 0:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                end = _line_start(f, end)
+                continue
+            start = _line_start(f, end - 1)
+            f.seek(start)
+            try:
+                seq = json.loads(f.read(end - start))["seq"]
+                break
+            except (ValueError, KeyError, TypeError):
+                end = start
+
+        if end < size:
+            f.truncate(end)
+        return seq
+
+    def _compact(self, f, after_seq):
+        """
+        Replace the feed file with only the events after a sequence number. Caller holds the lock.
+
+        Cursors find their place again by sequence number (see FeedCursor._locate).
+
+        Args:
+            f (file): Open, locked feed file
+            after_seq (int): Last sequence number to drop
+        """
+        f.seek(0)
+        with open(self.feed_path + ".tmp", 'wb') as out:
+            for line in f:
+                if json.loads(line)["seq"] > after_seq:
+                    out.write(line)
+        os.replace(self.feed_path + ".tmp", self.feed_path)
+
+    def _publish(self, events):
+        """Pass events to every subscriber."""
+        for event in events:
+            for callback in list(self.subscribers):
+                callback(event)
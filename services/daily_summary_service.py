@@ -0,0 +1,343 @@
+# services/daily_summary_service.py
+
+import threading
+from datetime import datetime, time, timedelta
+
+from services.change_feed import FeedCursor
+from services.data_service import DataService
+
+# Counters kept for every day
+SUMMARY_FIELDS = (
+    "feedings", "feeding_amount", "feeding_minutes",
+    "sleeps", "sleep_minutes",
+    "diapers", "diapers_wet", "diapers_soiled", "diapers_both"
+)
+
+
+def _empty_day():
+    """Create an all-zero day summary."""
+    return dict.fromkeys(SUMMARY_FIELDS, 0)
+
+
+def _log_deltas(log):
+    """
+    Compute the per-day counter changes caused by a single log.
+
+    Sleep minutes are split at midnight so each day gets its own share.
+
+    Args:
+        log (DailyLog): Log to aggregate
+
+    Returns:
+        list: (date, delta dict) tuples
+    """
+    if log.log_type == "feeding":
+        return [(log.date, {
+            "feedings": 1,
+            "feeding_amount": log.amount or 0,
+            "feeding_minutes": log.duration or 0
+        })]
+
+    if log.log_type == "diaper":
+        delta = {"diapers": 1}
+        if f"diapers_{log.diaper_type}" in SUMMARY_FIELDS:
+            delta[f"diapers_{log.diaper_type}"] = 1
+        return [(log.date, delta)]
+
+    if log.log_type == "sleep" and log.end_time:
+        deltas = []
+        start, end = log.start_datetime, log.end_datetime
+        first = True
+        while start < end:
+            day_end = datetime.combine(start.date() + timedelta(days = 1), time.min)
+            segment_end = min(end, day_end)
+            delta = {"sleep_minutes": (segment_end - start).total_seconds() / 60}
+            if first:
+                delta["sleeps"] = 1
+                first = False
+            deltas.append((start.date(), delta))
+            start = segment_end
+        return deltas
+
+    return []
+
+
+def _growth_point(record):
+    """Reduce a growth record to a chart point."""
+    return {
+        "id": record.id,
+        "date": record.date.strftime("%Y-%m-%d"),
+        "weight": record.weight,
+        "height": record.height,
+        "head_circumference": record.head_circumference
+    }
+
+
+class DailySummaryService:
+    def __init__(self, data_service):
+        """
+        Initialize the DailySummaryService.
+
+        Keeps per-day feeding, sleep and diaper counters and growth points
+        for each baby. A baby's history is scanned once, on first request;
+        after that only changes are applied, and subscribers get each
+        change as a delta. Register on_change with
+        DataService.subscribe_changes so every save (imports, syncs and
+        restores included) is applied, or on_baby_changed with add_listener
+        when there is no change feed. on_logs_added and on_growth_changed
+        apply controller writes when neither is registered. Call follow_feed
+        as well to pick up saves made by other processes.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.days = {}
+        self.growth = {}
+        # baby_id -> {log_id: (date, delta) tuples the log contributed}
+        self.log_deltas = {}
+        self.subscribers = []
+        # Unnamed cursor on the durable change feed (see follow_feed)
+        self.cursor = None
+        # Queries may build and catch up from several threads
+        self.lock = threading.RLock()
+
+    def follow_feed(self, change_feed):
+        """
+        Apply, before each query, the events other processes appended to the durable feed.
+
+        Applying an event is idempotent (each log's contribution is
+        replaced, not added), so events also delivered through on_change
+        or already covered by a build do no harm.
+
+        Args:
+            change_feed (ChangeFeed): Feed of the data service
+        """
+        self.cursor = FeedCursor(change_feed, None, *change_feed.end_position())
+
+    def _catch_up(self):
+        """Apply events appended to the durable feed since the last query. Caller holds self.lock."""
+        if self.cursor is None:
+            return
+
+        seq = self.cursor.seq
+        events = self.cursor.poll()
+        if events and events[0].seq != seq + 1:
+            # Compacted past the cursor: events were missed
+            for baby_id in list(self.growth):
+                self._drop(baby_id)
+            return
+        for event in events:
+            self.on_change(event)
+
+    def subscribe(self, callback):
+        """
+        Register a callback for incremental updates.
+
+        Args:
+            callback (callable): Called as callback(baby_id, delta) where delta is
+                {"days": {date: day delta}}, {"growth": [points], "removed": [ids]}
+                or {"reset": True} when the baby's aggregates were dropped
+        """
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a callback registered with subscribe."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def _publish(self, baby_id, delta):
+        """Send a delta to every subscriber."""
+        for callback in list(self.subscribers):
+            callback(baby_id, delta)
+
+    def _ensure_built(self, baby_id):
+        """
+        Catch up with the feed, then aggregate a baby's history the first time it is requested.
+
+        Caller holds self.lock.
+
+        Returns:
+            bool: True if the baby exists
+        """
+        self._catch_up()
+        if baby_id in self.growth:
+            return True
+
+        baby = self.data_service.load_baby(baby_id)
+        if not baby:
+            return False
+
+        self.days[baby_id] = {}
+        self.log_deltas[baby_id] = {}
+        # Include logs moved to the archive tier
+        for log in self.data_service.load_daily_logs(baby_id):
+            self._apply_log(baby_id, log.id, _log_deltas(log))
+
+        self.growth[baby_id] = {record.id: _growth_point(record) for record in baby.growth_records}
+        return True
+
+    def _apply_log(self, baby_id, log_id, deltas, changed = None):
+        """
+        Replace a log's contribution to the day counters.
+
+        Args:
+            baby_id (str): UUID of a built baby
+            log_id (str): ID of the log
+            deltas (list): (date, delta) tuples the log now contributes; empty if deleted
+            changed (dict, optional): Collects the net change per day. Defaults to None.
+        """
+        days = self.days[baby_id]
+        removed = [(day, {field: -value for field, value in delta.items()})
+                   for day, delta in self.log_deltas[baby_id].pop(log_id, ())]
+        if deltas:
+            self.log_deltas[baby_id][log_id] = deltas
+
+        for day, delta in removed + deltas:
+            summary = days.setdefault(day, _empty_day())
+            day_delta = changed.setdefault(day, {}) if changed is not None else None
+            for field, value in delta.items():
+                summary[field] += value
+                if day_delta is not None:
+                    day_delta[field] = day_delta.get(field, 0) + value
+
+    def _publish_days(self, baby_id, changed):
+        """Publish the days whose counters actually changed."""
+        changed = {day: delta for day, delta in changed.items() if any(delta.values())}
+        if changed:
+            self._publish(baby_id, {"days": changed})
+
+    def _drop(self, baby_id):
+        """Forget a baby's aggregates and tell subscribers."""
+        if self.growth.pop(baby_id, None) is not None:
+            self.days.pop(baby_id, None)
+            self.log_deltas.pop(baby_id, None)
+            self._publish(baby_id, {"reset": True})
+
+    def get_day(self, baby_id, day):
+        """
+        Get the summary for one day.
+
+        Args:
+            baby_id (str): UUID of baby
+            day (date): Day to summarize
+
+        Returns:
+            dict: Counters for the day, or None if baby not found
+        """
+        with self.lock:
+            if not self._ensure_built(baby_id):
+                return None
+            return dict(self.days[baby_id].get(day) or _empty_day())
+
+    def get_days(self, baby_id, start_date, end_date):
+        """
+        Get summaries for a range of days.
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            dict: Mapping of date to counters, or None if baby not found
+        """
+        with self.lock:
+            if not self._ensure_built(baby_id):
+                return None
+
+            days = self.days[baby_id]
+            result = {}
+            day = start_date
+            while day <= end_date:
+                result[day] = dict(days.get(day) or _empty_day())
+                day += timedelta(days = 1)
+            return result
+
+    def get_growth(self, baby_id):
+        """
+        Get growth points in date order.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            list: Growth points, or None if baby not found
+        """
+        with self.lock:
+            if not self._ensure_built(baby_id):
+                return None
+            return sorted(self.growth[baby_id].values(), key = lambda point: point["date"])
+
+    def on_logs_added(self, baby_id, logs):
+        """
+        Apply newly saved logs. Register with DailyLogController.add_listener.
+
+        Args:
+            baby_id (str): UUID of baby
+            logs (list): Logs that were just saved
+        """
+        if baby_id not in self.growth:
+            return
+
+        changed = {}
+        for log in logs:
+            self._apply_log(baby_id, log.id, _log_deltas(log), changed)
+        self._publish_days(baby_id, changed)
+
+    def on_growth_changed(self, baby_id, records, removed_ids):
+        """
+        Apply saved or deleted growth records. Register with GrowthController.add_listener.
+
+        Args:
+            baby_id (str): UUID of baby
+            records (list): Records that were added or updated
+            removed_ids (list): IDs of records that were deleted
+        """
+        if baby_id not in self.growth:
+            return
+
+        growth = self.growth[baby_id]
+        points = [_growth_point(record) for record in records]
+        for point in points:
+            growth[point["id"]] = point
+        for record_id in removed_ids:
+            growth.pop(record_id, None)
+
+        self._publish(baby_id, {"growth": points, "removed": list(removed_ids)})
+
+    def on_change(self, event):
+        """
+        Apply a record-level change. Register with DataService.subscribe_changes.
+
+        Args:
+            event (ChangeEvent): Record-level change
+        """
+        baby_id = event.baby_id
+        if event.record_type == "baby" and event.action == "delete":
+            self._drop(baby_id)
+            return
+        if baby_id not in self.growth:
+            return
+
+        if event.record_type == "daily_log":
+            deltas = _log_deltas(DataService.daily_log_from_dict(event.data)) if event.data is not None else []
+            changed = {}
+            self._apply_log(baby_id, event.record_id, deltas, changed)
+            self._publish_days(baby_id, changed)
+        elif event.record_type == "growth_record":
+            if event.data is None:
+                self.on_growth_changed(baby_id, [], [event.record_id])
+            else:
+                self.on_growth_changed(baby_id, [DataService.growth_record_from_dict(event.data)], [])
+
+    def on_baby_changed(self, action, baby_id, baby):
+        """
+        Drop a baby's aggregates on any save or delete. Register with DataService.add_listener.
+
+        Args:
+            action (str): 'save' or 'delete'
+            baby_id (str): UUID of baby
+            baby (Baby): Saved baby, None for deletes
+        """
+        self._drop(baby_id)
@@ -1,7 +1,11 @@
 # services/data_service.py
 
+import filecmp
 import json
+import lzma
 import os
+import shutil
+import zlib
 from models.baby import Baby
 from models.growth_record import GrowthRecord
 from models.milestone import Milestone
@@ -9,23 +13,138 @@ from models.daily_log import DailyLog
 from models.feeding_log import FeedingLog
 from models.sleep_log import SleepLog
 from models.diaper_log import DiaperLog
-from datetime import datetime
+from services.change_feed import ChangeFeed
+from utils.schema import SCHEMA_VERSION, upgrade_document
+from datetime import date, datetime, time, timedelta
+
+def _parse_time(value):
+    """
+    Parse a stored time of day.
+
+    Logs store either a bare time ('14:30:00') or a full datetime.
+    """
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value).time()
+
+# Marker file that switches a data directory to the sharded layout
+LAYOUT_FILENAME = "layout.json"
+
+# Default sharded layout: baby_<id>.json goes in <id[0]>/<id[1]>/ (256 leaf directories)
+SHARD_DEPTH = 2
+SHARD_WIDTH = 1
+
+# Suffix of the older copy set aside when a baby has files in both layouts
+SUPERSEDED_SUFFIX = ".superseded"
+
+# Directory (under the data directory) holding compressed per-baby log archives
+ARCHIVE_DIRNAME = "archive"
+
+# Daily logs older than this many days are moved to the archive by default
+ARCHIVE_AFTER_DAYS = 90
+
+# Archive codecs: name -> (file extension, compress, decompress)
+ARCHIVE_CODECS = {
+    "zlib": (".zlib", zlib.compress, zlib.decompress),
+    "lzma": (".xz", lzma.compress, lzma.decompress),
+}
+
+# Date-order sort keys for stored record dictionaries, by record type
+RECORD_SORT_KEYS = {
+    "daily_logs": lambda d: (d["date"][:10], d["time"].rpartition("T")[2]),
+    "growth_records": lambda d: d["date"],
+    "milestones": lambda d: (d["achieved_date"] is None, d["achieved_date"] or ""),
+}
 
 class DataService:
-    def __init__(self, data_dir = "data"):
+    def __init__(self, data_dir = "data", change_feed = False):
         """
         Initialize the DataService
 
         Args:
             data_dir (str): Directory where data will be stored. Defaults to "data".
+            change_feed (bool, optional): Record a ChangeEvent for every record created,
+                updated or deleted (see subscribe_changes). Defaults to False.
         """
         self.data_dir = data_dir
+        self.listeners = []
+        # Log IDs the save in progress moves into (True) or out of (False) each baby's archive
+        self.archive_moves = {}
+        self._shard_layout = None
         os.makedirs(data_dir, exist_ok = True)
+        self.change_feed = ChangeFeed(self) if change_feed else None
         
-    def _get_baby_file_path(self, baby_id):
-        """Get the file path for a baby's data"""
+    def add_listener(self, listener):
+        """
+        Register a callback to run after a baby is saved or deleted
+
+        Args:
+            listener (callable): Called as listener(action, baby_id, baby) where action
+                is 'save' or 'delete' and baby is None for deletes
+        """
+        self.listeners.append(listener)
+    
+    def subscribe_changes(self, callback):
+        """
+        Register a callback for record-level change events
+
+        Args:
+            callback (callable): Called as callback(event) with each ChangeEvent, in sequence order
+        """
+        if self.change_feed is None:
+            raise ValueError("Change feed is not enabled for this DataService")
+        self.change_feed.subscribe(callback)
+    
+    def _notify_listeners(self, action, baby_id, baby = None):
+        """Run every registered listener for a save or delete."""
+        for listener in self.listeners:
+            listener(action, baby_id, baby)
+        
+    def _get_shard_layout(self):
+        """
+        Get the sharded layout of the data directory
+
+        Checked on every call until the layout marker appears, so a running
+        process switches to the sharded layout as soon as a migration starts.
+
+        Returns:
+            tuple: (depth, width), or None while the directory is flat
+        """
+        if self._shard_layout is None:
+            layout_path = os.path.join(self.data_dir, LAYOUT_FILENAME)
+            if os.path.exists(layout_path):
+                with open(layout_path, 'r') as f:
+                    layout = json.load(f)
+                self._shard_layout = (layout["depth"], layout["width"])
+        return self._shard_layout
+    
+    def _get_flat_file_path(self, baby_id):
+        """Get the file path for a baby's data in the flat layout"""
         return os.path.join(self.data_dir, f"baby_{baby_id}.json")
     
+    def _get_baby_file_path(self, baby_id):
+        """Get the file path a baby's data is written to"""
+        layout = self._get_shard_layout()
+        if layout is None:
+            return self._get_flat_file_path(baby_id)
+        
+        depth, width = layout
+        shard = [baby_id[level * width:(level + 1) * width] for level in range(depth)]
+        return os.path.join(self.data_dir, *shard, f"baby_{baby_id}.json")
+    
+    def _find_baby_file_path(self, baby_id):
+        """Get the path of a baby's existing file, checking the flat layout for files not yet migrated"""
+        file_path = self._get_baby_file_path(baby_id)
+        if os.path.exists(file_path):
+            return file_path
+        
+        flat_path = self._get_flat_file_path(baby_id)
+        if flat_path != file_path and os.path.exists(flat_path):
+            return flat_path
+        
+        return None
+    
     def save_baby(self, baby):
         """
         Save a baby instance to persistent storage
@@ -39,6 +158,7 @@ class DataService:
         
         # Convert to serializable format
         baby_dict = baby.to_dict()
+        baby_dict["schema_version"] = SCHEMA_VERSION
         
         # Add serialized related objects
         baby_dict["growth_records"] = [
@@ -62,9 +182,20 @@ class DataService:
             baby_dict['daily_logs'] = []
                     
         # Save to file
-        with open(self._get_baby_file_path(baby.id), 'w') as f:
+        file_path = self._get_baby_file_path(baby.id)
+        os.makedirs(os.path.dirname(file_path), exist_ok = True)
+        with open(file_path, 'w') as f:
             json.dump(baby_dict, f, indent = 2, default = str)
         
+        # A save during migration moves the baby out of the flat layout
+        flat_path = self._get_flat_file_path(baby.id)
+        if flat_path != file_path and os.path.exists(flat_path):
+            os.remove(flat_path)
+        
+        if self.change_feed is not None:
+            self.change_feed.record_save(baby_dict)
+        self._notify_listeners("save", baby.id, baby)
+        self.archive_moves.pop(baby.id, None)
         return True
     
     def load_baby(self, baby_id):
@@ -77,14 +208,296 @@ class DataService:
         Returns:
             Baby: Loaded baby instance or None if not found
         """
-        file_path = self._get_baby_file_path(baby_id)
+        baby_dict = self.load_baby_dict(baby_id)
         
-        if not os.path.exists(file_path):
+        if baby_dict is None:
             return None
+            
+        return self.baby_from_dict(baby_dict)
+    
+    def load_baby_dict(self, baby_id):
+        """
+        Load a baby's stored dictionary without building model objects
+
+        Args:
+            baby_id (str): UUID of baby to load
+
+        Returns:
+            dict: Dictionary as stored in the baby file (at SCHEMA_VERSION) or None if not found
+        """
+        file_path = self._find_baby_file_path(baby_id)
         
+        if file_path is None:
+            return None
+        
+        return self.read_baby_file(file_path)
+    
+    @staticmethod
+    def read_baby_file(file_path):
+        """
+        Read a baby file, upgrading documents from older schema versions in memory
+
+        Files are upgraded on disk by MigrationService; until then this keeps
+        every reader on the current format.
+
+        Args:
+            file_path (str): Path of a baby_<id>.json file
+
+        Returns:
+            dict: Document at SCHEMA_VERSION
+        """
         with open(file_path, 'r') as f:
             baby_dict = json.load(f)
-            
+        
+        if baby_dict.get("schema_version") != SCHEMA_VERSION:
+            upgrade_document(baby_dict)
+        return baby_dict
+    
+    def get_baby_file_stamp(self, baby_id):
+        """
+        Get a cheap version stamp for a baby's stored file, for derived files to check against
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            tuple: (mtime in nanoseconds, size in bytes), or None if not found
+        """
+        file_path = self._find_baby_file_path(baby_id)
+        if file_path is None:
+            return None
+        
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def load_daily_logs(self, baby_id, start_date = None, end_date = None):
+        """
+        Load a baby's daily logs for a date range, including archived ones
+
+        Archive segments are only decompressed for months the range reaches into.
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date, optional): First day (inclusive). Defaults to None (no lower bound).
+            end_date (date, optional): Last day (inclusive). Defaults to None (no upper bound).
+
+        Returns:
+            list: Logs sorted by date and time, or None if baby not found
+        """
+        baby_dict = self.load_baby_dict(baby_id)
+        if baby_dict is None:
+            return None
+        
+        start = start_date.isoformat() if start_date else ""
+        end = end_date.isoformat() if end_date else "9999-12-31"
+        
+        log_dicts = {}
+        for log_dict in self.iter_archived_log_dicts(baby_id, start_date, end_date):
+            log_dicts[log_dict["id"]] = log_dict
+        for log_dict in baby_dict["daily_logs"]:
+            log_dicts[log_dict["id"]] = log_dict
+        
+        logs = [
+            self.daily_log_from_dict(log_dict)
+            for log_dict in log_dicts.values()
+            if start <= log_dict["date"][:10] <= end
+        ]
+        return sorted(logs, key = lambda log: (log.date, log.time))
+    
+    def _get_archive_dir(self, baby_id):
+        """Get the directory holding a baby's archived logs"""
+        return os.path.join(self.data_dir, ARCHIVE_DIRNAME, baby_id)
+    
+    def _iter_archive_segments(self, baby_id):
+        """
+        Iterate over a baby's archive segments
+
+        Yields:
+            tuple: (month as 'YYYY-MM', segment path, codec name)
+        """
+        archive_dir = self._get_archive_dir(baby_id)
+        if not os.path.isdir(archive_dir):
+            return
+        
+        for filename in sorted(os.listdir(archive_dir)):
+            month, extension = os.path.splitext(filename)
+            for codec, (codec_extension, _, _) in ARCHIVE_CODECS.items():
+                if extension == codec_extension:
+                    yield month, os.path.join(archive_dir, filename), codec
+    
+    @staticmethod
+    def _read_archive_segment(path, codec):
+        """Decompress an archive segment into its list of log dictionaries"""
+        with open(path, 'rb') as f:
+            return json.loads(ARCHIVE_CODECS[codec][2](f.read()))
+    
+    def iter_archived_log_dicts(self, baby_id, start_date = None, end_date = None):
+        """
+        Iterate over archived log dictionaries in months overlapping a date range
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date, optional): First day (inclusive). Defaults to None.
+            end_date (date, optional): Last day (inclusive). Defaults to None.
+
+        Yields:
+            dict: Stored log dictionary (may fall outside the range within a month)
+        """
+        first_month = start_date.strftime("%Y-%m") if start_date else ""
+        last_month = end_date.strftime("%Y-%m") if end_date else "9999-12"
+        
+        for month, path, codec in self._iter_archive_segments(baby_id):
+            if first_month <= month <= last_month:
+                yield from self._read_archive_segment(path, codec)
+    
+    def archive_daily_logs(self, baby_id, older_than_days = ARCHIVE_AFTER_DAYS, codec = "zlib", today = None):
+        """
+        Move old daily logs out of the baby document into compressed monthly segments
+
+        Segments are written before the baby document is saved, and reads
+        prefer the document's copy of a log, so an interrupted run never
+        loses or duplicates a log.
+
+        Args:
+            baby_id (str): UUID of baby
+            older_than_days (int, optional): Archive logs dated before today minus this many days.
+                Defaults to ARCHIVE_AFTER_DAYS.
+            codec (str, optional): 'zlib' or 'lzma'. Defaults to "zlib".
+            today (date, optional): Reference day. Defaults to None (today).
+
+        Returns:
+            int: Number of logs archived, or None if baby not found
+        """
+        if codec not in ARCHIVE_CODECS:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        
+        baby = self.load_baby(baby_id)
+        if not baby:
+            return None
+        
+        cutoff = (today or date.today()) - timedelta(days = older_than_days)
+        by_month = {}
+        hot_logs = []
+        for log in baby.daily_logs:
+            if log.date < cutoff:
+                by_month.setdefault(log.date.strftime("%Y-%m"), []).append(log.to_dict())
+            else:
+                hot_logs.append(log)
+        
+        if not by_month:
+            return 0
+        
+        existing = {month: (path, old_codec) for month, path, old_codec in self._iter_archive_segments(baby_id)}
+        archive_dir = self._get_archive_dir(baby_id)
+        os.makedirs(archive_dir, exist_ok = True)
+        extension, compress, _ = ARCHIVE_CODECS[codec]
+        
+        for month, log_dicts in by_month.items():
+            if month in existing:
+                # Keyed by ID so re-running after an interrupted archive adds no duplicates
+                merged = {d["id"]: d for d in self._read_archive_segment(*existing[month]) + log_dicts}
+                log_dicts = list(merged.values())
+            segment_path = os.path.join(archive_dir, month + extension)
+            payload = compress(json.dumps(log_dicts, default = str).encode("utf-8"))
+            with open(segment_path + ".tmp", 'wb') as f:
+                f.write(payload)
+            os.replace(segment_path + ".tmp", segment_path)
+            if month in existing and existing[month][0] != segment_path:
+                os.remove(existing[month][0])
+        
+        baby.daily_logs = hot_logs
+        self.archive_moves[baby_id] = {d["id"]: True for log_dicts in by_month.values() for d in log_dicts}
+        self.save_baby(baby)
+        return sum(len(log_dicts) for log_dicts in by_month.values())
+
+    def delete_archived_logs(self, baby_id, log_ids):
+        """
+        Remove logs from a baby's archive segments
+
+        Segments that lose a log are rewritten (or removed once empty). The
+        baby document is not saved here; callers save it afterwards so the
+        removal is reported like any other delete (see archive_moves).
+
+        Args:
+            baby_id (str): UUID of baby
+            log_ids (iterable): IDs of logs to remove
+
+        Returns:
+            int: Number of archived logs removed
+        """
+        log_ids = set(log_ids)
+        if not log_ids:
+            return 0
+
+        removed = 0
+        for month, path, codec in list(self._iter_archive_segments(baby_id)):
+            log_dicts = self._read_archive_segment(path, codec)
+            kept = [d for d in log_dicts if d["id"] not in log_ids]
+            if len(kept) == len(log_dicts):
+                continue
+            removed += len(log_dicts) - len(kept)
+            moves = self.archive_moves.setdefault(baby_id, {})
+            moves.update((d["id"], False) for d in log_dicts if d["id"] in log_ids)
+            if not kept:
+                os.remove(path)
+                continue
+            payload = ARCHIVE_CODECS[codec][1](json.dumps(kept, default = str).encode("utf-8"))
+            with open(path + ".tmp", 'wb') as f:
+                f.write(payload)
+            os.replace(path + ".tmp", path)
+        return removed
+
+    def iter_records(self, baby_id, record_type):
+        """
+        Iterate over a baby's records in date order, building each one only when it is reached
+
+        The stored dictionaries are sorted by their ISO date (and time) strings,
+        so no model object is created for records the caller never consumes.
+        Daily logs include archived ones; milestones not yet achieved come last.
+
+        Args:
+            baby_id (str): UUID of baby
+            record_type (str): 'daily_logs', 'growth_records' or 'milestones'
+
+        Yields:
+            DailyLog, GrowthRecord or Milestone: Next record in date order
+        """
+        from_dict = {
+            "daily_logs": self.daily_log_from_dict,
+            "growth_records": self.growth_record_from_dict,
+            "milestones": self.milestone_from_dict
+        }.get(record_type)
+        if from_dict is None:
+            raise ValueError(f"Unknown record type: {record_type}")
+        
+        baby_dict = self.load_baby_dict(baby_id)
+        if baby_dict is None:
+            return
+        
+        record_dicts = baby_dict[record_type]
+        if record_type == "daily_logs":
+            hot_ids = {log_dict["id"] for log_dict in record_dicts}
+            record_dicts = record_dicts + [
+                log_dict for log_dict in self.iter_archived_log_dicts(baby_id)
+                if log_dict["id"] not in hot_ids
+            ]
+        record_dicts = sorted(record_dicts, key = RECORD_SORT_KEYS[record_type])
+        
+        for record_dict in record_dicts:
+            yield from_dict(record_dict)
+    
+    @classmethod
+    def baby_from_dict(cls, baby_dict):
+        """
+        Build a Baby, with all related records, from its serialized dictionary
+
+        Args:
+            baby_dict (dict): Dictionary as stored in a baby file, at SCHEMA_VERSION
+                (see read_baby_file)
+
+        Returns:
+            Baby: Baby instance with its saved ID
+        """
         # Create baby instance
         birthdate = datetime.fromisoformat(baby_dict["birthdate"])
         
@@ -97,90 +510,164 @@ class DataService:
         
         baby.id = baby_dict["id"] # Use saved ID
         
-        # Load growths records
-        if "growth_records" in baby_dict:
-            for record_dict in baby_dict["growth_records"]:
-                date = datetime.fromisoformat(record_dict["date"])
-                record = GrowthRecord(
-                    record_dict["baby_id"],
-                    date,
-                    record_dict["weight"],
-                    record_dict["height"],
-                    record_dict["head_circumference"],
-                    record_dict["notes"]
-                )
-                record.id = record_dict["id"] # Saved ID
-                baby.growth_records.append(record)
-                
-        # Load milestones
-        if "milestones" in baby_dict:
-            for milestone_dict in baby_dict["milestones"]:
-                achieved_date = None
-                if milestone_dict['achieved_date']:
-                    achieved_date = datetime.fromisoformat(milestone_dict["achieved_date"])
-                milestone = Milestone(
-                    milestone_dict['baby_id'],
-                    milestone_dict['name'],
-                    milestone_dict['category'],
-                    achieved_date,
-                    milestone_dict['expected_range'],
-                    milestone_dict['notes']
-                )
-                milestone.id = milestone_dict["id"] # Saved ID
-                baby.milestones.append(milestone)
-                
-        # TODO: Implement loading of daily logs
-        # Load daily logs
-        if "daily_logs" in baby_dict:
-            baby.daily_logs = []
-            
-            for log_dict in baby_dict["daily_logs"]:
-                date = datetime.fromisoformat(log_dict["date"])
-                time = datetime.fromisoformat(log_dict["time"]).time()
-                log_type = log_dict["log_type"]
-                
-                if log_type == "feeding":
-                    log = FeedingLog(
-                        log_dict["baby_id"],
-                        date,
-                        time,
-                        log_dict["feeding_type"],
-                        log_dict["amount"],
-                        log_dict["duration"],
-                        log_dict["notes"]
-                    )
-                elif log_type == "sleep":
-                    end_time = datetime.fromisoformat(log_dict["end_time"]).time() if log_dict["end_time"] else None
-                    log_type = SleepLog(
-                        log_dict["baby_id"],
-                        date,
-                        time,
-                        end_time,
-                        log_dict["quality"],
-                        log_dict["notes"]
-                    )
-                elif log_type == "diaper":
-                    log = DiaperLog(
-                        log_dict["baby_id"],
-                        date,
-                        time,
-                        log_dict["diaper_type"],
-                        log_dict["notes"]
-                    )
-                else:
-                    log = DailyLog(
-                        log_dict["baby_id"],
-                        date,
-                        time,
-                        log_type,
-                        log_dict["notes"]
-                    )
-                
-                log.id = log_dict["id"] # type: ignore # Saved ID
-                baby.daily_logs.append(log) # type: ignore
+        # Load related records (the document is at SCHEMA_VERSION, so every list exists)
+        for record_dict in baby_dict["growth_records"]:
+            baby.growth_records.append(cls.growth_record_from_dict(record_dict))
+        for milestone_dict in baby_dict["milestones"]:
+            baby.milestones.append(cls.milestone_from_dict(milestone_dict))
+        for log_dict in baby_dict["daily_logs"]:
+            baby.daily_logs.append(cls.daily_log_from_dict(log_dict))
                 
         return baby
     
+    @staticmethod
+    def growth_record_from_dict(record_dict):
+        """
+        Build a GrowthRecord from its serialized dictionary
+
+        Args:
+            record_dict (dict): Dictionary produced by GrowthRecord.to_dict
+
+        Returns:
+            GrowthRecord: Growth record instance with its saved ID
+        """
+        date = datetime.fromisoformat(record_dict["date"])
+        record = GrowthRecord(
+            record_dict["baby_id"],
+            date,
+            record_dict["weight"],
+            record_dict["height"],
+            record_dict["head_circumference"],
+            record_dict["notes"]
+        )
+        record.id = record_dict["id"] # Saved ID
+        return record
+    
+    @staticmethod
+    def daily_log_from_dict(log_dict):
+        """
+        Build a DailyLog (or subclass matching its log_type) from its serialized dictionary
+
+        Args:
+            log_dict (dict): Dictionary produced by DailyLog.to_dict
+
+        Returns:
+            DailyLog: Log instance with its saved ID
+        """
+        date = datetime.fromisoformat(log_dict["date"]).date()
+        time = _parse_time(log_dict["time"])
+        log_type = log_dict["log_type"]
+        
+        if log_type == "feeding":
+            log = FeedingLog(
+                log_dict["baby_id"],
+                date,
+                time,
+                log_dict["feeding_type"],
+                log_dict["amount"],
+                log_dict["duration"],
+                log_dict["notes"]
+            )
+        elif log_type == "sleep":
+            end_time = _parse_time(log_dict["end_time"]) if log_dict["end_time"] else None
+            log = SleepLog(
+                log_dict["baby_id"],
+                date,
+                time,
+                end_time,
+                log_dict["quality"],
+                log_dict["notes"]
+            )
+        elif log_type == "diaper":
+            log = DiaperLog(
+                log_dict["baby_id"],
+                date,
+                time,
+                log_dict["diaper_type"],
+                log_dict["notes"]
+            )
+        else:
+            log = DailyLog(
+                log_dict["baby_id"],
+                date,
+                time,
+                log_type,
+                log_dict["notes"]
+            )
+        
+        log.id = log_dict["id"] # Saved ID
+        return log
+    
+    @staticmethod
+    def milestone_from_dict(milestone_dict):
+        """
+        Build a Milestone from its serialized dictionary
+
+        Args:
+            milestone_dict (dict): Dictionary produced by Milestone.to_dict
+
+        Returns:
+            Milestone: Milestone instance with its saved ID
+        """
+        achieved_date = None
+        if milestone_dict['achieved_date']:
+            achieved_date = datetime.fromisoformat(milestone_dict["achieved_date"])
+        milestone = Milestone(
+            milestone_dict['baby_id'],
+            milestone_dict['name'],
+            milestone_dict['category'],
+            achieved_date,
+            milestone_dict['expected_range'],
+            milestone_dict['notes']
+        )
+        milestone.id = milestone_dict["id"] # Saved ID
+        return milestone
+    
+    def iter_shards(self):
+        """
+        Iterate over the directories that hold baby files
+
+        The data directory itself comes first (it holds every file in the flat
+        layout, and files not yet migrated in the sharded one), followed by
+        each leaf shard directory. Shards can be listed independently, e.g.
+        by a pool of workers.
+
+        Yields:
+            str: Directory path
+        """
+        yield self.data_dir
+        
+        layout = self._get_shard_layout()
+        if layout is None:
+            return
+        
+        depth, width = layout
+        level = [self.data_dir]
+        for _ in range(depth):
+            level = [
+                entry.path
+                for parent in level
+                for entry in os.scandir(parent)
+                if entry.is_dir() and len(entry.name) == width
+            ]
+        yield from level
+    
+    def iter_baby_file_paths(self, shard = None):
+        """
+        Iterate over the paths of stored baby files
+
+        Args:
+            shard (str, optional): Directory from iter_shards to list. Defaults to None (all shards).
+
+        Yields:
+            str: Path of a baby_<id>.json file
+        """
+        shards = [shard] if shard is not None else self.iter_shards()
+        for directory in shards:
+            for entry in os.scandir(directory):
+                if entry.name.startswith("baby_") and entry.name.endswith(".json"):
+                    yield entry.path
+    
     def load_all_babies(self):
         """
         Load all babies from persistent storage
@@ -190,15 +677,64 @@ class DataService:
         """
         babies = []
         
-        for filename in os.listdir(self.data_dir):
-            if filename.startswith("baby_") and filename.endswith(".json"):
-                baby_id = filename[5:-5]
-                baby = self.load_baby(baby_id)
-                if baby:
-                    babies.append(baby)
+        for file_path in self.iter_baby_file_paths():
+            baby_id = os.path.basename(file_path)[5:-5]
+            baby = self.load_baby(baby_id)
+            if baby:
+                babies.append(baby)
         
         return babies
     
+    def migrate_to_sharded(self, depth = SHARD_DEPTH, width = SHARD_WIDTH):
+        """
+        Move baby files from the flat layout into shard directories
+
+        The layout marker is written first, so saves made while the migration
+        runs (here or in another process) already go to shard directories,
+        and reads find both moved and not-yet-moved files. Running it again
+        picks up anything left behind.
+
+        If a baby has a file in both layouts with different contents, the
+        newer one (by modification time) ends up in the shard directory and
+        the other is renamed with SUPERSEDED_SUFFIX next to where it was,
+        so nothing is deleted.
+
+        Args:
+            depth (int, optional): Levels of shard directories. Defaults to SHARD_DEPTH.
+            width (int, optional): ID characters per level. Defaults to SHARD_WIDTH.
+                Both are ignored if the directory is already sharded.
+
+        Returns:
+            int: Number of files moved
+        """
+        if self._get_shard_layout() is None:
+            if depth < 1 or width < 1:
+                raise ValueError("Shard depth and width must be at least 1")
+            layout_path = os.path.join(self.data_dir, LAYOUT_FILENAME)
+            with open(layout_path + ".tmp", 'w') as f:
+                json.dump({"depth": depth, "width": width}, f)
+            os.replace(layout_path + ".tmp", layout_path)
+        
+        moved = 0
+        for file_path in list(self.iter_baby_file_paths(self.data_dir)):
+            baby_id = os.path.basename(file_path)[5:-5]
+            target_path = self._get_baby_file_path(baby_id)
+            if os.path.exists(target_path):
+                if filecmp.cmp(file_path, target_path, shallow = False):
+                    os.remove(file_path)
+                    continue
+                # Both copies were written since the migration started (e.g. by a
+                # process that has not seen the layout marker); keep the newer one
+                if os.stat(file_path).st_mtime_ns <= os.stat(target_path).st_mtime_ns:
+                    os.replace(file_path, file_path + SUPERSEDED_SUFFIX)
+                    continue
+                os.replace(target_path, target_path + SUPERSEDED_SUFFIX)
+            os.makedirs(os.path.dirname(target_path), exist_ok = True)
+            os.replace(file_path, target_path)
+            moved += 1
+        
+        return moved
+    
     def delete_baby(self, baby_id):
         """
         Delete a baby from persistent storage
@@ -209,10 +745,14 @@ class DataService:
         Returns:
             bool: True if successful, False if not found
         """
-        file_path = self._get_baby_file_path(baby_id)
+        file_path = self._find_baby_file_path(baby_id)
         
-        if not os.path.exists(file_path):
+        if file_path is None:
             return False
         
         os.remove(file_path)
+        shutil.rmtree(self._get_archive_dir(baby_id), ignore_errors = True)
+        if self.change_feed is not None:
+            self.change_feed.record_delete(baby_id)
+        self._notify_listeners("delete", baby_id)
         return True
\ No newline at end of file
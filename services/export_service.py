@@ -0,0 +1,114 @@
+# services/export_service.py
+
+import csv
+import gzip
+import json
+import os
+
+# Columns written for each record type in CSV exports
+EXPORT_COLUMNS = {
+    "babies": ["id", "name", "birthdate", "gender", "notes"],
+    "growth_records": ["id", "baby_id", "date", "weight", "height", "head_circumference", "notes"],
+    "milestones": ["id", "baby_id", "name", "category", "achieved_date", "min_months", "max_months", "notes"],
+    "daily_logs": [
+        "id", "baby_id", "date", "time", "log_type", "notes",
+        "feeding_type", "amount", "duration",
+        "start_time", "end_time", "quality",
+        "diaper_type"
+    ]
+}
+
+
+class ExportService:
+    def __init__(self, data_service):
+        """
+        Initialize the ExportService.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+
+    def iter_records(self):
+        """
+        Iterate over every stored record, one baby file at a time.
+
+        Records are yielded straight from the stored dictionaries, so only a
+        single baby document is held in memory at once.
+
+        Yields:
+            tuple: (record type, record dictionary) where record type is a key of EXPORT_COLUMNS
+        """
+        for file_path in self.data_service.iter_baby_file_paths():
+            baby_dict = self.data_service.read_baby_file(file_path)
+
+            yield "babies", {key: baby_dict.get(key) for key in EXPORT_COLUMNS["babies"]}
+
+            for record_type in ("growth_records", "milestones", "daily_logs"):
+                for record_dict in baby_dict[record_type]:
+                    yield record_type, record_dict
+
+            hot_ids = {log_dict["id"] for log_dict in baby_dict["daily_logs"]}
+            for log_dict in self.data_service.iter_archived_log_dicts(baby_dict["id"]):
+                if log_dict["id"] not in hot_ids:
+                    yield "daily_logs", log_dict
+
+    def export_all(self, output_dir, file_format = "csv", compress = False):
+        """
+        Export all data to one flat file per record type.
+
+        Args:
+            output_dir (str): Directory to write files into
+            file_format (str, optional): 'csv' or 'jsonl'. Defaults to "csv".
+            compress (bool, optional): Gzip output on the fly. Defaults to False.
+
+        Returns:
+            dict: Mapping of record type to (file path, number of rows written)
+        """
+        if file_format not in ("csv", "jsonl"):
+            raise ValueError(f"Unsupported export format: {file_format}")
+
+        os.makedirs(output_dir, exist_ok = True)
+
+        files = {}
+        writers = {}
+        counts = dict.fromkeys(EXPORT_COLUMNS, 0)
+        paths = {}
+
+        try:
+            for record_type in EXPORT_COLUMNS:
+                path = os.path.join(output_dir, f"{record_type}.{file_format}")
+                if compress:
+                    path += ".gz"
+                    f = gzip.open(path, 'wt', newline = '')
+                else:
+                    f = open(path, 'w', newline = '')
+                files[record_type] = f
+                paths[record_type] = path
+
+                if file_format == "csv":
+                    writer = csv.DictWriter(f, EXPORT_COLUMNS[record_type], restval = '', extrasaction = 'ignore')
+                    writer.writeheader()
+                    writers[record_type] = writer
+
+            for record_type, record_dict in self.iter_records():
+                if file_format == "csv":
+                    writers[record_type].writerow(_flatten(record_type, record_dict))
+                else:
+                    files[record_type].write(json.dumps(record_dict, default = str) + "\n")
+                counts[record_type] += 1
+        finally:
+            for f in files.values():
+                f.close()
+
+        return {record_type: (paths[record_type], counts[record_type]) for record_type in EXPORT_COLUMNS}
+
+
+def _flatten(record_type, record_dict):
+    """Flatten nested fields so a record fits in a single CSV row."""
+    if record_type == "milestones":
+        expected_range = record_dict.get("expected_range") or {}
+        record_dict = dict(record_dict)
+        record_dict["min_months"] = expected_range.get("min_months")
+        record_dict["max_months"] = expected_range.get("max_months")
+    return record_dict
@@ -0,0 +1,189 @@
+# services/feeding_stats_service.py
+
+from collections import deque
+from datetime import datetime, timedelta
+from statistics import median
+
+from services.log_aggregate_service import LogAggregateService
+
+# Number of recent intervals kept for mean/median
+WINDOW_SIZE = 20
+
+# Smoothing factor for exponentially weighted interval averages
+EWMA_ALPHA = 0.3
+
+# Hours per time-of-day bucket (6 buckets of 4 hours)
+BUCKET_HOURS = 4
+
+
+class FeedingStats:
+    def __init__(self, window_size = WINDOW_SIZE, alpha = EWMA_ALPHA):
+        """
+        Initialize rolling feeding interval statistics for one baby.
+
+        Args:
+            window_size (int, optional): Number of recent intervals kept. Defaults to WINDOW_SIZE.
+            alpha (float, optional): EWMA smoothing factor. Defaults to EWMA_ALPHA.
+        """
+        self.alpha = alpha
+        self.last_feed = None
+        self.intervals = deque(maxlen = window_size)
+        self.interval_sum = 0.0
+        self.ewma = None
+        self.ewma_by_bucket = [None] * (24 // BUCKET_HOURS)
+
+    def add_feed(self, fed_at):
+        """
+        Record a feed. Constant time regardless of history length.
+
+        Feeds older than the latest one (e.g. backfilled entries) do not
+        change the interval statistics.
+
+        Args:
+            fed_at (datetime): Time of the feed
+
+        Returns:
+            bool: True if the statistics changed
+        """
+        if self.last_feed is not None and fed_at <= self.last_feed:
+            return False
+
+        if self.last_feed is not None:
+            minutes = (fed_at - self.last_feed).total_seconds() / 60
+
+            if len(self.intervals) == self.intervals.maxlen:
+                self.interval_sum -= self.intervals[0]
+            self.intervals.append(minutes)
+            self.interval_sum += minutes
+
+            self.ewma = self._smooth(self.ewma, minutes)
+            # Intervals are attributed to the time of day they started at
+            bucket = self.last_feed.hour // BUCKET_HOURS
+            self.ewma_by_bucket[bucket] = self._smooth(self.ewma_by_bucket[bucket], minutes)
+
+        self.last_feed = fed_at
+        return True
+
+    def _smooth(self, average, value):
+        """Update an exponentially weighted average with a new value."""
+        if average is None:
+            return value
+        return self.alpha * value + (1 - self.alpha) * average
+
+    @property
+    def mean_interval(self):
+        """Mean of recent intervals in minutes, None if fewer than two feeds."""
+        if not self.intervals:
+            return None
+        return self.interval_sum / len(self.intervals)
+
+    @property
+    def median_interval(self):
+        """Median of recent intervals in minutes, None if fewer than two feeds."""
+        if not self.intervals:
+            return None
+        return median(self.intervals)
+
+    def predict_next_feed(self):
+        """
+        Predict when the next feed is due.
+
+        Uses the EWMA interval for the time of day of the last feed, falling
+        back to the overall EWMA.
+
+        Returns:
+            datetime: Predicted time of next feed, None if fewer than two feeds
+        """
+        if self.last_feed is None:
+            return None
+
+        interval = self.ewma_by_bucket[self.last_feed.hour // BUCKET_HOURS]
+        if interval is None:
+            interval = self.ewma
+        if interval is None:
+            return None
+
+        return self.last_feed + timedelta(minutes = interval)
+
+    def to_dict(self):
+        """
+        Convert statistics to a dictionary.
+
+        Returns:
+            dict: Last feed, predicted next feed and interval statistics in minutes
+        """
+        return {
+            "last_feed": self.last_feed,
+            "next_feed": self.predict_next_feed(),
+            "mean_interval": self.mean_interval,
+            "median_interval": self.median_interval,
+            "ewma_interval": self.ewma,
+            "ewma_by_time_of_day": {
+                f"{bucket * BUCKET_HOURS:02d}:00": average
+                for bucket, average in enumerate(self.ewma_by_bucket)
+            }
+        }
+
+
+class FeedingStatsService(LogAggregateService):
+    log_type = "feeding"
+
+    def __init__(self, data_service):
+        """
+        Initialize the FeedingStatsService.
+
+        Keeps rolling FeedingStats per baby (see LogAggregateService).
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        super().__init__(data_service)
+
+    def _new_aggregate(self):
+        """Create empty feeding statistics."""
+        return FeedingStats()
+
+    def _add_log(self, stats, log):
+        """Count a feed in statistics."""
+        return stats.add_feed(datetime.combine(log.date, log.time))
+
+    def get_stats(self, baby_id):
+        """
+        Get feeding statistics for a baby.
+
+        The history (archived logs included) is scanned once, the first
+        time a baby is requested; afterwards only changes are applied.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            FeedingStats: Statistics or None if baby not found
+        """
+        return self.get_aggregate(baby_id)
+
+    def get_last_feed(self, baby_id):
+        """
+        Get the time of a baby's last feed.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            datetime: Time of last feed, None if no feeds or baby not found
+        """
+        stats = self.get_stats(baby_id)
+        return stats.last_feed if stats else None
+
+    def predict_next_feed(self, baby_id):
+        """
+        Predict when a baby's next feed is due.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            datetime: Predicted time, None if not enough feeds or baby not found
+        """
+        stats = self.get_stats(baby_id)
+        return stats.predict_next_feed() if stats else None
@@ -0,0 +1,258 @@
+# services/heatmap_service.py
+
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+
+# Default window length when no start date is given
+DEFAULT_WEEKS = 4
+
+# Cells in a weekday x hour matrix, stored flat as weekday * 24 + hour
+CELLS = 7 * 24
+
+# Matrices in a heatmap: (log type, measure)
+MEASURES = (
+    ("feeding", "counts"),
+    ("feeding", "amounts"),
+    ("sleep", "counts"),
+    ("sleep", "minutes"),
+    ("diaper", "counts"),
+)
+
+
+def _empty_partial():
+    """Flat, zeroed matrices for every measure."""
+    return {measure: [0] * CELLS for measure in MEASURES}
+
+
+def _merge(total, partial):
+    """Add one partial's matrices into another."""
+    for measure, cells in partial.items():
+        target = total[measure]
+        for cell, value in enumerate(cells):
+            if value:
+                target[cell] += value
+
+
+def _monday(day):
+    """Get the Monday starting a day's week."""
+    return day - timedelta(days = day.weekday())
+
+
+class HeatmapService:
+    def __init__(self, data_service):
+        """
+        Initialize the HeatmapService.
+
+        Bins feedings, sleeps and diapers into weekday x hour matrices.
+        Feedings and diapers count at their logged time (feedings also sum
+        their amounts); sleeps count at their start and add minutes asleep
+        to every hour they span, across midnight and week boundaries.
+
+        The window is split into Monday-to-Sunday weeks. Weeks that ended
+        before the current one are closed and their matrices are cached,
+        so a long window only reads the logs of the open week, the partial
+        weeks at its edges and closed weeks changed since they were cached.
+        Register on_change with DataService.subscribe_changes (or
+        on_baby_changed with add_listener when there is no change feed) to
+        invalidate cached weeks.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.lock = threading.Lock()
+        # baby_id -> {"weeks": {monday: partial}, "log_weeks": {log_id: set of mondays},
+        #             "generation": changes seen, so stale computations are not cached}
+        self.cache = {}
+
+    def _segments(self, start_date, end_date, today):
+        """
+        Split a window into week-aligned segments.
+
+        Returns:
+            list: (first day, day after last, closed full week) tuples in order
+        """
+        open_week = _monday(today)
+        segments = []
+        day = start_date
+        while day <= end_date:
+            next_monday = _monday(day) + timedelta(days = 7)
+            segment_end = min(next_monday, end_date + timedelta(days = 1))
+            closed = day.weekday() == 0 and segment_end == next_monday and next_monday <= open_week
+            segments.append((day, segment_end, closed))
+            day = segment_end
+        return segments
+
+    def heatmap(self, baby_id, start_date = None, end_date = None, today = None):
+        """
+        Get weekday x hour matrices for a window.
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date, optional): First day (inclusive). Defaults to None
+                (DEFAULT_WEEKS weeks before end_date).
+            end_date (date, optional): Last day (inclusive). Defaults to None (today).
+            today (date, optional): Reference day that decides which weeks are closed.
+                Defaults to None (today).
+
+        Returns:
+            dict: start_date, end_date, and for feeding (counts, amounts), sleep
+                (counts, minutes) and diaper (counts) a 7 x 24 matrix indexed
+                [weekday][hour] with Monday as weekday 0; None if baby not found
+        """
+        today = today or date.today()
+        end_date = end_date or today
+        start_date = start_date or end_date - timedelta(weeks = DEFAULT_WEEKS) + timedelta(days = 1)
+        if start_date > end_date:
+            raise ValueError("start_date must not be after end_date")
+
+        segments = self._segments(start_date, end_date, today)
+        total = _empty_partial()
+
+        with self.lock:
+            baby_cache = self.cache.setdefault(baby_id, {"weeks": {}, "log_weeks": {}, "generation": 0})
+            generation = baby_cache["generation"]
+            runs = []
+            previous_end = None
+            for segment in segments:
+                cached = baby_cache["weeks"].get(segment[0]) if segment[2] else None
+                if cached is not None:
+                    _merge(total, cached)
+                elif runs and previous_end == segment[0]:
+                    runs[-1].append(segment)
+                else:
+                    runs.append([segment])
+                previous_end = None if cached is not None else segment[1]
+
+        # Logs are read only for contiguous runs of segments not in the cache
+        for run in runs:
+            partials = self._compute(baby_id, run)
+            if partials is None:
+                with self.lock:
+                    self.cache.pop(baby_id, None)
+                return None
+
+            with self.lock:
+                baby_cache = self.cache.get(baby_id)
+                # A change since the logs were read may not be reflected in them
+                cacheable = baby_cache is not None and baby_cache["generation"] == generation
+                for segment, (partial, log_ids) in zip(run, partials):
+                    _merge(total, partial)
+                    if cacheable and segment[2]:
+                        baby_cache["weeks"][segment[0]] = partial
+                        for log_id in log_ids:
+                            baby_cache["log_weeks"].setdefault(log_id, set()).add(segment[0])
+
+        result = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+        for (log_type, measure), cells in total.items():
+            result.setdefault(log_type, {})[measure] = [cells[weekday * 24:(weekday + 1) * 24] for weekday in range(7)]
+        return result
+
+    def _compute(self, baby_id, segments):
+        """
+        Bin logs into per-segment matrices in one pass over the logs.
+
+        Args:
+            baby_id (str): UUID of baby
+            segments (list): Contiguous segments from _segments, in order
+
+        Returns:
+            list: (partial, IDs of logs that contributed) per segment, or None if baby not found
+        """
+        # A sleep logged the day before the first segment can run into it
+        logs = self.data_service.load_daily_logs(
+            baby_id, segments[0][0] - timedelta(days = 1), segments[-1][1] - timedelta(days = 1)
+        )
+        if logs is None:
+            return None
+
+        bounds = [datetime.combine(segment[0], datetime.min.time()) for segment in segments]
+        ends = [datetime.combine(segment[1], datetime.min.time()) for segment in segments]
+        results = [(_empty_partial(), set()) for _ in segments]
+
+        def locate(moment):
+            """Index of the segment containing a moment, or None."""
+            position = bisect_right(bounds, moment) - 1
+            if position < 0 or moment >= ends[position]:
+                return None
+            return position
+
+        for log in logs:
+            if log.log_type == "sleep":
+                start = log.start_datetime
+                position = locate(start)
+                if position is not None:
+                    partial, log_ids = results[position]
+                    partial["sleep", "counts"][start.weekday() * 24 + start.hour] += 1
+                    log_ids.add(log.id)
+
+                end = log.end_datetime
+                moment = start
+                while end is not None and moment < end:
+                    bin_end = min(moment.replace(minute = 0, second = 0, microsecond = 0) + timedelta(hours = 1), end)
+                    position = locate(moment)
+                    if position is not None:
+                        partial, log_ids = results[position]
+                        partial["sleep", "minutes"][moment.weekday() * 24 + moment.hour] += (bin_end - moment).total_seconds() / 60
+                        log_ids.add(log.id)
+                    moment = bin_end
+                continue
+
+            if log.log_type not in ("feeding", "diaper"):
+                continue
+            moment = datetime.combine(log.date, log.time)
+            position = locate(moment)
+            if position is None:
+                continue
+            partial, log_ids = results[position]
+            cell = moment.weekday() * 24 + moment.hour
+            partial[log.log_type, "counts"][cell] += 1
+            if log.log_type == "feeding" and log.amount:
+                partial["feeding", "amounts"][cell] += log.amount
+            log_ids.add(log.id)
+
+        return results
+
+    def _invalidate(self, baby_id, mondays):
+        """Drop cached weeks. Caller holds self.lock."""
+        baby_cache = self.cache.get(baby_id)
+        if baby_cache is None:
+            return
+        baby_cache["generation"] += 1
+        for monday in mondays:
+            baby_cache["weeks"].pop(monday, None)
+
+    def on_change(self, event):
+        """
+        Invalidate the weeks a change touches. Register with DataService.subscribe_changes.
+
+        Args:
+            event (ChangeEvent): Record-level change
+        """
+        with self.lock:
+            if event.record_type == "baby" and event.action == "delete":
+                self.cache.pop(event.baby_id, None)
+                return
+            if event.record_type != "daily_log" or event.baby_id not in self.cache:
+                return
+
+            log_weeks = self.cache[event.baby_id]["log_weeks"]
+            mondays = set(log_weeks.pop(event.record_id, ()))
+            if event.data is not None:
+                day = date.fromisoformat(event.data["date"][:10])
+                # The log's new day, and the next one for sleeps running past midnight
+                mondays.update({_monday(day), _monday(day + timedelta(days = 1))})
+            self._invalidate(event.baby_id, mondays)
+
+    def on_baby_changed(self, action, baby_id, baby):
+        """
+        Drop a baby's cached weeks on any save or delete. Register with DataService.add_listener.
+
+        Args:
+            action (str): 'save' or 'delete'
+            baby_id (str): UUID of baby
+            baby (Baby): Saved baby, None for deletes
+        """
+        with self.lock:
+            self.cache.pop(baby_id, None)
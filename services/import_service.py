@@ -0,0 +1,196 @@
+# services/import_service.py
+
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+
+from models.growth_record import GrowthRecord
+from models.feeding_log import FeedingLog
+from models.sleep_log import SleepLog
+from models.diaper_log import DiaperLog
+from utils.date_utils import parse_date_time
+
+# Supported values of the 'record_type' column
+RECORD_TYPES = ("feeding", "sleep", "diaper", "growth")
+
+
+class ImportService:
+    def __init__(self, data_service):
+        """
+        Initialize the ImportService.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+
+    def import_file(self, file_path, file_format = None, batch_size = 500):
+        """
+        Import daily logs and growth records from a CSV or JSONL file.
+
+        Every row needs 'record_type' (feeding, sleep, diaper or growth) and
+        'baby_id' plus the fields of the matching add_* controller method,
+        e.g. 'date', 'time', 'feeding_type', 'amount'. Dates and times use
+        the same formats as DailyLogController (YYYY-MM-DD and HH:MM).
+
+        Args:
+            file_path (str): Path of the file to import
+            file_format (str, optional): 'csv' or 'jsonl'. Defaults to None
+                (guess from the file extension).
+            batch_size (int, optional): Rows parsed per batch. Defaults to 500.
+
+        Returns:
+            dict: Summary with 'imported' count, 'babies' count and 'errors'
+                as a list of (row number, message) tuples
+        """
+        if file_format is None:
+            file_format = "jsonl" if file_path.endswith((".jsonl", ".ndjson")) else "csv"
+
+        with open(file_path, 'r', newline = '') as f:
+            if file_format == "csv":
+                rows = csv.DictReader(f)
+            elif file_format == "jsonl":
+                # Lines are decoded by parse_row, so a bad line is reported as that row's error
+                rows = (line for line in f if line.strip())
+            else:
+                raise ValueError(f"Unsupported import format: {file_format}")
+
+            return self.import_rows(rows, batch_size)
+
+    def import_rows(self, rows, batch_size = 500):
+        """
+        Import an iterable of row dictionaries.
+
+        Rows are validated and parsed in batches and grouped by baby, then
+        each baby is loaded and saved exactly once.
+
+        Args:
+            rows (iterable): Row dictionaries (see import_file)
+            batch_size (int, optional): Rows parsed per batch. Defaults to 500.
+
+        Returns:
+            dict: Summary with 'imported' count, 'babies' count and 'errors'
+                as a list of (row number, message) tuples
+        """
+        records_by_baby = {}
+        errors = []
+        row_number = 0
+        rows = iter(rows)
+
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+
+            for row in batch:
+                row_number += 1
+                try:
+                    record = self.parse_row(row)
+                except (ValueError, TypeError) as e:
+                    errors.append((row_number, str(e)))
+                    continue
+                records_by_baby.setdefault(record.baby_id, []).append((row_number, record))
+
+        imported = 0
+        babies = 0
+        for baby_id, records in records_by_baby.items():
+            baby = self.data_service.load_baby(baby_id)
+            if not baby:
+                errors.extend((number, f"Baby not found: {baby_id}") for number, _ in records)
+                continue
+
+            for _, record in records:
+                if isinstance(record, GrowthRecord):
+                    baby.add_growth_record(record)
+                else:
+                    baby.add_daily_log(record)
+
+            self.data_service.save_baby(baby)
+            imported += len(records)
+            babies += 1
+
+        return {
+            "imported": imported,
+            "babies": babies,
+            "errors": sorted(errors)
+        }
+
+    def parse_row(self, row):
+        """
+        Validate a single row and build the record it describes.
+
+        Args:
+            row (dict or str): Row dictionary, or a JSON object as a line of text
+
+        Returns:
+            GrowthRecord or DailyLog: Parsed record
+
+        Raises:
+            ValueError: If the row is not an object, is missing required fields or has an unknown type
+        """
+        if isinstance(row, str):
+            row = json.loads(row)
+        if not isinstance(row, dict):
+            raise ValueError(f"Row must be an object, not {type(row).__name__}")
+
+        # CSV rows give '' for empty cells
+        row = {key: (None if value == "" else value) for key, value in row.items()}
+
+        record_type = row.get("record_type")
+        if record_type not in RECORD_TYPES:
+            raise ValueError(f"Unknown record_type: {record_type}")
+
+        baby_id = _required(row, "baby_id")
+        notes = row.get("notes")
+
+        if record_type == "growth":
+            date = _required(row, "date")
+            if isinstance(date, str):
+                date = datetime.strptime(date, "%Y-%m-%d")
+            return GrowthRecord(
+                baby_id,
+                date,
+                _optional_number(row, "weight", float),
+                _optional_number(row, "height", float),
+                _optional_number(row, "head_circumference", float),
+                notes
+            )
+
+        if record_type == "sleep":
+            date, start_time = parse_date_time(_required(row, "date"), _required(row, "start_time"))
+            end_time = row.get("end_time")
+            if end_time:
+                _, end_time = parse_date_time(date, end_time)
+            return SleepLog(baby_id, date, start_time, end_time, row.get("quality"), notes)
+
+        date, time = parse_date_time(_required(row, "date"), _required(row, "time"))
+
+        if record_type == "feeding":
+            return FeedingLog(
+                baby_id,
+                date,
+                time,
+                _required(row, "feeding_type"),
+                _optional_number(row, "amount", float),
+                _optional_number(row, "duration", int),
+                notes
+            )
+
+        return DiaperLog(baby_id, date, time, _required(row, "diaper_type"), notes)
+
+
+def _required(row, field):
+    """Get a required field from a row."""
+    value = row.get(field)
+    if value is None:
+        raise ValueError(f"Missing required field: {field}")
+    return value
+
+
+def _optional_number(row, field, number_type):
+    """Get an optional numeric field from a row."""
+    value = row.get(field)
+    if value is None:
+        return None
+    return number_type(value)
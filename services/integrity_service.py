@@ -0,0 +1,317 @@
+# services/integrity_service.py
+
+import json
+import os
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+from services.data_service import DataService, _parse_time
+from utils.schema import upgrade_document
+
+# Directory (under the data directory) that bad files and dropped records are moved to
+QUARANTINE_DIRNAME = "quarantine"
+
+# Baby fields and the value a repair fills in when one is missing
+BABY_DEFAULTS = {"gender": None, "notes": None}
+
+# Fields every record of a type must have, and the value a repair fills in
+RECORD_DEFAULTS = {
+    "growth_records": {"weight": None, "height": None, "head_circumference": None, "notes": None},
+    "milestones": {"achieved_date": None, "expected_range": None, "notes": None},
+    "daily_logs": {"notes": None},
+}
+
+# Fields that cannot be filled in; a record missing one is dropped on repair
+RECORD_REQUIRED = {
+    "growth_records": ("id", "date"),
+    "milestones": ("id", "name", "category"),
+    "daily_logs": ("id", "date", "time", "log_type"),
+}
+
+# Type-specific daily log fields and their repair values
+LOG_TYPE_DEFAULTS = {
+    "feeding": {"feeding_type": None, "amount": None, "duration": None},
+    "sleep": {"end_time": None, "quality": None},
+    "diaper": {"diaper_type": None},
+}
+
+
+def _check_record(record_type, record_dict, baby_id):
+    """
+    Validate one record.
+
+    Args:
+        record_type (str): Key of RECORD_DEFAULTS
+        record_dict (object): Record as stored
+        baby_id (str): ID of the parent baby
+
+    Returns:
+        tuple: (list of (kind, message) problems, repaired record or None if it must be dropped)
+    """
+    if not isinstance(record_dict, dict):
+        return [("bad_record", f"{record_type}: record is not an object")], None
+
+    problems = []
+    missing = [field for field in RECORD_REQUIRED[record_type] if record_dict.get(field) is None]
+    if missing:
+        return [("missing_field", f"{record_type} {record_dict.get('id')}: missing {', '.join(missing)}")], None
+
+    record_id = record_dict["id"]
+    repaired = dict(record_dict)
+
+    if record_type == "daily_logs":
+        if record_dict["log_type"] not in LOG_TYPE_DEFAULTS:
+            return [("unknown_log_type", f"daily_logs {record_id}: unknown log_type {record_dict['log_type']!r}")], None
+        defaults = dict(RECORD_DEFAULTS[record_type], **LOG_TYPE_DEFAULTS[record_dict["log_type"]])
+    else:
+        defaults = RECORD_DEFAULTS[record_type]
+
+    for field, value in defaults.items():
+        if field not in repaired:
+            problems.append(("missing_field", f"{record_type} {record_id}: missing {field}"))
+            repaired[field] = value
+
+    if repaired.get("baby_id") != baby_id:
+        problems.append(("baby_id_mismatch", f"{record_type} {record_id}: baby_id {repaired.get('baby_id')!r} does not match parent"))
+        repaired["baby_id"] = baby_id
+
+    try:
+        for field in ("date", "achieved_date"):
+            if repaired.get(field):
+                datetime.fromisoformat(repaired[field])
+        for field in ("time", "end_time"):
+            if repaired.get(field):
+                _parse_time(repaired[field])
+    except (TypeError, ValueError) as e:
+        return problems + [("bad_value", f"{record_type} {record_id}: {e}")], None
+
+    return problems, repaired
+
+
+def check_baby_document(baby_dict, baby_id):
+    """
+    Validate a baby document against the schema and its cross-references.
+
+    Args:
+        baby_dict (object): Parsed baby file
+        baby_id (str): ID taken from the file name
+
+    Returns:
+        tuple: (list of (kind, message) problems, repaired document or None if not repairable,
+            list of records a repair drops)
+    """
+    if not isinstance(baby_dict, dict):
+        return [("bad_document", "document is not an object")], None, []
+
+    problems = []
+    if baby_dict.get("id") != baby_id:
+        problems.append(("id_mismatch", f"document id {baby_dict.get('id')!r} does not match file name"))
+        return problems, None, []
+
+    for field in ("name", "birthdate"):
+        if baby_dict.get(field) is None:
+            problems.append(("missing_field", f"baby: missing {field}"))
+            return problems, None, []
+
+    if not isinstance(baby_dict["birthdate"], str):
+        return problems + [("bad_value", f"baby: birthdate {baby_dict['birthdate']!r} is not a string")], None, []
+    try:
+        datetime.fromisoformat(baby_dict["birthdate"])
+    except ValueError as e:
+        return problems + [("bad_value", f"baby: {e}")], None, []
+
+    repaired = dict(baby_dict)
+    for field, value in BABY_DEFAULTS.items():
+        if field not in repaired:
+            problems.append(("missing_field", f"baby: missing {field}"))
+            repaired[field] = value
+
+    dropped = []
+    for record_type in RECORD_DEFAULTS:
+        records = repaired.get(record_type, [])
+        if not isinstance(records, list):
+            problems.append(("bad_record", f"{record_type}: not a list"))
+            dropped.append({"record_type": record_type, "record": records})
+            records = []
+
+        seen = {}
+        kept = []
+        for record_dict in records:
+            record_problems, record = _check_record(record_type, record_dict, baby_id)
+            problems.extend(record_problems)
+            if record is None:
+                dropped.append({"record_type": record_type, "record": record_dict})
+                continue
+
+            previous = seen.get(record["id"])
+            if previous is not None:
+                problems.append(("duplicate_id", f"{record_type} {record['id']}: duplicate id"))
+                if previous == record:
+                    continue
+                # Same ID, different content: keep both under distinct IDs
+                record["id"] = str(uuid.uuid4())
+            seen[record["id"]] = record
+            kept.append(record)
+
+        repaired[record_type] = kept
+
+    return problems, repaired, dropped
+
+
+def _check_baby_file(file_path, repair = False, quarantine = False):
+    """
+    Check one baby file and decide what to do with it.
+
+    Module-level so it can be sent to worker processes. Workers only read
+    and validate; IntegrityService applies the decided action through the
+    DataService in the parent process.
+
+    Args:
+        file_path (str): Path of a baby_<id>.json file
+        repair (bool, optional): Plan repairs for repairable files. Defaults to False.
+        quarantine (bool, optional): Plan to quarantine files that are not repaired. Defaults to False.
+
+    Returns:
+        dict: path, baby_id, problems (list of [kind, message]) and action
+            ('ok', 'reported', 'repaired' or 'quarantined'); repaired files also
+            carry the repaired 'document' and the 'dropped' records
+    """
+    baby_id = os.path.basename(file_path)[5:-5]
+    result = {"path": file_path, "baby_id": baby_id, "problems": [], "action": "ok"}
+
+    try:
+        with open(file_path, 'r') as f:
+            baby_dict = json.load(f)
+    except (OSError, ValueError) as e:
+        problems, repaired, dropped = [("unreadable", str(e))], None, []
+    else:
+        if isinstance(baby_dict, dict):
+            try:
+                # Older schema versions are not problems; check what a load would see
+                upgrade_document(baby_dict)
+            except ValueError as e:
+                # Written by newer code: leave it alone
+                result["problems"] = [["newer_schema", str(e)]]
+                result["action"] = "reported"
+                return result
+            except (AttributeError, KeyError, TypeError):
+                pass  # Malformed; the checks below report why
+        problems, repaired, dropped = check_baby_document(baby_dict, baby_id)
+        if repaired is not None:
+            try:
+                # Final guard: the document (repaired or not) must load as model objects
+                DataService.baby_from_dict(repaired)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                problems, repaired = problems + [("unloadable", str(e))], None
+
+    result["problems"] = [list(problem) for problem in problems]
+    if not problems:
+        return result
+
+    result["action"] = "reported"
+    if repair and repaired is not None:
+        result["action"] = "repaired"
+        result["document"] = repaired
+        result["dropped"] = dropped
+    elif quarantine:
+        result["action"] = "quarantined"
+
+    return result
+
+
+class IntegrityService:
+    def __init__(self, data_service):
+        """
+        Initialize the IntegrityService.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.quarantine_dir = os.path.join(data_service.data_dir, QUARANTINE_DIRNAME)
+
+    def check_all(self, repair = False, quarantine = False, workers = None):
+        """
+        Check every baby file in the data directory.
+
+        Each file is validated for schema (required fields, parseable dates,
+        known log types) and cross-references (file name matches the baby
+        id, child baby_id matches the parent, unique record ids).
+
+        With repair, missing optional fields are filled in, child baby_ids
+        are corrected and duplicates removed or given new ids; records that
+        cannot be fixed are dropped and saved as baby_<id>.dropped.json in
+        the quarantine directory. With quarantine, files that are not
+        repaired are copied to the quarantine directory and the baby is
+        deleted. Both go through the DataService, so listeners and the
+        change feed see them.
+
+        Args:
+            repair (bool, optional): Rewrite repairable files. Defaults to False.
+            quarantine (bool, optional): Move unrepaired bad files to the quarantine directory.
+                Defaults to False.
+            workers (int, optional): Number of worker processes. Defaults to None
+                (check in the current process).
+
+        Returns:
+            dict: Report with keys:
+                files (int): Number of files checked
+                ok (int): Files without problems
+                actions (dict): Count of files per action
+                problems (dict): Count of problems per kind
+                files_with_problems (list): Per-file results for files with problems
+        """
+        if repair or quarantine:
+            os.makedirs(self.quarantine_dir, exist_ok = True)
+
+        check = partial(_check_baby_file, repair = repair, quarantine = quarantine)
+        # Materialize the listing first so moving files cannot disturb it
+        file_paths = list(self.data_service.iter_baby_file_paths())
+
+        report = {"files": 0, "ok": 0, "actions": {}, "problems": {}, "files_with_problems": []}
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                results = list(executor.map(check, file_paths, chunksize = 64))
+        else:
+            results = [check(file_path) for file_path in file_paths]
+
+        for result in results:
+            self._apply(result, quarantine)
+            report["files"] += 1
+            if result["action"] == "ok":
+                report["ok"] += 1
+                continue
+            report["actions"][result["action"]] = report["actions"].get(result["action"], 0) + 1
+            for kind, _ in result["problems"]:
+                report["problems"][kind] = report["problems"].get(kind, 0) + 1
+            report["files_with_problems"].append(result)
+
+        return report
+
+    def _apply(self, result, quarantine):
+        """
+        Carry out a repair or quarantine decided by _check_baby_file.
+
+        Repairs are saved and quarantined babies deleted through the
+        DataService, so listeners, caches and the change feed see them.
+        A quarantined file (and its archived logs) is copied to the
+        quarantine directory before the delete.
+        """
+        baby_id = result["baby_id"]
+        if result["action"] == "repaired":
+            dropped = result.pop("dropped")
+            document = result.pop("document")
+            if dropped:
+                with open(os.path.join(self.quarantine_dir, f"baby_{baby_id}.dropped.json"), 'w') as f:
+                    json.dump(dropped, f, indent = 2, default = str)
+            self.data_service.save_baby(DataService.baby_from_dict(document))
+        elif result["action"] == "quarantined":
+            shutil.copy2(result["path"], os.path.join(self.quarantine_dir, os.path.basename(result["path"])))
+            archive_dir = self.data_service._get_archive_dir(baby_id)
+            if os.path.isdir(archive_dir):
+                shutil.copytree(archive_dir, os.path.join(self.quarantine_dir, f"archive_{baby_id}"), dirs_exist_ok = True)
+            self.data_service.delete_baby(baby_id)
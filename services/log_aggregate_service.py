@@ -0,0 +1,109 @@
+# services/log_aggregate_service.py
+
+from services.data_service import DataService
+
+
+class LogAggregateService:
+    # Log type the aggregate is built from (set by subclasses)
+    log_type = None
+
+    def __init__(self, data_service):
+        """
+        Initialize a service keeping one aggregate of a log type per baby.
+
+        A baby's aggregate is built from its logs (archived ones included)
+        on first use. New logs are added incrementally; changing or deleting
+        a log that went into an aggregate drops the aggregate, which is
+        rebuilt on the next request. Register on_change with
+        DataService.subscribe_changes, or on_baby_changed with add_listener
+        when there is no change feed.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.aggregates = {}
+        # baby_id -> IDs of the logs that changed its aggregate
+        self.applied_ids = {}
+
+    def _new_aggregate(self):
+        """Create an empty aggregate."""
+        raise NotImplementedError
+
+    def _add_log(self, aggregate, log):
+        """
+        Add a log of the service's type to an aggregate.
+
+        Returns:
+            bool: True if the aggregate changed
+        """
+        raise NotImplementedError
+
+    def _ordered(self, logs):
+        """Order logs for building an aggregate. Logs come sorted by date and time."""
+        return logs
+
+    def get_aggregate(self, baby_id):
+        """
+        Get the aggregate for a baby, building it on first use.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            object: Aggregate or None if baby not found
+        """
+        if baby_id in self.aggregates:
+            return self.aggregates[baby_id]
+
+        logs = self.data_service.load_daily_logs(baby_id)
+        if logs is None:
+            return None
+
+        aggregate = self._new_aggregate()
+        applied_ids = set()
+        for log in self._ordered([log for log in logs if log.log_type == self.log_type]):
+            if self._add_log(aggregate, log):
+                applied_ids.add(log.id)
+
+        self.aggregates[baby_id] = aggregate
+        self.applied_ids[baby_id] = applied_ids
+        return aggregate
+
+    def _drop(self, baby_id):
+        """Forget a baby's aggregate; it is rebuilt on the next request."""
+        self.aggregates.pop(baby_id, None)
+        self.applied_ids.pop(baby_id, None)
+
+    def on_change(self, event):
+        """
+        Apply a record-level change. Register with DataService.subscribe_changes.
+
+        Args:
+            event (ChangeEvent): Record-level change
+        """
+        baby_id = event.baby_id
+        if event.record_type == "baby" and event.action == "delete":
+            self._drop(baby_id)
+            return
+        if event.record_type != "daily_log" or baby_id not in self.aggregates:
+            return
+
+        if event.record_id in self.applied_ids[baby_id]:
+            # Aggregates cannot take a log back
+            self._drop(baby_id)
+        elif event.data is not None:
+            log = DataService.daily_log_from_dict(event.data)
+            if log.log_type == self.log_type and self._add_log(self.aggregates[baby_id], log):
+                self.applied_ids[baby_id].add(log.id)
+
+    def on_baby_changed(self, action, baby_id, baby):
+        """
+        Drop a baby's aggregate on any save or delete. Register with DataService.add_listener.
+
+        Args:
+            action (str): 'save' or 'delete'
+            baby_id (str): UUID of baby
+            baby (Baby): Saved baby, None for deletes
+        """
+        self._drop(baby_id)
@@ -0,0 +1,256 @@
+# services/log_index_service.py
+
+import json
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+
+from services.change_feed import FeedCursor
+
+try:
+    import fcntl
+except ImportError:  # Windows: only readers in this process are serialized
+    fcntl = None
+
+# Directory (under the data directory) holding per-baby record and index files
+INDEX_DIRNAME = "logindex"
+
+# Index header: magic, format version, change feed seq and offset the files are current to, entry count
+HEADER = struct.Struct("<4sIqqQ")
+MAGIC = b"BTLX"
+VERSION = 2
+
+# Index entry: log date (YYYY-MM-DD), padding, offset and length of the record in the data file
+ENTRY = struct.Struct("<10s6xQQ")
+
+
+class _EntryDates:
+    """Sequence view of the dates in a mapped index, for bisect."""
+
+    def __init__(self, index, count):
+        self.index = index
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        return self.index[HEADER.size + position * ENTRY.size:HEADER.size + position * ENTRY.size + 10]
+
+
+@contextmanager
+def _locked(lock_path):
+    """Hold an exclusive lock on a lock file (shared with other processes where supported)."""
+    with open(lock_path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+class LogIndexService:
+    def __init__(self, data_service):
+        """
+        Initialize the LogIndexService.
+
+        Keeps a read-optimized copy of each baby's daily logs: a data file of
+        one JSON record per line in date order, and an index of fixed-width
+        (date, offset, length) entries. Reads map both files, bisect the
+        index for the requested dates and decode only those records, so the
+        cost of reading a day does not grow with the baby's history.
+
+        The baby document stays the source of truth. The index header
+        records the change feed position the files are current to; each
+        read applies the events after it. New logs are appended, whichever
+        process saved them; edits, deletes, out-of-order logs or a feed
+        compacted past the position force a rebuild. Register
+        on_baby_changed with DataService.add_listener to remove a deleted
+        baby's files straight away.
+
+        Args:
+            data_service (DataService): Service for data persistence, with the change feed enabled
+        """
+        if data_service.change_feed is None:
+            raise ValueError("LogIndexService needs a DataService with the change feed enabled")
+        self.data_service = data_service
+        self.feed = data_service.change_feed
+        self.index_dir = os.path.join(data_service.data_dir, INDEX_DIRNAME)
+        self.lock = threading.Lock()
+
+    def _get_paths(self, baby_id):
+        """Get the (data file, index file) paths for a baby."""
+        base = os.path.join(self.index_dir, baby_id)
+        return base + ".dat", base + ".idx"
+
+    def _read_header(self, index_path):
+        """Read an index header as ((seq, offset), count), or None if missing or unreadable."""
+        try:
+            with open(index_path, 'rb') as f:
+                magic, version, seq, offset, count = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC or version != VERSION:
+            return None
+        return (seq, offset), count
+
+    def rebuild(self, baby_id):
+        """
+        Write a baby's record and index files from its stored logs.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            bool: True if rebuilt, False if baby not found
+        """
+        # Load again if anything was saved while loading, so the files match the position exactly
+        position = self.feed.end_position()
+        while True:
+            logs = self.data_service.load_daily_logs(baby_id)
+            if logs is None:
+                return False
+            loaded_position = self.feed.end_position()
+            if loaded_position == position:
+                break
+            position = loaded_position
+
+        os.makedirs(self.index_dir, exist_ok = True)
+        data_path, index_path = self._get_paths(baby_id)
+
+        entries = []
+        offset = 0
+        with open(data_path + ".tmp", 'wb') as f:
+            for log in logs:
+                record = json.dumps(log.to_dict(), default = str).encode("utf-8") + b"\n"
+                f.write(record)
+                entries.append(ENTRY.pack(log.date.isoformat().encode("ascii"), offset, len(record)))
+                offset += len(record)
+
+        with open(index_path + ".tmp", 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, *position, len(entries)))
+            f.write(b"".join(entries))
+
+        os.replace(data_path + ".tmp", data_path)
+        os.replace(index_path + ".tmp", index_path)
+        return True
+
+    def _catch_up(self, baby_id, header):
+        """
+        Append the logs created since the position in the index header.
+
+        Args:
+            baby_id (str): UUID of baby
+            header (tuple): Header as returned by _read_header
+
+        Returns:
+            bool: True if the files are now current, False if they must be rebuilt
+        """
+        (seq, offset), count = header
+        cursor = FeedCursor(self.feed, seq = seq, offset = offset)
+        events = cursor.poll()
+        if events and events[0].seq != seq + 1:
+            return False  # Compacted past the position
+        if not events:
+            # A feed that restarted has fewer events than the position
+            return self.feed.end_position()[0] >= seq
+
+        logs = []
+        for event in events:
+            if event.baby_id != baby_id or event.record_type not in ("baby", "daily_log"):
+                continue
+            if event.record_type == "baby":
+                if event.action == "delete":
+                    return False
+                continue
+            if event.action != "create":
+                return False
+            logs.append(self.data_service.daily_log_from_dict(event.data))
+
+        data_path, index_path = self._get_paths(baby_id)
+        logs = sorted(logs, key = lambda log: (log.date, log.time))
+        with open(index_path, 'r+b') as index:
+            if logs and count:
+                index.seek(HEADER.size + (count - 1) * ENTRY.size)
+                if logs[0].date.isoformat().encode("ascii") < ENTRY.unpack(index.read(ENTRY.size))[0]:
+                    return False  # Would break the index order
+
+            entries = []
+            if logs:
+                with open(data_path, 'ab') as data:
+                    offset = data.tell()
+                    for log in logs:
+                        record = json.dumps(log.to_dict(), default = str).encode("utf-8") + b"\n"
+                        data.write(record)
+                        entries.append(ENTRY.pack(log.date.isoformat().encode("ascii"), offset, len(record)))
+                        offset += len(record)
+
+                index.seek(HEADER.size + count * ENTRY.size)
+                index.write(b"".join(entries))
+            index.seek(0)
+            index.write(HEADER.pack(MAGIC, VERSION, cursor.seq, cursor.offset, count + len(entries)))
+        return True
+
+    def read_range(self, baby_id, start_date, end_date):
+        """
+        Read a baby's logs for a date range.
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            list: Logs sorted by date and time, or None if baby not found
+        """
+        data_path, index_path = self._get_paths(baby_id)
+        if self.data_service.get_baby_file_stamp(baby_id) is None:
+            return None
+
+        os.makedirs(self.index_dir, exist_ok = True)
+        with self.lock, _locked(os.path.join(self.index_dir, baby_id + ".lock")):
+            header = self._read_header(index_path)
+            if header is None or not self._catch_up(baby_id, header):
+                if not self.rebuild(baby_id):
+                    return None
+            header = self._read_header(index_path)
+
+            count = header[1]
+            if not count:
+                return []
+
+            with open(index_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as index:
+                dates = _EntryDates(index, count)
+                first = bisect_left(dates, start_date.isoformat().encode("ascii"))
+                last = bisect_right(dates, end_date.isoformat().encode("ascii"))
+                spans = [
+                    ENTRY.unpack_from(index, HEADER.size + position * ENTRY.size)[1:]
+                    for position in range(first, last)
+                ]
+
+            if not spans:
+                return []
+
+            with open(data_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+                log_dicts = [json.loads(data[offset:offset + length]) for offset, length in spans]
+
+        logs = [self.data_service.daily_log_from_dict(log_dict) for log_dict in log_dicts]
+        return sorted(logs, key = lambda log: (log.date, log.time))
+
+    def on_baby_changed(self, action, baby_id, baby):
+        """
+        Remove a deleted baby's files. Register with DataService.add_listener.
+
+        Args:
+            action (str): 'save' or 'delete'
+            baby_id (str): UUID of baby
+            baby (Baby): Saved baby, None for deletes
+        """
+        if action != "delete":
+            return
+
+        with self.lock:
+            for path in self._get_paths(baby_id) + (os.path.join(self.index_dir, baby_id + ".lock"),):
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,162 @@
+# services/migration_service.py
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.schema import SCHEMA_VERSION, upgrade_document
+
+# Directory (under the data directory) holding migration progress
+MIGRATION_DIRNAME = "migrations"
+
+
+def _migrate_baby_file(file_path):
+    """
+    Upgrade one baby file in place.
+
+    Module-level so it can be sent to worker processes. The upgraded
+    document is written to a temporary file and renamed over the original,
+    so an interrupted migration never leaves a partly written file. A file
+    that changed while it was being upgraded is left alone (the save that
+    changed it wrote the current version).
+
+    Args:
+        file_path (str): Path of a baby_<id>.json file
+
+    Returns:
+        tuple: (version the file had or None if it was already current or is gone,
+            error message or None); files that cannot be read or upgraded are
+            left as they are and reported with an error
+    """
+    try:
+        stamp = os.stat(file_path).st_mtime_ns
+        with open(file_path, 'r') as f:
+            baby_dict = json.load(f)
+    except FileNotFoundError:
+        return None, None  # Deleted or moved by a concurrent save
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+    if not isinstance(baby_dict, dict):
+        return None, "document is not an object"
+    if baby_dict.get("schema_version") == SCHEMA_VERSION:
+        return None, None
+
+    try:
+        original = upgrade_document(baby_dict)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        return None, f"cannot upgrade: {e!r}"
+
+    temp_path = file_path + ".migrating"
+    with open(temp_path, 'w') as f:
+        json.dump(baby_dict, f, indent = 2, default = str)
+    try:
+        if os.stat(file_path).st_mtime_ns != stamp:
+            os.remove(temp_path)
+            return None, None
+    except FileNotFoundError:
+        os.remove(temp_path)
+        return None, None
+    os.replace(temp_path, file_path)
+    return original, None
+
+
+class MigrationService:
+    def __init__(self, data_service):
+        """
+        Initialize the MigrationService.
+
+        Upgrades stored baby files to SCHEMA_VERSION in place, so loads only
+        compare a version number instead of patching every document they
+        read. Files are streamed one at a time per worker, shard by shard;
+        each finished shard is checkpointed, so an interrupted run resumes
+        with the next shard (files already upgraded in a partly done shard
+        are skipped by their version). Files that cannot be read or upgraded
+        are reported and keep their shard from being checkpointed, so a
+        later run retries them.
+
+        Run it while no other process writes to the data directory: the
+        DataService has no per-baby lock to take, so a save racing with a
+        file's upgrade is only detected by its modification time.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.state_path = os.path.join(data_service.data_dir, MIGRATION_DIRNAME, "state.json")
+
+    def _load_state(self):
+        """Load migration progress, starting over if it was for another target version."""
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            if state.get("target") == SCHEMA_VERSION:
+                return state
+        return {"target": SCHEMA_VERSION, "done_shards": [], "complete": False}
+
+    def _save_state(self, state):
+        """Persist migration progress."""
+        os.makedirs(os.path.dirname(self.state_path), exist_ok = True)
+        with open(self.state_path + ".tmp", 'w') as f:
+            json.dump(state, f)
+        os.replace(self.state_path + ".tmp", self.state_path)
+
+    def run(self, workers = None, force = False):
+        """
+        Upgrade every baby file to SCHEMA_VERSION.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to None
+                (migrate in the current process).
+            force (bool, optional): Rescan every shard even if a previous run completed.
+                Defaults to False.
+
+        Returns:
+            dict: Contains target (version), files (scanned this run),
+                migrated (count of files per original version), skipped_shards
+                (shards finished by an earlier run) and errors (list of
+                {"path", "error"} for files left unmigrated)
+        """
+        state = self._load_state()
+        if force:
+            state = {"target": SCHEMA_VERSION, "done_shards": [], "complete": False}
+
+        result = {"target": SCHEMA_VERSION, "files": 0, "migrated": {}, "skipped_shards": 0, "errors": []}
+        if state["complete"]:
+            return result
+
+        done_shards = set(state["done_shards"])
+        executor = ProcessPoolExecutor(max_workers = workers) if workers and workers > 1 else None
+        try:
+            for shard in self.data_service.iter_shards():
+                shard_key = os.path.relpath(shard, self.data_service.data_dir)
+                if shard_key in done_shards:
+                    result["skipped_shards"] += 1
+                    continue
+
+                file_paths = list(self.data_service.iter_baby_file_paths(shard))
+                if executor is not None:
+                    versions = executor.map(_migrate_baby_file, file_paths, chunksize = 16)
+                else:
+                    versions = map(_migrate_baby_file, file_paths)
+
+                shard_ok = True
+                for file_path, (version, error) in zip(file_paths, versions):
+                    result["files"] += 1
+                    if error is not None:
+                        result["errors"].append({"path": file_path, "error": error})
+                        shard_ok = False
+                    elif version is not None:
+                        result["migrated"][version] = result["migrated"].get(version, 0) + 1
+
+                if shard_ok:
+                    state["done_shards"].append(shard_key)
+                    self._save_state(state)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if not result["errors"]:
+            state["complete"] = True
+            self._save_state(state)
+        return result
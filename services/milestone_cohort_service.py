@@ -0,0 +1,155 @@
+# services/milestone_cohort_service.py
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from services.data_service import DataService
+
+# Possible outcomes for a single milestone
+STATUSES = ("early", "on_time", "late", "unknown", "pending")
+
+
+def _empty_partial():
+    """Create an empty accumulator for cohort statistics."""
+    return {
+        "babies": 0,
+        "ages": {},
+        "categories": {}
+    }
+
+
+def _evaluate_baby_file(file_path):
+    """
+    Evaluate every milestone stored in a single baby file.
+
+    Module-level so it can be sent to worker processes.
+
+    Args:
+        file_path (str): Path of a baby_<id>.json file
+
+    Returns:
+        dict: Partial statistics for this baby
+    """
+    baby_dict = DataService.read_baby_file(file_path)
+
+    partial = _empty_partial()
+    partial["babies"] = 1
+    birthdate = datetime.fromisoformat(baby_dict["birthdate"])
+
+    for milestone_dict in baby_dict["milestones"]:
+        milestone = DataService.milestone_from_dict(milestone_dict)
+
+        if milestone.is_achieved():
+            status = milestone.achievement_status(birthdate) or "unknown"
+            months_age = milestone.age_at_achievement(birthdate)
+            histogram = partial["ages"].setdefault(milestone.name, {})
+            histogram[months_age] = histogram.get(months_age, 0) + 1
+        else:
+            status = "pending"
+
+        counts = partial["categories"].setdefault(milestone.category, dict.fromkeys(STATUSES, 0))
+        counts[status] += 1
+
+    return partial
+
+
+def _merge_partial(total, partial):
+    """Fold a partial result into the running total."""
+    total["babies"] += partial["babies"]
+
+    for name, histogram in partial["ages"].items():
+        total_histogram = total["ages"].setdefault(name, {})
+        for months_age, count in histogram.items():
+            total_histogram[months_age] = total_histogram.get(months_age, 0) + count
+
+    for category, counts in partial["categories"].items():
+        total_counts = total["categories"].setdefault(category, dict.fromkeys(STATUSES, 0))
+        for status, count in counts.items():
+            total_counts[status] += count
+
+    return total
+
+
+def _summarize_histogram(histogram):
+    """
+    Summarize an achievement age histogram.
+
+    Args:
+        histogram (dict): Mapping of age in months to number of babies
+
+    Returns:
+        dict: count, min, max, mean and median age plus the histogram itself
+    """
+    ages = sorted(histogram)
+    count = sum(histogram.values())
+
+    # Walk the sorted histogram to find the median without expanding it
+    lower_rank = (count - 1) // 2
+    upper_rank = count // 2
+    lower = upper = None
+    seen = 0
+    for months_age in ages:
+        seen += histogram[months_age]
+        if lower is None and seen > lower_rank:
+            lower = months_age
+        if seen > upper_rank:
+            upper = months_age
+            break
+
+    return {
+        "count": count,
+        "min_months": ages[0],
+        "max_months": ages[-1],
+        "mean_months": sum(age * n for age, n in histogram.items()) / count,
+        "median_months": (lower + upper) / 2,
+        "histogram": {age: histogram[age] for age in ages}
+    }
+
+
+class MilestoneCohortService:
+    def __init__(self, data_service):
+        """
+        Initialize the MilestoneCohortService.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+
+    def evaluate_all(self, workers = None):
+        """
+        Evaluate milestones for every baby in the data directory.
+
+        Baby files are read one at a time and reduced into running
+        histograms and counters, so memory does not grow with the number
+        of babies.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to None
+                (evaluate in the current process).
+
+        Returns:
+            dict: Cohort report with keys:
+                babies (int): Number of babies evaluated
+                milestones (dict): Achievement age distribution per milestone name
+                categories (dict): early/on_time/late/unknown/pending counts per category
+        """
+        total = _empty_partial()
+        file_paths = self.data_service.iter_baby_file_paths()
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                for partial in executor.map(_evaluate_baby_file, file_paths, chunksize = 16):
+                    _merge_partial(total, partial)
+        else:
+            for file_path in file_paths:
+                _merge_partial(total, _evaluate_baby_file(file_path))
+
+        return {
+            "babies": total["babies"],
+            "milestones": {
+                name: _summarize_histogram(histogram)
+                for name, histogram in sorted(total["ages"].items())
+            },
+            "categories": dict(sorted(total["categories"].items()))
+        }
@@ -0,0 +1,252 @@
+# services/query_service.py
+
+import operator
+import os
+import re
+import shlex
+from datetime import date, datetime, time, timedelta
+
+# Query subjects: name -> (record list, log_type the records must have or None)
+SUBJECTS = {
+    "log": ("daily_logs", None),
+    "feeding": ("daily_logs", "feeding"),
+    "sleep": ("daily_logs", "sleep"),
+    "diaper": ("daily_logs", "diaper"),
+    "growth": ("growth_records", None),
+}
+
+# Fields each subject can filter on, and the kind of value they hold
+LOG_FIELDS = {"date": "date", "time": "time", "notes": "text", "log_type": "text"}
+FIELDS = {
+    "log": LOG_FIELDS,
+    "feeding": dict(LOG_FIELDS, feeding_type = "text", amount = "number", duration = "number"),
+    "sleep": dict(LOG_FIELDS, end_time = "time", quality = "text", duration = "number"),
+    "diaper": dict(LOG_FIELDS, diaper_type = "text"),
+    "growth": {"date": "date", "notes": "text", "weight": "number", "height": "number", "head_circumference": "number"},
+}
+
+OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+CONDITION_PATTERN = re.compile(r"^([a-z_]+)(<=|>=|!=|=|<|>|~)(.+)$")
+RELATIVE_DATE_PATTERN = re.compile(r"^-(\d+)([dwm])$")
+
+
+def _parse_date(text, today):
+    """Parse YYYY-MM-DD, 'today', 'yesterday' or a relative date like -7d, -2w, -1m."""
+    if text == "today":
+        return today
+    if text == "yesterday":
+        return today - timedelta(days = 1)
+    match = RELATIVE_DATE_PATTERN.match(text)
+    if match:
+        count, unit = int(match.group(1)), match.group(2)
+        return today - timedelta(days = count * {"d": 1, "w": 7, "m": 30}[unit])
+    return date.fromisoformat(text)
+
+
+def _parse_value(kind, text, today):
+    """Convert a condition value to the type of the field it is compared with."""
+    if kind == "date":
+        return _parse_date(text, today)
+    if kind == "time":
+        return time.fromisoformat(text)
+    if kind == "number":
+        return float(text)
+    return text
+
+
+def _field_getter(field):
+    """Build a getter that reads a field off a record, reducing datetimes to what queries compare."""
+    if field == "date":
+        def get(record):
+            value = record.date
+            return value.date() if isinstance(value, datetime) else value
+    elif field in ("time", "end_time"):
+        def get(record):
+            value = getattr(record, field, None)
+            return value.time() if isinstance(value, datetime) else value
+    else:
+        def get(record):
+            return getattr(record, field, None)
+    return get
+
+
+class Query:
+    def __init__(self, subject, conditions, start_date = None, end_date = None):
+        """
+        Initialize a compiled query.
+
+        Args:
+            subject (str): Key of SUBJECTS
+            conditions (list): Predicates taking a record and returning bool
+            start_date (date, optional): Earliest date any match can have. Defaults to None.
+            end_date (date, optional): Latest date any match can have. Defaults to None.
+        """
+        self.subject = subject
+        self.record_type, self.log_type = SUBJECTS[subject]
+        self.conditions = tuple(conditions)
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def matches(self, record):
+        """
+        Check a record against every condition.
+
+        Args:
+            record (DailyLog or GrowthRecord): Record of the query's record type
+
+        Returns:
+            bool: True if the record matches
+        """
+        if self.log_type is not None and record.log_type != self.log_type:
+            return False
+        for condition in self.conditions:
+            if not condition(record):
+                return False
+        return True
+
+
+def compile_query(text, today = None):
+    """
+    Compile a query into predicates.
+
+    A query is an optional subject (log, feeding, sleep, diaper or growth;
+    default log) followed by conditions that must all hold, each written
+    field, operator, value with no spaces (quote values that contain spaces):
+
+        feeding feeding_type=bottle amount>120 time>=22:00 date>=-7d
+        sleep quality=poor duration<30
+        growth weight>=5 date=2023-01-01..2023-06-30
+        log notes~"spit up"
+
+    Operators are = != < <= > >= and ~ (case-insensitive text contains).
+    `=` accepts a comma-separated list of alternatives, and date..date
+    for an inclusive range. Dates are YYYY-MM-DD, today, yesterday or
+    relative (-7d, -2w, -1m). Conditions on date also bound which days
+    are read, so archived months outside the range are never decompressed.
+
+    Args:
+        text (str): Query text
+        today (date, optional): Reference day for relative dates. Defaults to None (today).
+
+    Returns:
+        Query: Compiled query
+
+    Raises:
+        ValueError: If the query cannot be parsed
+    """
+    today = today or date.today()
+    try:
+        tokens = shlex.split(text)
+    except ValueError as e:
+        raise ValueError(f"Invalid query: {e}")
+
+    subject = "log"
+    if tokens and tokens[0] in SUBJECTS:
+        subject = tokens.pop(0)
+    fields = FIELDS[subject]
+
+    conditions = []
+    start_date = end_date = None
+
+    for token in tokens:
+        match = CONDITION_PATTERN.match(token)
+        if not match:
+            raise ValueError(f"Invalid condition: {token!r} (expected field, operator and value)")
+        field, op, raw_value = match.groups()
+        if field not in fields:
+            raise ValueError(f"Unknown field for {subject}: {field} (one of {', '.join(sorted(fields))})")
+        kind = fields[field]
+        get = _field_getter(field)
+
+        try:
+            if op == "~":
+                needle = raw_value.lower()
+                conditions.append(lambda record, get = get, needle = needle: needle in str(get(record) or "").lower())
+                continue
+
+            if op == "=" and ".." in raw_value:
+                low, high = (_parse_value(kind, part, today) for part in raw_value.split("..", 1))
+                conditions.append(lambda record, get = get, low = low, high = high: (
+                    (value := get(record)) is not None and low <= value <= high
+                ))
+                bounds = [(">=", low), ("<=", high)]
+            elif op == "=" and "," in raw_value:
+                options = frozenset(_parse_value(kind, part, today) for part in raw_value.split(","))
+                conditions.append(lambda record, get = get, options = options: get(record) in options)
+                bounds = [(">=", min(options)), ("<=", max(options))]
+            else:
+                value = _parse_value(kind, raw_value, today)
+                compare = OPERATORS[op]
+                if op == "!=":
+                    conditions.append(lambda record, get = get, value = value: get(record) != value)
+                else:
+                    conditions.append(lambda record, get = get, compare = compare, value = value: (
+                        (field_value := get(record)) is not None and compare(field_value, value)
+                    ))
+                bounds = [(">=", value), ("<=", value)] if op == "=" else [(op, value)]
+        except ValueError as e:
+            raise ValueError(f"Invalid value in {token!r}: {e}")
+
+        if field == "date":
+            for bound_op, bound in bounds:
+                if bound_op in (">", ">="):
+                    bound = bound + timedelta(days = 1) if bound_op == ">" else bound
+                    start_date = bound if start_date is None else max(start_date, bound)
+                elif bound_op in ("<", "<="):
+                    bound = bound - timedelta(days = 1) if bound_op == "<" else bound
+                    end_date = bound if end_date is None else min(end_date, bound)
+
+    return Query(subject, conditions, start_date, end_date)
+
+
+class QueryService:
+    def __init__(self, data_service):
+        """
+        Initialize the QueryService.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+
+    def run(self, query, baby_id = None):
+        """
+        Stream the records matching a query.
+
+        Babies are read one at a time, and daily logs only for the date
+        range the query's date conditions allow.
+
+        Args:
+            query (str or Query): Query text (see compile_query) or a compiled query
+            baby_id (str, optional): Only this baby. Defaults to None (all babies).
+
+        Yields:
+            DailyLog or GrowthRecord: Matching records, in date order per baby
+        """
+        if isinstance(query, str):
+            query = compile_query(query)
+
+        if baby_id is not None:
+            baby_ids = [baby_id]
+        else:
+            baby_ids = sorted(
+                os.path.basename(file_path)[5:-5] for file_path in self.data_service.iter_baby_file_paths()
+            )
+
+        for current_id in baby_ids:
+            if query.record_type == "daily_logs":
+                records = self.data_service.load_daily_logs(current_id, query.start_date, query.end_date) or []
+            else:
+                records = self.data_service.iter_records(current_id, query.record_type)
+
+            for record in records:
+                if query.matches(record):
+                    yield record
@@ -0,0 +1,337 @@
+# services/report_service.py
+
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+
+from services.age_service import AgeService
+from services.daily_summary_service import SUMMARY_FIELDS, DailySummaryService
+from services.data_service import DataService
+
+# Report formats and their file extensions
+REPORT_FORMATS = {"html": ".html", "markdown": ".md"}
+
+# Days of daily aggregates in a report by default
+DEFAULT_DAYS = 14
+
+# Daily aggregate columns: (counter, heading)
+DAILY_COLUMNS = (
+    ("feedings", "Feeds"),
+    ("feeding_amount", "Amount"),
+    ("feeding_minutes", "Feeding min"),
+    ("sleeps", "Sleeps"),
+    ("sleep_minutes", "Sleep h"),
+    ("diapers", "Diapers"),
+    ("diapers_wet", "Wet"),
+    ("diapers_soiled", "Soiled"),
+)
+
+GROWTH_COLUMNS = (
+    ("date", "Date"),
+    ("weight", "Weight (kg)"),
+    ("height", "Height (cm)"),
+    ("head_circumference", "Head (cm)"),
+)
+
+MILESTONE_COLUMNS = (
+    ("name", "Milestone"),
+    ("category", "Category"),
+    ("expected", "Expected"),
+    ("achieved_date", "Achieved"),
+    ("age_months", "Age (months)"),
+    ("status", "Status"),
+)
+
+
+def _format_value(field, value):
+    """Format a report cell for display."""
+    if value is None:
+        return "-"
+    if field == "sleep_minutes":
+        return f"{value / 60:.1f}"
+    if isinstance(value, float):
+        return f"{value:.1f}".rstrip("0").rstrip(".")
+    return str(value)
+
+
+def _sections(report):
+    """
+    Lay a report out as titled tables.
+
+    Returns:
+        list: (title, headings, rows of display strings) tuples
+    """
+    daily = report["daily"]
+    daily_rows = [
+        [day["date"]] + [_format_value(field, day[field]) for field, _ in DAILY_COLUMNS]
+        for day in daily["days"]
+    ]
+    daily_rows.append(["Daily average"] + [_format_value(field, daily["averages"][field]) for field, _ in DAILY_COLUMNS])
+
+    return [
+        ("Growth", [heading for _, heading in GROWTH_COLUMNS], [
+            [_format_value(field, point[field]) for field, _ in GROWTH_COLUMNS] for point in report["growth"]
+        ]),
+        ("Milestones", [heading for _, heading in MILESTONE_COLUMNS], [
+            [_format_value(field, milestone[field]) for field, _ in MILESTONE_COLUMNS] for milestone in report["milestones"]
+        ]),
+        (f"Daily summary {daily['start_date']} to {daily['end_date']}", ["Date"] + [heading for _, heading in DAILY_COLUMNS], daily_rows),
+    ]
+
+
+def _describe_baby(report):
+    """One-line description of the baby for a report header."""
+    baby = report["baby"]
+    age = report["age"]
+    parts = [f"Born {baby['birthdate']}", f"age {age['years']}y {age['months']}m {age['days']}d"]
+    if baby["gender"]:
+        parts.append(baby["gender"])
+    return ", ".join(parts)
+
+
+def render_markdown(report):
+    """
+    Render a report as Markdown.
+
+    Args:
+        report (dict): Report from ReportService.build
+
+    Returns:
+        str: Markdown document
+    """
+    lines = [
+        f"# {report['baby']['name']}",
+        "",
+        f"{_describe_baby(report)}. Report as of {report['as_of']}.",
+    ]
+    for title, headings, rows in _sections(report):
+        lines += ["", f"## {title}", ""]
+        if not rows:
+            lines.append("No records.")
+            continue
+        lines.append("| " + " | ".join(headings) + " |")
+        lines.append("|" + "---|" * len(headings))
+        for row in rows:
+            lines.append("| " + " | ".join(cell.replace("|", "\\|") for cell in row) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def render_html(report):
+    """
+    Render a report as a self-contained HTML page (inline styles, no external assets).
+
+    Args:
+        report (dict): Report from ReportService.build
+
+    Returns:
+        str: HTML document
+    """
+    escape = html.escape
+    name = escape(report["baby"]["name"])
+    parts = [
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8">',
+        f"<title>{name} - checkup report</title>",
+        "<style>body{font-family:sans-serif;margin:2em;color:#222}"
+        "table{border-collapse:collapse;margin-bottom:1.5em}"
+        "th,td{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+        "th:first-child,td:first-child{text-align:left}"
+        "th{background:#f0f0f0}"
+        ".early{color:#1565c0}.on_time{color:#2e7d32}.late{color:#c62828}</style>",
+        "</head><body>",
+        f"<h1>{name}</h1>",
+        f"<p>{escape(_describe_baby(report))}. Report as of {escape(report['as_of'])}.</p>",
+    ]
+    for title, headings, rows in _sections(report):
+        parts.append(f"<h2>{escape(title)}</h2>")
+        if not rows:
+            parts.append("<p>No records.</p>")
+            continue
+        parts.append("<table><tr>" + "".join(f"<th>{escape(heading)}</th>" for heading in headings) + "</tr>")
+        for row in rows:
+            cells = "".join(
+                f'<td class="{escape(cell)}">{escape(cell)}</td>' if heading == "Status" else f"<td>{escape(cell)}</td>"
+                for heading, cell in zip(headings, row)
+            )
+            parts.append(f"<tr>{cells}</tr>")
+        parts.append("</table>")
+    parts.append("</body></html>")
+    return "\n".join(parts) + "\n"
+
+
+RENDERERS = {"html": render_html, "markdown": render_markdown}
+
+
+def _render_baby_file(file_path, data_dir, output_dir, file_format, as_of, days):
+    """
+    Render the report for one baby file into the output directory.
+
+    Module-level so it can be sent to worker processes; each worker builds
+    its own services, so aggregates are computed in parallel too.
+
+    Returns:
+        tuple: (baby_id, report path or None if the baby could not be loaded)
+    """
+    return ReportService(DataService(data_dir))._write_report(file_path, output_dir, file_format, as_of, days)
+
+
+class ReportService:
+    def __init__(self, data_service, summary_service = None, age_service = None):
+        """
+        Initialize the ReportService.
+
+        Reports are built from pre-aggregated data: growth points and daily
+        counters come from the DailySummaryService, ages from the AgeService.
+        Only pass a shared summary service that follows every save (see
+        DailySummaryService.on_change).
+
+        Args:
+            data_service (DataService): Service for data persistence
+            summary_service (DailySummaryService, optional): Source of daily aggregates and
+                growth points. Defaults to None (a new one for this service).
+            age_service (AgeService, optional): Source of ages. Defaults to None (a new one).
+        """
+        self.data_service = data_service
+        self.summary_service = summary_service or DailySummaryService(data_service)
+        self.age_service = age_service or AgeService()
+
+    def build(self, baby_id, as_of = None, days = DEFAULT_DAYS):
+        """
+        Collect everything a checkup report shows.
+
+        Args:
+            baby_id (str): UUID of baby
+            as_of (date, optional): Report date; daily aggregates end here. Defaults to None (today).
+            days (int, optional): Number of days of daily aggregates. Defaults to DEFAULT_DAYS.
+
+        Returns:
+            dict: Report data (baby, as_of, age, growth, milestones, daily), or None if baby not found
+        """
+        baby = self.data_service.load_baby(baby_id)
+        if not baby:
+            return None
+
+        as_of = as_of or date.today()
+        start_date = as_of - timedelta(days = days - 1)
+
+        milestones = []
+        for milestone in sorted(baby.milestones, key = lambda m: (m.achieved_date is None, m.achieved_date or 0, m.name)):
+            expected_range = milestone.expected_range or {}
+            expected = None
+            if expected_range.get("min_months") is not None and expected_range.get("max_months") is not None:
+                expected = f"{expected_range['min_months']}-{expected_range['max_months']} months"
+            if milestone.is_achieved():
+                status = milestone.achievement_status(baby.birthdate) or "achieved"
+            else:
+                status = "pending"
+            milestones.append({
+                "name": milestone.name,
+                "category": milestone.category,
+                "expected": expected,
+                "achieved_date": milestone.achieved_date.strftime("%Y-%m-%d") if milestone.achieved_date else None,
+                "age_months": milestone.age_at_achievement(baby.birthdate),
+                "status": status,
+                "on_time": milestone.achieved_on_time(baby.birthdate),
+            })
+
+        summaries = self.summary_service.get_days(baby_id, start_date, as_of)
+        day_rows = [dict(summary, date = day.isoformat()) for day, summary in sorted(summaries.items())]
+        averages = {field: sum(row[field] for row in day_rows) / len(day_rows) for field in SUMMARY_FIELDS}
+
+        return {
+            "baby": {
+                "id": baby.id,
+                "name": baby.name,
+                "birthdate": baby.birthdate.strftime("%Y-%m-%d"),
+                "gender": baby.gender,
+            },
+            "as_of": as_of.isoformat(),
+            "age": self.age_service.age(baby.birthdate, as_of),
+            "growth": self.summary_service.get_growth(baby_id),
+            "milestones": milestones,
+            "daily": {
+                "start_date": start_date.isoformat(),
+                "end_date": as_of.isoformat(),
+                "days": day_rows,
+                "averages": averages,
+            },
+        }
+
+    def render(self, baby_id, file_format = "html", as_of = None, days = DEFAULT_DAYS):
+        """
+        Render a baby's report.
+
+        Args:
+            baby_id (str): UUID of baby
+            file_format (str, optional): 'html' or 'markdown'. Defaults to "html".
+            as_of (date, optional): Report date. Defaults to None (today).
+            days (int, optional): Number of days of daily aggregates. Defaults to DEFAULT_DAYS.
+
+        Returns:
+            str: Rendered report, or None if baby not found
+        """
+        if file_format not in RENDERERS:
+            raise ValueError(f"Unsupported report format: {file_format}")
+        if days < 1:
+            raise ValueError("days must be at least 1")
+
+        report = self.build(baby_id, as_of, days)
+        if report is None:
+            return None
+        return RENDERERS[file_format](report)
+
+    def render_all(self, output_dir, file_format = "html", workers = None, as_of = None, days = DEFAULT_DAYS):
+        """
+        Render a report file for every baby in the data directory.
+
+        Args:
+            output_dir (str): Directory for report_<baby_id> files (created if missing)
+            file_format (str, optional): 'html' or 'markdown'. Defaults to "html".
+            workers (int, optional): Number of worker processes. Defaults to None
+                (render in the current process).
+            as_of (date, optional): Report date. Defaults to None (today).
+            days (int, optional): Number of days of daily aggregates. Defaults to DEFAULT_DAYS.
+
+        Returns:
+            dict: Mapping of baby ID to report path
+        """
+        if file_format not in RENDERERS:
+            raise ValueError(f"Unsupported report format: {file_format}")
+        os.makedirs(output_dir, exist_ok = True)
+        as_of = as_of or date.today()  # Same date in every worker
+
+        file_paths = list(self.data_service.iter_baby_file_paths())
+        if workers and workers > 1:
+            render = partial(
+                _render_baby_file,
+                data_dir = self.data_service.data_dir,
+                output_dir = output_dir,
+                file_format = file_format,
+                as_of = as_of,
+                days = days
+            )
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                results = list(executor.map(render, file_paths, chunksize = 16))
+        else:
+            results = [self._write_report(file_path, output_dir, file_format, as_of, days) for file_path in file_paths]
+
+        return {baby_id: path for baby_id, path in results if path is not None}
+
+    def _write_report(self, file_path, output_dir, file_format, as_of, days):
+        """
+        Render the report for a baby file and write it to the output directory.
+
+        Returns:
+            tuple: (baby_id, report path or None if the baby could not be loaded)
+        """
+        baby_id = os.path.basename(file_path)[5:-5]
+        content = self.render(baby_id, file_format, as_of, days)
+        if content is None:
+            return baby_id, None
+
+        output_path = os.path.join(output_dir, f"report_{baby_id}{REPORT_FORMATS[file_format]}")
+        with open(output_path, 'w', encoding = "utf-8") as f:
+            f.write(content)
+        return baby_id, output_path
@@ -0,0 +1,346 @@
+# services/search_service.py
+
+import json
+import os
+import re
+import threading
+from datetime import date
+
+try:
+    import fcntl
+except ImportError:  # Windows: only writers in this process are serialized
+    fcntl = None
+
+# Index file kept alongside the baby files
+INDEX_FILENAME = "search_index.jsonl"
+
+# Extra log lines tolerated before the index file is compacted
+COMPACT_SLACK = 100
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into case-folded word tokens.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Tokens in order of appearance
+    """
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def _padded(text):
+    """Tokenized text joined by single spaces, padded so whole-word phrases can be matched."""
+    return f" {' '.join(tokenize(text))} "
+
+
+def _extract_entries(baby, archived_logs = ()):
+    """
+    Collect every note-bearing record of a baby.
+
+    Args:
+        baby (Baby): Baby to index
+        archived_logs (iterable, optional): Archived log dictionaries to index too. Defaults to ().
+
+    Returns:
+        dict: Mapping of entry key to entry (record_type, record_id, date, notes;
+            archived is set on entries for archived logs)
+    """
+    entries = {}
+
+    def add(record_type, record_id, date, notes):
+        if notes:
+            entries[f"{record_type}:{record_id}"] = {
+                "record_type": record_type,
+                "record_id": record_id,
+                "date": date.isoformat() if date else None,
+                "notes": notes
+            }
+
+    add("baby", baby.id, baby.birthdate, baby.notes)
+    for record in baby.growth_records:
+        add("growth_record", record.id, record.date, record.notes)
+    for milestone in baby.milestones:
+        add("milestone", milestone.id, milestone.achieved_date, milestone.notes)
+    for log in baby.daily_logs:
+        add(f"{log.log_type}_log", log.id, log.date, log.notes)
+    for log_dict in archived_logs:
+        key = f"{log_dict['log_type']}_log:{log_dict['id']}"
+        if key not in entries:
+            add(f"{log_dict['log_type']}_log", log_dict["id"], date.fromisoformat(log_dict["date"][:10]), log_dict["notes"])
+            if key in entries:
+                entries[key]["archived"] = True
+
+    return entries
+
+
+class SearchService:
+    def __init__(self, data_service):
+        """
+        Initialize the SearchService.
+
+        The index is an append-only file of per-baby entry sets; the latest
+        line for a baby wins. Lines are appended without reading the index,
+        so one-shot writers stay cheap; the file is read lazily on first
+        search, and later searches only read lines appended since. Register
+        on_baby_changed with DataService.add_listener to keep it up to date.
+
+        Appends and compaction hold a lock on the file, and compaction
+        re-reads it first, so lines from other processes are not lost.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.index_path = os.path.join(data_service.data_dir, INDEX_FILENAME)
+        self.entries = None
+        self.baby_entries = {}
+        self.postings = {}
+        self.log_lines = 0
+        # Position read up to, in the index file with this inode
+        self.offset = 0
+        self.inode = None
+        # Searches from several threads may read and apply new lines
+        self.lock = threading.RLock()
+
+    def _reset(self):
+        """Empty the in-memory index."""
+        self.entries = {}
+        self.baby_entries = {}
+        self.postings = {}
+        self.log_lines = 0
+        self.offset = 0
+        self.inode = None
+
+    def _ensure_loaded(self):
+        """Read index lines not seen yet, or build the index if there is no index file yet."""
+        if not os.path.exists(self.index_path):
+            self.rebuild()
+            return
+
+        with open(self.index_path, 'rb') as f:
+            inode = os.fstat(f.fileno()).st_ino
+            if self.entries is None or inode != self.inode:
+                # First read, or the file was compacted by another process
+                self._reset()
+                self.inode = inode
+            self._read_lines(f)
+
+        if self.log_lines > 2 * len(self.baby_entries) + COMPACT_SLACK:
+            self._compact()
+
+    def _read_lines(self, f):
+        """Apply the complete lines after self.offset in an open index file."""
+        f.seek(self.offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # Line still being written
+            record = json.loads(line)
+            self._replay(record["baby_id"], record["entries"], record.get("archive", {}), record.get("deleted", False))
+            self.offset += len(line)
+            self.log_lines += 1
+
+    def _open_locked(self):
+        """Open the index file for appending, holding an exclusive lock (released on close)."""
+        while True:
+            f = open(self.index_path, 'a+b')
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            # Another process may have compacted (replaced) the file while this one waited
+            if os.fstat(f.fileno()).st_ino == os.stat(self.index_path).st_ino:
+                return f
+            f.close()
+
+    def rebuild(self):
+        """Rebuild the whole index from the stored baby documents."""
+        self._reset()
+
+        for baby in self.data_service.load_all_babies():
+            self._apply(baby.id, _extract_entries(baby, self.data_service.iter_archived_log_dicts(baby.id)))
+
+        with self._open_locked():
+            self._write_compacted()
+
+    def _replay(self, baby_id, entries, archive_moves = None, deleted = False):
+        """
+        Apply one index line to the in-memory index.
+
+        Entries of archived logs are kept when a baby's line leaves them out:
+        logs moved to the archive by the save (archive_moves True) become
+        archived, and archived ones stay until removed (archive_moves False).
+
+        Args:
+            baby_id (str): UUID of baby
+            entries (dict): Entries of the baby's document
+            archive_moves (dict, optional): Log IDs moved into (True) or out of (False)
+                the archive by the save. Defaults to None.
+            deleted (bool, optional): The baby was deleted. Defaults to False.
+
+        Returns:
+            bool: True if anything changed
+        """
+        if not deleted:
+            archive_moves = archive_moves or {}
+            entries = dict(entries)
+            for key in self.baby_entries.get(baby_id, ()):
+                record_type, record_id = key.split(":", 1)
+                if key in entries or not record_type.endswith("_log"):
+                    continue
+                if archive_moves.get(record_id, self.entries[key].get("archived", False)):
+                    entries[key] = dict(self._stored_entry(key), archived = True)
+        return self._apply(baby_id, entries)
+    def _apply(self, baby_id, entries):
+        """
+        Replace a baby's entries in the in-memory index.
+
+        Only entries whose text changed touch the postings.
+
+        Args:
+            baby_id (str): UUID of baby
+            entries (dict): New entries for the baby (empty to remove it)
+
+        Returns:
+            bool: True if anything changed
+        """
+        old_keys = self.baby_entries.get(baby_id, set())
+        changed = False
+
+        for key in old_keys - entries.keys():
+            self._remove_entry(key)
+            changed = True
+
+        for key, entry in entries.items():
+            old_entry = self.entries.get(key)
+            if old_entry is not None:
+                if old_entry == dict(entry, baby_id = baby_id):
+                    continue
+                self._remove_entry(key)
+            self._add_entry(key, dict(entry, baby_id = baby_id))
+            changed = True
+
+        if entries:
+            self.baby_entries[baby_id] = set(entries)
+        else:
+            self.baby_entries.pop(baby_id, None)
+
+        return changed
+
+    def _add_entry(self, key, entry):
+        """Add an entry and its tokens to the index."""
+        self.entries[key] = entry
+        for token in set(tokenize(entry["notes"])):
+            self.postings.setdefault(token, set()).add(key)
+
+    def _remove_entry(self, key):
+        """Remove an entry and its tokens from the index."""
+        entry = self.entries.pop(key)
+        for token in set(tokenize(entry["notes"])):
+            keys = self.postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[token]
+
+    def _compact(self):
+        """Rewrite the index file with a single line per baby, including lines other processes appended."""
+        with self._open_locked() as f:
+            if os.fstat(f.fileno()).st_ino != self.inode:
+                self._reset()
+                self.inode = os.fstat(f.fileno()).st_ino
+            self._read_lines(f)
+            self._write_compacted()
+
+    def _write_compacted(self):
+        """Replace the index file with the in-memory index. Caller holds the lock."""
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            for baby_id, keys in self.baby_entries.items():
+                entries = {key: self._stored_entry(key) for key in keys}
+                f.write((json.dumps({"baby_id": baby_id, "entries": entries}) + "\n").encode("utf-8"))
+            self.offset = f.tell()
+        os.replace(temp_path, self.index_path)
+        self.inode = os.stat(self.index_path).st_ino
+        self.log_lines = len(self.baby_entries)
+
+    def _stored_entry(self, key):
+        """Entry as written to the index file (without the baby_id)."""
+        return {field: value for field, value in self.entries[key].items() if field != "baby_id"}
+
+    def on_baby_changed(self, action, baby_id, baby):
+        """
+        Update the index after a baby is saved or deleted.
+
+        Args:
+            action (str): 'save' or 'delete'
+            baby_id (str): UUID of baby
+            baby (Baby): Saved baby, None for deletes
+        """
+        with self.lock:
+            line = {"baby_id": baby_id, "entries": _extract_entries(baby) if action == "save" else {}}
+            if action == "delete":
+                line["deleted"] = True
+            elif baby_id in self.data_service.archive_moves:
+                line["archive"] = self.data_service.archive_moves[baby_id]
+
+            if self.entries is None:
+                if not os.path.exists(self.index_path):
+                    return  # The first search builds the index
+            else:
+                self._ensure_loaded()
+                if not self._replay(baby_id, line["entries"], line.get("archive"), line.get("deleted", False)):
+                    return
+
+            data = (json.dumps(line) + "\n").encode("utf-8")
+            with self._open_locked() as f:
+                if self.entries is not None and os.fstat(f.fileno()).st_ino == self.inode and f.seek(0, os.SEEK_END) == self.offset:
+                    # Nothing appended by others in between, so this line is already applied
+                    self.offset += len(data)
+                    self.log_lines += 1
+                f.write(data)
+
+            if self.entries is not None and self.log_lines > 2 * len(self.baby_entries) + COMPACT_SLACK:
+                self._compact()
+
+    def search(self, *phrases, baby_id = None):
+        """
+        Find entries whose notes mention any of the given words or phrases.
+
+        A multi-word phrase matches when its words appear consecutively.
+
+        Args:
+            *phrases (str): Words or phrases, e.g. "rash", "spit up"
+            baby_id (str, optional): Restrict to one baby. Defaults to None (all babies).
+
+        Returns:
+            list: Matching entries (baby_id, record_type, record_id, date, notes)
+                sorted by baby and date
+        """
+        with self.lock:
+            self._ensure_loaded()
+
+            matches = set()
+            for phrase in phrases:
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+
+                candidates = set.intersection(*(self.postings.get(token, set()) for token in tokens))
+                if len(tokens) > 1:
+                    needle = f" {' '.join(tokens)} "
+                    candidates = {
+                        key for key in candidates
+                        if needle in _padded(self.entries[key]["notes"])
+                    }
+                matches |= candidates
+
+            results = [self.entries[key] for key in matches]
+            if baby_id is not None:
+                results = [entry for entry in results if entry["baby_id"] == baby_id]
+
+            return sorted(results, key = lambda entry: (entry["baby_id"], entry["date"] or "", entry["record_id"]))
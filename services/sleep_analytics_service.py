@@ -0,0 +1,261 @@
+# services/sleep_analytics_service.py
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta
+
+from services.log_aggregate_service import LogAggregateService
+
+# Default boundaries of the night period (19:00 - 07:00)
+NIGHT_START = time(19, 0)
+NIGHT_END = time(7, 0)
+
+
+class SleepSessionTracker:
+    def __init__(self, merge_gap_minutes = 0):
+        """
+        Initialize a tracker of merged sleep sessions for one baby.
+
+        Sessions are kept sorted by start and never overlap, so adding a
+        sleep log only touches its neighbours and window queries start
+        from a binary search.
+
+        Args:
+            merge_gap_minutes (int, optional): Segments separated by at most this
+                many minutes are merged into one session. Defaults to 0
+                (merge only touching or overlapping segments).
+        """
+        self.merge_gap = timedelta(minutes = merge_gap_minutes)
+        self.starts = []
+        self.ends = []
+
+    def add_sleep_log(self, sleep_log):
+        """
+        Add a sleep log, merging it with adjacent or overlapping sessions.
+
+        Args:
+            sleep_log (SleepLog): Sleep log to add. Ongoing sleeps are ignored.
+        """
+        end = sleep_log.end_datetime
+        if end is None:
+            return
+        self.add_interval(sleep_log.start_datetime, end)
+
+    def add_interval(self, start, end):
+        """
+        Add a sleep interval, merging it with adjacent or overlapping sessions.
+
+        Args:
+            start (datetime): Sleep start
+            end (datetime): Sleep end
+        """
+        if end <= start:
+            return
+
+        # Sessions [first, last) touch the new interval once the gap is allowed for
+        first = bisect_left(self.ends, start - self.merge_gap)
+        last = bisect_right(self.starts, end + self.merge_gap)
+
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def sessions(self, window_start = None, window_end = None):
+        """
+        Get merged sessions clipped to a window.
+
+        Args:
+            window_start (datetime, optional): Window start. Defaults to None (unbounded).
+            window_end (datetime, optional): Window end. Defaults to None (unbounded).
+
+        Returns:
+            list: (start, end) tuples in chronological order
+        """
+        first = 0 if window_start is None else bisect_right(self.ends, window_start)
+        last = len(self.starts) if window_end is None else bisect_left(self.starts, window_end)
+
+        sessions = []
+        for i in range(first, last):
+            start, end = self.starts[i], self.ends[i]
+            if window_start is not None:
+                start = max(start, window_start)
+            if window_end is not None:
+                end = min(end, window_end)
+            sessions.append((start, end))
+        return sessions
+
+    def summarize(self, window_end = None, window_hours = 24, night_start = NIGHT_START, night_end = NIGHT_END):
+        """
+        Summarize sleep over a sliding window ending at window_end.
+
+        Args:
+            window_end (datetime, optional): End of window. Defaults to None (now).
+            window_hours (int, optional): Window length in hours. Defaults to 24.
+            night_start (time, optional): Start of night period. Defaults to 19:00.
+            night_end (time, optional): End of night period. Defaults to 07:00.
+
+        Returns:
+            dict: Minutes of total, day and night sleep, longest stretch, the number
+                of sessions and the wake windows (in minutes) between sessions
+        """
+        if window_end is None:
+            window_end = datetime.now()
+        window_start = window_end - timedelta(hours = window_hours)
+
+        sessions = self.sessions(window_start, window_end)
+
+        total = night = longest = 0.0
+        wake_windows = []
+        previous_end = None
+
+        for start, end in sessions:
+            minutes = (end - start).total_seconds() / 60
+            total += minutes
+            longest = max(longest, minutes)
+            night += _night_minutes(start, end, night_start, night_end)
+            if previous_end is not None:
+                wake_windows.append((start - previous_end).total_seconds() / 60)
+            previous_end = end
+
+        return {
+            "window_start": window_start,
+            "window_end": window_end,
+            "total_minutes": total,
+            "day_minutes": total - night,
+            "night_minutes": night,
+            "longest_stretch_minutes": longest,
+            "sessions": len(sessions),
+            "wake_windows_minutes": wake_windows
+        }
+
+    def daily_totals(self, start_date, end_date):
+        """
+        Total sleep per calendar day.
+
+        Args:
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            dict: Mapping of date to minutes asleep that day
+        """
+        totals = {}
+        day = start_date
+        day_start = datetime.combine(start_date, time.min)
+        sessions = self.sessions(day_start, datetime.combine(end_date, time.min) + timedelta(days = 1))
+
+        # Sessions are sorted, so a single pointer walks them alongside the days
+        i = 0
+        while day <= end_date:
+            day_end = day_start + timedelta(days = 1)
+            minutes = 0.0
+            j = i
+            while j < len(sessions) and sessions[j][0] < day_end:
+                start, end = sessions[j]
+                minutes += (min(end, day_end) - max(start, day_start)).total_seconds() / 60
+                if end <= day_end:
+                    i = j + 1
+                j += 1
+            totals[day] = minutes
+            day += timedelta(days = 1)
+            day_start = day_end
+
+        return totals
+
+
+def _night_minutes(start, end, night_start, night_end):
+    """Minutes of the interval [start, end) that fall inside the night period."""
+    minutes = 0.0
+    # Night periods that may overlap the interval start on the day before start
+    day = start.date() - timedelta(days = 1)
+    while datetime.combine(day, night_start) < end:
+        period_start = datetime.combine(day, night_start)
+        period_end = datetime.combine(day, night_end)
+        if period_end <= period_start:
+            period_end += timedelta(days = 1)
+
+        overlap = (min(end, period_end) - max(start, period_start)).total_seconds()
+        if overlap > 0:
+            minutes += overlap / 60
+        day += timedelta(days = 1)
+    return minutes
+
+
+class SleepAnalyticsService(LogAggregateService):
+    log_type = "sleep"
+
+    def __init__(self, data_service, merge_gap_minutes = 0):
+        """
+        Initialize the SleepAnalyticsService.
+
+        Keeps a SleepSessionTracker per baby (see LogAggregateService).
+
+        Args:
+            data_service (DataService): Service for data persistence
+            merge_gap_minutes (int, optional): See SleepSessionTracker. Defaults to 0.
+        """
+        super().__init__(data_service)
+        self.merge_gap_minutes = merge_gap_minutes
+
+    def _new_aggregate(self):
+        """Create an empty session tracker."""
+        return SleepSessionTracker(self.merge_gap_minutes)
+
+    def _add_log(self, tracker, log):
+        """Add a finished sleep to a tracker; ongoing sleeps are left out."""
+        if not log.end_time:
+            return False
+        tracker.add_sleep_log(log)
+        return True
+
+    def _ordered(self, logs):
+        """Sleeps in order of their start."""
+        return sorted(logs, key = lambda log: log.start_datetime)
+
+    def get_tracker(self, baby_id):
+        """
+        Get the session tracker for a baby, building it on first use.
+
+        Args:
+            baby_id (str): UUID of baby
+
+        Returns:
+            SleepSessionTracker: Tracker or None if baby not found
+        """
+        return self.get_aggregate(baby_id)
+
+    def summarize(self, baby_id, window_end = None, window_hours = 24):
+        """
+        Summarize a baby's sleep over a sliding window.
+
+        Args:
+            baby_id (str): UUID of baby
+            window_end (datetime, optional): End of window. Defaults to None (now).
+            window_hours (int, optional): Window length in hours. Defaults to 24.
+
+        Returns:
+            dict: See SleepSessionTracker.summarize, or None if baby not found
+        """
+        tracker = self.get_tracker(baby_id)
+        if tracker is None:
+            return None
+        return tracker.summarize(window_end, window_hours)
+
+    def daily_totals(self, baby_id, start_date, end_date):
+        """
+        Total sleep per calendar day for a baby.
+
+        Args:
+            baby_id (str): UUID of baby
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            dict: Mapping of date to minutes asleep, or None if baby not found
+        """
+        tracker = self.get_tracker(baby_id)
+        if tracker is None:
+            return None
+        return tracker.daily_totals(start_date, end_date)
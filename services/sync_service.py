@@ -0,0 +1,389 @@
+# services/sync_service.py
+
+import hashlib
+import json
+import os
+import time
+import uuid
+
+# Directory (under the data directory) holding sync state
+SYNC_DIRNAME = "sync"
+
+# Record lists kept in a baby document, in the order changes are applied
+RECORD_TYPES = ("growth_records", "milestones", "daily_logs")
+
+# Baby fields synced as the baby's own record
+BABY_FIELDS = ("id", "name", "birthdate", "gender", "notes")
+
+
+def _hash_record(record_dict):
+    """Content hash of a stored record dictionary."""
+    return hashlib.sha1(json.dumps(record_dict, sort_keys = True, default = str).encode("utf-8")).hexdigest()
+
+
+def _split_records(baby_dict):
+    """
+    Split a stored baby document into syncable records.
+
+    Returns:
+        dict: Mapping of record key ('<record_type>:<id>') to record dictionary
+    """
+    records = {f"baby:{baby_dict['id']}": {field: baby_dict.get(field) for field in BABY_FIELDS}}
+    for record_type in RECORD_TYPES:
+        for record_dict in baby_dict.get(record_type, []):
+            records[f"{record_type}:{record_dict['id']}"] = record_dict
+    return records
+
+
+class HybridLogicalClock:
+    def __init__(self, node_id, last = None):
+        """
+        Initialize a hybrid logical clock.
+
+        Timestamps are strings '<wall ms>-<counter>-<node id>' that sort in
+        causal order and never tie between nodes.
+
+        Args:
+            node_id (str): ID of this node
+            last (str, optional): Last timestamp issued or seen. Defaults to None.
+        """
+        self.node_id = node_id
+        self.wall, self.counter = self.parse(last) if last else (0, 0)
+
+    @staticmethod
+    def parse(timestamp):
+        """Split a timestamp into (wall ms, counter)."""
+        wall, counter, _ = timestamp.split("-", 2)
+        return int(wall), int(counter)
+
+    def tick(self, physical_ms = None):
+        """
+        Issue a timestamp for a local change.
+
+        Args:
+            physical_ms (int, optional): When the change happened, in ms since the epoch.
+                Defaults to None (now).
+
+        Returns:
+            str: Timestamp greater than any issued or seen before
+        """
+        if physical_ms is None:
+            physical_ms = int(time.time() * 1000)
+        if physical_ms > self.wall:
+            self.wall, self.counter = physical_ms, 0
+        else:
+            self.counter += 1
+        return str(self)
+
+    def observe(self, timestamp):
+        """Advance past a timestamp received from another node."""
+        remote = self.parse(timestamp)
+        if remote > (self.wall, self.counter):
+            self.wall, self.counter = remote
+
+    def __str__(self):
+        return f"{self.wall:015d}-{self.counter:06d}-{self.node_id}"
+
+
+class SyncService:
+    def __init__(self, data_service):
+        """
+        Initialize the SyncService.
+
+        Every record (a baby's own fields, and each growth record, milestone
+        and daily log) carries a hybrid logical clock version. scan() finds
+        babies whose file changed since the last scan (by mtime and size),
+        diffs only those record by record and appends the changes to a
+        journal. Peers pull journal entries after their cursor (a byte offset
+        into the journal), so a sync reads only what changed. Conflicting
+        versions of a record resolve to the highest clock, which every peer
+        computes the same way.
+
+        Args:
+            data_service (DataService): Service for data persistence
+        """
+        self.data_service = data_service
+        self.sync_dir = os.path.join(data_service.data_dir, SYNC_DIRNAME)
+        self.versions_dir = os.path.join(self.sync_dir, "versions")
+        self.journal_path = os.path.join(self.sync_dir, "changes.jsonl")
+        self.state_path = os.path.join(self.sync_dir, "state.json")
+        os.makedirs(self.versions_dir, exist_ok = True)
+
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r') as f:
+                self.state = json.load(f)
+        else:
+            self.state = {"node_id": uuid.uuid4().hex[:12], "clock": None, "cursors": {}}
+        self.clock = HybridLogicalClock(self.state["node_id"], self.state["clock"])
+
+    @property
+    def node_id(self):
+        """ID of this data directory as a sync peer."""
+        return self.state["node_id"]
+
+    def _save_state(self):
+        """Persist the node ID, clock and peer cursors."""
+        self.state["clock"] = str(self.clock)
+        with open(self.state_path + ".tmp", 'w') as f:
+            json.dump(self.state, f)
+        os.replace(self.state_path + ".tmp", self.state_path)
+
+    def _load_versions(self, baby_id):
+        """Load a baby's record versions: {"stamp": [...], "records": {key: version}}."""
+        path = os.path.join(self.versions_dir, f"{baby_id}.json")
+        if not os.path.exists(path):
+            return {"stamp": None, "records": {}}
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _save_versions(self, baby_id, versions):
+        """Persist a baby's record versions."""
+        path = os.path.join(self.versions_dir, f"{baby_id}.json")
+        with open(path + ".tmp", 'w') as f:
+            json.dump(versions, f)
+        os.replace(path + ".tmp", path)
+
+    def _append_journal(self, entries):
+        """Append change entries to the journal."""
+        if not entries:
+            return
+        with open(self.journal_path, 'a') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default = str) + "\n")
+
+    ################## Local changes ##################
+
+    def scan(self):
+        """
+        Record local changes made since the last scan.
+
+        Returns:
+            int: Number of changed records journaled
+        """
+        baby_ids = {os.path.basename(path)[5:-5] for path in self.data_service.iter_baby_file_paths()}
+        tracked_ids = {filename[:-5] for filename in os.listdir(self.versions_dir) if filename.endswith(".json")}
+
+        entries = []
+        for baby_id in sorted(baby_ids | tracked_ids):
+            entries.extend(self._scan_baby(baby_id))
+
+        self._append_journal(entries)
+        self._save_state()
+        return len(entries)
+
+    def _scan_baby(self, baby_id):
+        """Diff one baby against its recorded versions if its file changed."""
+        versions = self._load_versions(baby_id)
+        stamp = self.data_service.get_baby_file_stamp(baby_id)
+        if stamp is not None and versions["stamp"] == list(stamp):
+            return []
+
+        records = versions["records"]
+        entries = []
+
+        if stamp is None:
+            # Deleted baby: one tombstone for the baby removes it everywhere
+            key = f"baby:{baby_id}"
+            if key in records and not records[key]["deleted"]:
+                hlc = self.clock.tick()
+                records[key] = {"hlc": hlc, "hash": None, "deleted": True}
+                entries.append({"hlc": hlc, "baby_id": baby_id, "key": key, "deleted": True, "data": None})
+                self._save_versions(baby_id, versions)
+            return entries
+
+        current = _split_records(self.data_service.load_baby_dict(baby_id))
+        # Date the changes by the file's modification time
+        physical_ms = stamp[0] // 1_000_000
+
+        for key, record_dict in current.items():
+            record_hash = _hash_record(record_dict)
+            version = records.get(key)
+            if version is None or version["hash"] != record_hash:
+                hlc = self.clock.tick(physical_ms)
+                records[key] = {"hlc": hlc, "hash": record_hash, "deleted": False}
+                entries.append({"hlc": hlc, "baby_id": baby_id, "key": key, "deleted": False, "data": record_dict})
+
+        missing = [key for key, version in records.items() if key not in current and not version["deleted"]]
+        if missing:
+            # Logs moved to the archive tier are not deletions
+            archived = {f"daily_logs:{d['id']}" for d in self.data_service.iter_archived_log_dicts(baby_id)}
+            for key in missing:
+                if key in archived:
+                    continue
+                hlc = self.clock.tick(physical_ms)
+                records[key] = {"hlc": hlc, "hash": None, "deleted": True}
+                entries.append({"hlc": hlc, "baby_id": baby_id, "key": key, "deleted": True, "data": None})
+
+        versions["stamp"] = list(stamp)
+        self._save_versions(baby_id, versions)
+        return entries
+
+    ################## Exchange ##################
+
+    def changes_since(self, cursor = 0):
+        """
+        Read journal entries after a cursor.
+
+        Args:
+            cursor (int, optional): Position returned by an earlier call. Defaults to 0.
+
+        Returns:
+            tuple: (list of entries, new cursor)
+        """
+        if not os.path.exists(self.journal_path):
+            return [], cursor
+
+        with open(self.journal_path, 'rb') as f:
+            f.seek(cursor)
+            data = f.read()
+
+        # Only complete lines; a partly written entry is read next time
+        end = data.rfind(b"\n") + 1
+        entries = [json.loads(line) for line in data[:end].splitlines()]
+        return entries, cursor + end
+
+    def apply_changes(self, entries):
+        """
+        Merge change entries from a peer.
+
+        For each record the entry with the highest clock wins, whatever order
+        entries arrive in. Babies are updated in ID order, one save each.
+        Applied entries are journaled so they pass on to further peers.
+
+        Args:
+            entries (list): Entries from a peer's changes_since
+
+        Returns:
+            int: Number of records changed locally
+        """
+        by_baby = {}
+        for entry in entries:
+            self.clock.observe(entry["hlc"])
+            winners = by_baby.setdefault(entry["baby_id"], {})
+            if entry["key"] not in winners or entry["hlc"] > winners[entry["key"]]["hlc"]:
+                winners[entry["key"]] = entry
+
+        applied = []
+        for baby_id in sorted(by_baby):
+            applied.extend(self._apply_baby(baby_id, by_baby[baby_id]))
+
+        self._append_journal(applied)
+        self._save_state()
+        return len(applied)
+
+    def _apply_baby(self, baby_id, winners):
+        """Apply the newest entry per record to one baby."""
+        versions = self._load_versions(baby_id)
+        records = versions["records"]
+        entries = [
+            winners[key] for key in sorted(winners)
+            if key not in records or winners[key]["hlc"] > records[key]["hlc"]
+        ]
+        if not entries:
+            return []
+
+        baby_key = f"baby:{baby_id}"
+        baby_entry = next((entry for entry in entries if entry["key"] == baby_key), None)
+
+        if baby_entry is not None and baby_entry["deleted"]:
+            # The baby was deleted after every other change we know of
+            self.data_service.delete_baby(baby_id)
+            records[baby_key] = {"hlc": baby_entry["hlc"], "hash": None, "deleted": True}
+            versions["stamp"] = None
+            self._save_versions(baby_id, versions)
+            return [baby_entry]
+
+        baby = self.data_service.load_baby(baby_id)
+        if baby_entry is not None:
+            if baby is None:
+                baby = self._baby_from_record(baby_entry["data"])
+            else:
+                self._update_baby_fields(baby, baby_entry["data"])
+
+        if baby is None:
+            # Changes to a baby deleted here
+            return []
+
+        archived_deletes = []
+        for entry in entries:
+            record_type, record_id = entry["key"].split(":", 1)
+            if record_type == "baby":
+                continue
+            record_list = getattr(baby, record_type)
+            record_list[:] = [record for record in record_list if record.id != record_id]
+            if not entry["deleted"]:
+                record_list.append(self._record_from_dict(record_type, entry["data"]))
+            elif record_type == "daily_logs":
+                archived_deletes.append(record_id)
+
+        # A log deleted remotely may live only in the archive tier here
+        self.data_service.delete_archived_logs(baby_id, archived_deletes)
+        self.data_service.save_baby(baby)
+
+        # Hash what was actually stored so the next scan sees no change
+        stored = _split_records(self.data_service.load_baby_dict(baby_id))
+        for entry in entries:
+            records[entry["key"]] = {
+                "hlc": entry["hlc"],
+                "hash": None if entry["deleted"] else _hash_record(stored.get(entry["key"])),
+                "deleted": entry["deleted"]
+            }
+        versions["stamp"] = list(self.data_service.get_baby_file_stamp(baby_id))
+        self._save_versions(baby_id, versions)
+        return entries
+
+    def _record_from_dict(self, record_type, record_dict):
+        """Build a record of the given type from its stored dictionary."""
+        from_dict = {
+            "growth_records": self.data_service.growth_record_from_dict,
+            "milestones": self.data_service.milestone_from_dict,
+            "daily_logs": self.data_service.daily_log_from_dict
+        }[record_type]
+        return from_dict(record_dict)
+
+    def _baby_from_record(self, baby_record):
+        """Build a baby with no records from its synced fields."""
+        return self.data_service.baby_from_dict(dict(baby_record, growth_records = [], milestones = [], daily_logs = []))
+
+    def _update_baby_fields(self, baby, baby_record):
+        """Copy synced fields onto an existing baby."""
+        updated = self._baby_from_record(baby_record)
+        baby.name = updated.name
+        baby.birthdate = updated.birthdate
+        baby.gender = updated.gender
+        baby.notes = updated.notes
+
+    ################## Peers ##################
+
+    def pull(self, peer):
+        """
+        Merge a peer's changes made since the last pull from it.
+
+        Args:
+            peer (SyncService): Peer to pull from
+
+        Returns:
+            int: Number of records changed locally
+        """
+        cursor = self.state["cursors"].get(peer.node_id, 0)
+        entries, cursor = peer.changes_since(cursor)
+        applied = self.apply_changes(entries)
+        self.state["cursors"][peer.node_id] = cursor
+        self._save_state()
+        return applied
+
+    def sync_with(self, peer):
+        """
+        Two-way sync with another peer.
+
+        Args:
+            peer (SyncService): Peer to sync with
+
+        Returns:
+            dict: Records changed on each side: {"pulled": n, "pushed": n}
+        """
+        self.scan()
+        peer.scan()
+        pulled = self.pull(peer)
+        pushed = peer.pull(self)
+        return {"pulled": pulled, "pushed": pushed}
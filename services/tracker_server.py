@@ -0,0 +1,251 @@
+# services/tracker_server.py
+
+import hmac
+import http.client
+import ipaddress
+import json
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Seconds an idle keep-alive connection may hold a worker
+IDLE_TIMEOUT = 5
+
+# Environment variable holding the shared token for servers and clients
+TOKEN_ENV = "TRACKER_TOKEN"
+
+
+def _is_loopback(host):
+    """Check whether a listen address only accepts local connections."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class ReadWriteLock:
+    def __init__(self):
+        """
+        Initialize a lock that lets readers share access and gives writers exclusive access.
+
+        Waiting writers block new readers, so a stream of reads cannot starve them.
+        """
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.waiting_writers = 0
+
+    @contextmanager
+    def reading(self):
+        """Hold the lock for reading."""
+        with self.condition:
+            while self.writer or self.waiting_writers:
+                self.condition.wait()
+            self.readers += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.readers -= 1
+                if not self.readers:
+                    self.condition.notify_all()
+
+    @contextmanager
+    def writing(self):
+        """Hold the lock for writing."""
+        with self.condition:
+            self.waiting_writers += 1
+            while self.writer or self.readers:
+                self.condition.wait()
+            self.waiting_writers -= 1
+            self.writer = True
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.writer = False
+                self.condition.notify_all()
+
+
+class _TrackerRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests
+    protocol_version = "HTTP/1.1"
+    timeout = IDLE_TIMEOUT
+
+    def handle_one_request(self):
+        """Serve one request, then give the worker up if other connections are waiting."""
+        super().handle_one_request()
+        if self.server.saturated():
+            self.close_connection = True
+
+    def do_POST(self):
+        """Run a command sent as {"argv": [...]} and reply with its JSON result."""
+        if self.path != "/command":
+            self._reply(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        token = self.server.token
+        if token is not None and not hmac.compare_digest(self.headers.get("Authorization", ""), f"Bearer {token}"):
+            self._reply(401, {"error": "Invalid or missing token"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            argv = json.loads(self.rfile.read(length) or b"{}").get("argv")
+            if not isinstance(argv, list):
+                raise ValueError("Request body must be a JSON object with an 'argv' list")
+        except ValueError as e:
+            self._reply(400, {"error": str(e)})
+            return
+
+        self._reply(200, self.server.run_command(argv))
+
+    def _reply(self, status, result):
+        """Send a JSON response."""
+        body = json.dumps(result, default = str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep request logging off stdout/stderr."""
+
+
+class TrackerServer(HTTPServer):
+    def __init__(self, address, data_dir = "data", workers = 8, token = None):
+        """
+        Initialize a local tracker server.
+
+        The server owns one cached DataService, so every client reads from
+        the same warm in-memory copy of the data directory. Connections are
+        handled by a fixed pool of worker threads; reads run concurrently
+        and commands that modify data run alone, so readers never see a
+        cached baby while it is being changed. Connections that go idle
+        are closed after IDLE_TIMEOUT seconds, or after their current
+        request when every worker is busy.
+
+        Only data commands are served; commands that read or write paths
+        on the server (import, export, backups, ...) are refused.
+
+        Args:
+            address (tuple): (host, port) to listen on; port 0 picks a free port
+            data_dir (str, optional): Directory where data is stored. Defaults to "data".
+            workers (int, optional): Number of worker threads. Defaults to 8.
+            token (str, optional): Token clients must send as a bearer token. Defaults to None
+                (no token; only allowed on a loopback address).
+        """
+        from utils.app_context import AppContext
+        from views.command_view import CommandView
+
+        if token is None and not _is_loopback(address[0]):
+            raise ValueError("A token is required to listen on a non-loopback address")
+
+        self.token = token
+        self.workers = workers
+        self.command_view = CommandView(data_dir, context = AppContext(data_dir, cached = True))
+        self.lock = ReadWriteLock()
+        self.executor = ThreadPoolExecutor(max_workers = workers)
+        self.connections = 0
+        self.connections_lock = threading.Lock()
+
+        # Warm the cache and the search index before accepting clients
+        self.command_view.context.baby_controller.get_all_babies()
+        self.command_view.context.search_service.search()
+
+        super().__init__(address, _TrackerRequestHandler)
+
+    def run_command(self, argv):
+        """
+        Run a command against the shared context.
+
+        Args:
+            argv (list): Command arguments as accepted by CommandView
+
+        Returns:
+            object: JSON-serializable result
+        """
+        return self.command_view.call(argv, self.lock, remote = True)
+
+    def saturated(self):
+        """Check whether connections are waiting for a worker."""
+        return self.connections > self.workers
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool."""
+        with self.connections_lock:
+            self.connections += 1
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        """Serve one connection (possibly many keep-alive requests) on a worker thread."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self.connections_lock:
+                self.connections -= 1
+
+    def server_close(self):
+        """Stop listening and wait for in-flight requests."""
+        super().server_close()
+        self.executor.shutdown(wait = True)
+
+
+class TrackerClient:
+    def __init__(self, address, token = None):
+        """
+        Initialize a client for a TrackerServer.
+
+        A single keep-alive connection is reused for every call.
+
+        Args:
+            address (str): Server address as 'host:port'
+            token (str, optional): Server token. Defaults to None (the TRACKER_TOKEN
+                environment variable, if set).
+        """
+        host, _, port = address.rpartition(":")
+        self.host = host or "127.0.0.1"
+        self.port = int(port)
+        self.token = token or os.environ.get(TOKEN_ENV)
+        self.connection = None
+
+    def call(self, argv):
+        """
+        Run a command on the server.
+
+        Args:
+            argv (list): Command arguments, e.g. ["baby", "list"]
+
+        Returns:
+            object: Command result; a dict with an 'error' key on failure
+        """
+        body = json.dumps({"argv": list(argv)})
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        # Retry once on a fresh connection if the server dropped an idle one
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port)
+            try:
+                self.connection.request("POST", "/command", body, headers)
+                return json.loads(self.connection.getresponse().read())
+            except (http.client.HTTPException, ConnectionError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        """Close the connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,96 @@
+# tests/test_controllers/test_batch_add.py
+
+import pytest
+from datetime import date, datetime, time
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from controllers.growth_controller import GrowthController
+from controllers.milestone_controller import MilestoneController
+from services.data_service import DataService
+
+class TestBatchAdd:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Data service backed by a temporary directory."""
+        return DataService(str(tmp_path))
+
+    @pytest.fixture
+    def baby(self, data_service):
+        """A saved baby."""
+        return BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+
+    def test_add_logs(self, data_service, baby):
+        """Test adding heterogeneous logs in one batch."""
+        # Setup
+        controller = DailyLogController(data_service)
+        entries = [
+            {"log_type": "feeding", "date": "2023-02-01", "time": "08:30", "feeding_type": "bottle", "amount": 120},
+            {"log_type": "sleep", "date": "2023-02-01", "start_time": "09:00", "end_time": "10:30", "quality": "good"},
+            {"log_type": "diaper", "date": "2023-02-01", "time": "11:00", "diaper_type": "wet", "notes": "rash"},
+        ]
+        
+        # Execute
+        logs = controller.add_logs(baby.id, entries)
+        
+        # Assert
+        assert [log.log_type for log in logs] == ["feeding", "sleep", "diaper"]
+        assert logs[1].end_time == time(10, 30)
+        
+        loaded = data_service.load_baby(baby.id)
+        assert [log.id for log in loaded.daily_logs] == [log.id for log in logs]
+        assert loaded.daily_logs[0].date == date(2023, 2, 1)
+
+    def test_add_logs_invalid_entry_saves_nothing(self, data_service, baby):
+        """Test that a bad entry rejects the whole batch."""
+        controller = DailyLogController(data_service)
+        entries = [
+            {"log_type": "feeding", "date": "2023-02-01", "time": "08:30", "feeding_type": "bottle"},
+            {"log_type": "bath", "date": "2023-02-01", "time": "09:00"},
+        ]
+        
+        with pytest.raises(ValueError):
+            controller.add_logs(baby.id, entries)
+        
+        assert data_service.load_baby(baby.id).daily_logs == []
+
+    def test_add_logs_unknown_baby(self, data_service):
+        """Test adding logs to a missing baby."""
+        entries = [{"log_type": "diaper", "date": "2023-02-01", "time": "11:00", "diaper_type": "wet"}]
+        
+        assert DailyLogController(data_service).add_logs("missing", entries) is None
+
+    def test_add_growth_records(self, data_service, baby):
+        """Test adding growth records in one batch."""
+        records = GrowthController(data_service).add_growth_records(baby.id, [
+            {"date": "2023-02-01", "weight": 4.2},
+            {"date": datetime(2023, 3, 1), "weight": 5.0, "height": 56.0},
+        ])
+        
+        assert len(records) == 2
+        assert [r.weight for r in GrowthController(data_service).get_growth_records(baby.id)] == [4.2, 5.0]
+
+    def test_add_milestones(self, data_service, baby):
+        """Test adding milestones in one batch."""
+        milestones = MilestoneController(data_service).add_milestones(baby.id, [
+            {"name": "Smiles", "category": "social", "achieved_date": "2023-02-15"},
+            {"name": "Rolls over", "category": "physical", "expected_range": {"min_months": 3, "max_months": 7}},
+        ])
+        
+        assert milestones[0].achieved_date == datetime(2023, 2, 15)
+        assert len(data_service.load_baby(baby.id).milestones) == 2
+
+    def test_add_milestones_notifies_listeners(self, data_service, baby):
+        """Test that a milestone batch reaches the controller's listeners once."""
+        # Setup
+        controller = MilestoneController(data_service)
+        calls = []
+        controller.add_listener(lambda baby_id, milestones, removed_ids: calls.append((baby_id, milestones, removed_ids)))
+        
+        # Execute
+        milestones = controller.add_milestones(baby.id, [
+            {"name": "Smiles", "category": "social"},
+            {"name": "Laughs", "category": "social"},
+        ])
+        
+        # Assert
+        assert calls == [(baby.id, milestones, [])]
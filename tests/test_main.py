@@ -0,0 +1,55 @@
+# tests/test_main.py
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs main() with the given arguments, then reports which heavy modules were imported
+_PROBE = """
+import json, sys
+sys.argv = ["main.py"] + sys.argv[1:]
+import main
+try:
+    main.main()
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps({name: name in sys.modules for name in ("views.dashboard_view", "PySide6")}))
+"""
+
+class TestMain:
+    def run(self, cwd, *argv):
+        """Run main.py in a fresh interpreter and return the completed process."""
+        env = dict(os.environ, PYTHONPATH = ROOT)
+        return subprocess.run([sys.executable, "-c", _PROBE, *argv], cwd = cwd, env = env,
+                              capture_output = True, text = True, timeout = 60)
+
+    def test_command_skips_gui_modules(self, tmp_path):
+        """Test that a plain command imports neither the dashboard nor the desktop toolkit."""
+        # Execute
+        result = self.run(tmp_path, "--data-dir", str(tmp_path / "data"), "baby", "list")
+
+        # Assert
+        assert json.loads(result.stdout) == []
+        assert json.loads(result.stderr) == {"views.dashboard_view": False, "PySide6": False}
+
+    def test_startup_timing_leaves_no_data_dir(self, tmp_path):
+        """Test that --startup-timing does not create a data directory in the working directory."""
+        # Execute
+        result = self.run(tmp_path, "--startup-timing")
+
+        # Assert
+        assert "time to first menu" in result.stderr
+        assert not (tmp_path / "data").exists()
+
+    def test_startup_timing_uses_data_dir(self, tmp_path):
+        """Test that --startup-timing starts against the given data directory."""
+        # Execute
+        result = self.run(tmp_path, "--startup-timing", "--data-dir", str(tmp_path / "other"))
+
+        # Assert
+        assert "time to first menu" in result.stderr
+        assert (tmp_path / "other").exists()
+        assert not (tmp_path / "data").exists()
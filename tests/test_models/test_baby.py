@@ -45,7 +45,8 @@ class TestBaby:
         # Assert
         assert age["years"] == 1
         assert age["months"] == 1
-        assert age["days"] == 15
+        assert age["days"] == 14 # Calendar months: 2024-02-01 to 2024-02-15
+        assert age["total_months"] == 13
         assert age["total_days"] == 410 # 365 + 31 + 14
         
     def test_add_growth_record(self):
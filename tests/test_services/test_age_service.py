@@ -0,0 +1,64 @@
+# tests/test_services/test_age_service.py
+
+from datetime import date, datetime
+from models.milestone import Milestone
+from services.age_service import CACHED_DAYS, AgeService
+from utils.date_utils import add_months, months_between
+
+class TestAgeService:
+    def test_calendar_months(self):
+        """Test month arithmetic across short months and leap years."""
+        assert add_months(date(2023, 1, 31), 1) == date(2023, 2, 28)
+        assert add_months(date(2024, 1, 31), 1) == date(2024, 2, 29)
+        assert months_between(date(2023, 1, 31), date(2023, 2, 27)) == 0
+        assert months_between(date(2023, 1, 31), date(2023, 2, 28)) == 1
+        assert months_between(date(2023, 1, 15), date(2024, 1, 14)) == 11
+        assert months_between(date(2023, 1, 15), date(2024, 1, 15)) == 12
+
+    def test_age(self):
+        """Test years, months and days against the calendar."""
+        # Setup
+        age_service = AgeService()
+        
+        # Execute
+        age = age_service.age(datetime(2023, 3, 31), date(2024, 5, 1))
+        
+        # Assert
+        assert (age["years"], age["months"], age["days"]) == (1, 1, 1)
+        assert age["total_months"] == 13
+        assert age["total_days"] == 397
+
+    def test_batch_and_cache(self):
+        """Test batch results keep input order and are cached per day."""
+        # Setup
+        age_service = AgeService()
+        pairs = [
+            (date(2023, 1, 1), date(2023, 7, 1)),
+            (date(2023, 6, 1), date(2023, 7, 1)),
+            (date(2023, 1, 1), date(2023, 8, 1)),
+        ]
+        
+        # Execute
+        ages = age_service.batch(pairs)
+        
+        # Assert
+        assert [age["total_months"] for age in ages] == [6, 1, 7]
+        assert len(age_service.cache[date(2023, 7, 1)]) == 2
+        ages[0]["years"] = 99
+        assert age_service.age(date(2023, 1, 1), date(2023, 7, 1))["years"] == 0
+        for day in range(1, CACHED_DAYS + 2):
+            age_service.age(date(2023, 1, 1), date(2023, 9, day))
+        assert len(age_service.cache) == CACHED_DAYS
+
+    def test_milestone_uses_calendar_months(self):
+        """Test that milestone screening counts calendar months."""
+        # Setup
+        birthdate = datetime(2023, 1, 31)
+        expected_range = {"min_months": 1, "max_months": 2}
+        
+        # Execute
+        milestone = Milestone("id", "m", "physical", datetime(2023, 2, 28), expected_range)
+        
+        # Assert
+        assert milestone.age_at_achievement(birthdate) == 1
+        assert milestone.achievement_status(birthdate) == "on_time"
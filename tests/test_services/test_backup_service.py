@@ -0,0 +1,103 @@
+# tests/test_services/test_backup_service.py
+
+import os
+import pytest
+from datetime import date, datetime, timedelta
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.backup_service import BackupService, split_chunks
+from services.data_service import DataService
+
+class TestBackupService:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create two babies, one with a long log history."""
+        data_service = DataService(str(tmp_path / "data"))
+        baby_controller = BabyController(data_service)
+        log_controller = DailyLogController(data_service)
+        first = baby_controller.create_baby("First Baby", "2023-01-01")
+        second = baby_controller.create_baby("Second Baby", "2023-02-01")
+        log_controller.add_logs(first.id, [
+            {"log_type": "diaper", "date": (date(2023, 1, 2) + timedelta(days = day)).isoformat(),
+             "time": "09:00", "diaper_type": "wet"}
+            for day in range(300)
+        ])
+        service = BackupService(data_service, str(tmp_path / "backups"))
+        return data_service, log_controller, service, first, second
+
+    def test_split_chunks(self):
+        """Test that chunks reassemble and an edit leaves distant chunks unchanged."""
+        # Setup
+        data = b"".join(f'    "line {number}",\n'.encode() for number in range(20000))
+        edited = data.replace(b'"line 10000"', b'"line ten thousand"')
+
+        # Execute
+        chunks = split_chunks(data)
+        edited_chunks = split_chunks(edited)
+
+        # Assert
+        assert b"".join(chunks) == data
+        assert len(chunks) > 10
+        assert len(set(edited_chunks) - set(chunks)) <= 2
+
+    def test_incremental_backup(self, setup):
+        """Test that a second backup only reads the changed file and stores few chunks."""
+        # Setup
+        data_service, log_controller, service, first, second = setup
+        full = service.backup()
+        log_controller.add_logs(second.id, [{"log_type": "diaper", "date": "2023-02-02", "time": "09:00", "diaper_type": "dirty"}])
+
+        # Execute
+        incremental = service.backup()
+
+        # Assert
+        assert full["files"] == incremental["files"] == 2
+        assert incremental["changed_files"] == 1
+        assert 0 < incremental["new_chunks"] < full["new_chunks"]
+        assert len(service.list_snapshots()) == 2
+
+    def test_restore_baby_point_in_time(self, setup):
+        """Test that a baby is restored as of an earlier snapshot."""
+        # Setup
+        data_service, log_controller, service, first, second = setup
+        snapshot = service.backup()["snapshot"]
+        before = datetime.now()
+        log_controller.add_logs(first.id, [{"log_type": "diaper", "date": "2024-01-01", "time": "09:00", "diaper_type": "wet"}])
+        service.backup()
+
+        # Execute
+        result = service.restore_baby(first.id, as_of = before)
+
+        # Assert
+        assert result["snapshot"] == snapshot
+        assert len(data_service.load_baby(first.id).daily_logs) == 300
+
+    def test_restore_all(self, setup, tmp_path):
+        """Test that a whole snapshot restores into an empty directory."""
+        # Setup
+        data_service, log_controller, service, first, second = setup
+        data_service.archive_daily_logs(first.id, 30, today = date(2023, 12, 31))
+        service.backup()
+        target = str(tmp_path / "restored")
+
+        # Execute
+        result = service.restore_all(target)
+
+        # Assert
+        assert result["files"] == 2 + len(os.listdir(os.path.join(data_service.data_dir, "archive", first.id)))
+        restored = DataService(target)
+        assert {baby.name for baby in restored.load_all_babies()} == {"First Baby", "Second Baby"}
+        assert len(restored.load_daily_logs(first.id)) == 300
+        with pytest.raises(ValueError):
+            service.restore_all(target)
+
+    def test_restore_missing(self, setup):
+        """Test that restoring without a matching snapshot returns None."""
+        # Setup
+        data_service, log_controller, service, first, second = setup
+
+        # Execute / Assert
+        assert service.restore_baby(first.id) is None
+        service.backup()
+        assert service.restore_baby("nonexistent") is None
+        assert service.restore_baby(first.id, as_of = datetime(2000, 1, 1)) is None
@@ -0,0 +1,159 @@
+# tests/test_services/test_change_feed.py
+
+import pytest
+from datetime import date
+from services.data_service import DataService
+from utils.app_context import AppContext
+
+class TestChangeFeed:
+    @pytest.fixture
+    def context(self, tmp_path):
+        """Create a context whose DataService records changes."""
+        context = AppContext(str(tmp_path))
+        context.events = []
+        context.data_service.subscribe_changes(context.events.append)
+        return context
+
+    def test_events_for_each_record(self, context):
+        """Test create, update and delete events with increasing sequence numbers."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        record = context.growth_controller.add_growth_record(baby.id, "2023-02-01", weight = 4.2)
+        
+        # Execute
+        context.growth_controller.update_growth_record(baby.id, record.id, weight = 4.3)
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        context.growth_controller.delete_growth_record(baby.id, record.id)
+        
+        # Assert
+        summary = [(event.action, event.record_type) for event in context.events]
+        assert summary == [
+            ("create", "baby"),
+            ("create", "growth_record"),
+            ("update", "growth_record"),
+            ("create", "daily_log"),
+            ("delete", "growth_record"),
+        ]
+        assert [event.seq for event in context.events] == [1, 2, 3, 4, 5]
+        assert context.events[2].data["weight"] == 4.3
+        assert context.events[4].record_id == record.id
+
+    def test_delete_baby(self, context):
+        """Test that deleting a baby emits a delete for each record, the baby last."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        del context.events[:]
+        
+        # Execute
+        context.baby_controller.delete_baby(baby.id)
+        
+        # Assert
+        assert [(event.action, event.record_type) for event in context.events] == [
+            ("delete", "daily_log"), ("delete", "baby")
+        ]
+
+    def test_cursor_resumes(self, context):
+        """Test that a committed cursor resumes after its last event, across processes."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        cursor = context.data_service.change_feed.cursor("exporter")
+        first = cursor.poll()
+        cursor.commit()
+        
+        # Execute
+        other = AppContext(context.data_dir)
+        other.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        resumed = context.data_service.change_feed.cursor("exporter").poll()
+        
+        # Assert
+        assert [event.seq for event in first] == [1]
+        assert [(event.seq, event.record_type) for event in resumed] == [(2, "daily_log")]
+
+    def test_archiving_is_not_a_delete(self, context):
+        """Test that moving logs to the archive tier emits no delete events."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-01-02", "09:00", "wet")
+        del context.events[:]
+        
+        # Execute
+        context.data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        
+        # Assert
+        assert context.events == []
+
+    def test_disabled_by_default(self, tmp_path):
+        """Test that a plain DataService has no change feed."""
+        with pytest.raises(ValueError):
+            DataService(str(tmp_path)).subscribe_changes(print)
+
+    def test_torn_tail_is_truncated(self, context):
+        """Test that a partially written last entry is dropped before the next append."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        with open(context.data_service.change_feed.feed_path, 'ab') as f:
+            f.write(b'{"seq": 2, "action": "cre')
+
+        # Execute
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        events = context.data_service.change_feed.cursor("reader").poll()
+
+        # Assert
+        assert [(event.seq, event.record_type) for event in events] == [(1, "baby"), (2, "daily_log")]
+
+    def test_compaction_keeps_cursors(self, context, monkeypatch):
+        """Test that compaction drops old events and cursors resume by sequence number."""
+        # Setup
+        monkeypatch.setattr("services.change_feed.FEED_RETAIN_EVENTS", 2)
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        cursor = context.data_service.change_feed.cursor("reader")
+        cursor.poll()
+        cursor.commit()
+
+        # Execute
+        for hour in range(8, 13):
+            context.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", f"{hour:02d}:00", "wet")
+        resumed = context.data_service.change_feed.cursor("reader").poll()
+        fresh = context.data_service.change_feed.cursor("fresh").poll()
+
+        # Assert
+        assert [event.seq for event in resumed] == [4, 5, 6]
+        assert [event.seq for event in fresh] == [4, 5, 6]
+
+    def test_save_reads_no_archive(self, context, monkeypatch):
+        """Test that a save after archiving neither reads the archive nor rehashes unchanged records."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        for day in range(2, 5):
+            context.daily_log_controller.add_diaper_log(baby.id, f"2023-0{day}-01", "09:00", "wet")
+        context.data_service.archive_daily_logs(baby.id, 30, today = date(2023, 6, 1))
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-05-20", "09:00", "wet")
+        reads = []
+        hashed = []
+        monkeypatch.setattr(context.data_service, "_read_archive_segment", lambda *args: reads.append(args))
+        monkeypatch.setattr("services.change_feed._hash_record", lambda record_dict: hashed.append(record_dict) or "hash")
+        del context.events[:]
+        
+        # Execute
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-05-21", "09:00", "wet")
+        
+        # Assert
+        assert reads == []
+        assert len(hashed) == 1
+        assert [(event.action, event.record_type) for event in context.events] == [("create", "daily_log")]
+
+    def test_archived_log_delete(self, context):
+        """Test that removing a log from the archive emits a delete event."""
+        # Setup
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        log = context.daily_log_controller.add_diaper_log(baby.id, "2023-01-02", "09:00", "wet")
+        context.data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        del context.events[:]
+        
+        # Execute
+        context.data_service.delete_archived_logs(baby.id, [log.id])
+        context.data_service.save_baby(context.data_service.load_baby(baby.id))
+        
+        # Assert
+        assert [(event.action, event.record_id) for event in context.events] == [("delete", log.id)]
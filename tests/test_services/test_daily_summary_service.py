@@ -0,0 +1,82 @@
+# tests/test_services/test_daily_summary_service.py
+
+import pytest
+from datetime import date
+from utils.app_context import AppContext
+
+class TestDailySummaryService:
+    @pytest.fixture
+    def context(self, tmp_path):
+        """Create an application context with one baby."""
+        context = AppContext(str(tmp_path))
+        context.baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        return context
+
+    def test_aggregates_history(self, context):
+        """Test per-day totals built from existing logs, splitting sleep at midnight."""
+        # Setup
+        log_controller = context.daily_log_controller
+        log_controller.add_feeding_log(context.baby.id, "2023-02-01", "08:00", "bottle", amount = 4, duration = 15)
+        log_controller.add_feeding_log(context.baby.id, "2023-02-01", "11:00", "bottle", amount = 5)
+        log_controller.add_diaper_log(context.baby.id, "2023-02-01", "09:00", "wet")
+        log_controller.add_sleep_log(context.baby.id, "2023-02-01", "22:00", "02:00")
+
+        # Execute
+        days = context.daily_summary_service.get_days(context.baby.id, date(2023, 2, 1), date(2023, 2, 2))
+
+        # Assert
+        assert days[date(2023, 2, 1)]["feedings"] == 2
+        assert days[date(2023, 2, 1)]["feeding_amount"] == 9
+        assert days[date(2023, 2, 1)]["feeding_minutes"] == 15
+        assert days[date(2023, 2, 1)]["diapers"] == 1
+        assert days[date(2023, 2, 1)]["diapers_wet"] == 1
+        assert days[date(2023, 2, 1)]["sleeps"] == 1
+        assert days[date(2023, 2, 1)]["sleep_minutes"] == 120
+        assert days[date(2023, 2, 2)]["sleeps"] == 0
+        assert days[date(2023, 2, 2)]["sleep_minutes"] == 120
+
+    def test_publishes_deltas(self, context):
+        """Test that controller writes update the aggregates and reach subscribers."""
+        # Setup
+        summary_service = context.daily_summary_service
+        assert summary_service.get_day(context.baby.id, date(2023, 2, 1))["feedings"] == 0
+        deltas = []
+        summary_service.subscribe(lambda baby_id, delta: deltas.append(delta))
+
+        # Execute
+        context.daily_log_controller.add_feeding_log(context.baby.id, "2023-02-01", "08:00", "bottle", amount = 4)
+        record = context.growth_controller.add_growth_record(context.baby.id, "2023-02-01", weight = 4.2)
+        context.growth_controller.delete_growth_record(context.baby.id, record.id)
+
+        # Assert
+        assert summary_service.get_day(context.baby.id, date(2023, 2, 1))["feedings"] == 1
+        assert deltas[0] == {"days": {date(2023, 2, 1): {"feedings": 1, "feeding_amount": 4, "feeding_minutes": 0}}}
+        assert deltas[1]["growth"][0]["weight"] == 4.2
+        assert deltas[2] == {"growth": [], "removed": [record.id]}
+        assert summary_service.get_growth(context.baby.id) == []
+
+    def test_missing_baby(self, context):
+        """Test that an unknown baby returns None."""
+        assert context.daily_summary_service.get_day("missing", date(2023, 2, 1)) is None
+
+    def test_follows_saves_outside_controllers(self, context):
+        """Test that imports and baby deletes reach the aggregates through the change feed."""
+        # Setup
+        from services.import_service import ImportService
+        summary_service = context.daily_summary_service
+        assert summary_service.get_day(context.baby.id, date(2023, 2, 1))["diapers"] == 0
+        deltas = []
+        summary_service.subscribe(lambda baby_id, delta: deltas.append(delta))
+
+        # Execute
+        ImportService(context.data_service).import_rows([
+            {"record_type": "diaper", "baby_id": context.baby.id, "date": "2023-02-01", "time": "09:00", "diaper_type": "wet"},
+        ])
+        imported = summary_service.get_day(context.baby.id, date(2023, 2, 1))
+        context.baby_controller.delete_baby(context.baby.id)
+
+        # Assert
+        assert imported["diapers"] == 1
+        assert deltas[0] == {"days": {date(2023, 2, 1): {"diapers": 1, "diapers_wet": 1}}}
+        assert deltas[-1] == {"reset": True}
+        assert summary_service.get_day(context.baby.id, date(2023, 2, 1)) is None
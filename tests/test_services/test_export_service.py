@@ -0,0 +1,61 @@
+# tests/test_services/test_export_service.py
+
+import csv
+import gzip
+import json
+import pytest
+from datetime import date, datetime, time
+from models.baby import Baby
+from models.feeding_log import FeedingLog
+from models.growth_record import GrowthRecord
+from models.milestone import Milestone
+from services.data_service import DataService
+from services.export_service import ExportService
+
+class TestExportService:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Data service with one baby holding one record of each type."""
+        data_service = DataService(str(tmp_path / "data"))
+        
+        baby = Baby("Test Baby", datetime(2023, 1, 1))
+        baby.add_growth_record(GrowthRecord(baby.id, datetime(2023, 2, 1), 4.2))
+        baby.add_milestone(Milestone(baby.id, "Smiles", "social", datetime(2023, 2, 15), {"min_months": 1, "max_months": 3}))
+        baby.add_daily_log(FeedingLog(baby.id, date(2023, 2, 1), time(8, 30), "bottle", 120))
+        data_service.save_baby(baby)
+        
+        return data_service
+
+    def test_export_csv(self, data_service, tmp_path):
+        """Test exporting to plain CSV files."""
+        # Execute
+        result = ExportService(data_service).export_all(str(tmp_path / "export"))
+        
+        # Assert
+        assert {record_type: count for record_type, (_, count) in result.items()} == {
+            "babies": 1, "growth_records": 1, "milestones": 1, "daily_logs": 1
+        }
+        
+        with open(result["milestones"][0], newline = '') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["name"] == "Smiles"
+        assert rows[0]["min_months"] == "1"
+        
+        with open(result["daily_logs"][0], newline = '') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["feeding_type"] == "bottle"
+        assert rows[0]["time"] == "08:30:00"
+
+    def test_export_jsonl_compressed(self, data_service, tmp_path):
+        """Test exporting to gzipped JSONL files."""
+        # Execute
+        result = ExportService(data_service).export_all(str(tmp_path / "export"), "jsonl", compress = True)
+        
+        # Assert
+        path, count = result["growth_records"]
+        assert path.endswith("growth_records.jsonl.gz")
+        
+        with gzip.open(path, 'rt') as f:
+            records = [json.loads(line) for line in f]
+        assert count == 1
+        assert records[0]["weight"] == 4.2
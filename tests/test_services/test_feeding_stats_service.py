@@ -0,0 +1,94 @@
+# tests/test_services/test_feeding_stats_service.py
+
+from datetime import datetime
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.data_service import DataService
+from services.feeding_stats_service import FeedingStats, FeedingStatsService
+from utils.app_context import AppContext
+
+class TestFeedingStats:
+    def test_interval_statistics(self):
+        """Test rolling interval statistics."""
+        # Setup
+        stats = FeedingStats(window_size = 3, alpha = 0.5)
+        
+        # Execute
+        for hour in (0, 2, 5, 9, 11):
+            stats.add_feed(datetime(2023, 2, 1, hour))
+        
+        # Assert
+        assert list(stats.intervals) == [180, 240, 120]
+        assert stats.mean_interval == 180
+        assert stats.median_interval == 180
+        assert stats.ewma == 157.5 # 120 -> 150 -> 195 -> 157.5 with alpha 0.5
+        assert stats.last_feed == datetime(2023, 2, 1, 11)
+
+    def test_older_feed_ignored(self):
+        """Test that backfilled feeds do not disturb the statistics."""
+        stats = FeedingStats()
+        stats.add_feed(datetime(2023, 2, 1, 8))
+        stats.add_feed(datetime(2023, 2, 1, 11))
+        stats.add_feed(datetime(2023, 2, 1, 9))
+        
+        assert stats.last_feed == datetime(2023, 2, 1, 11)
+        assert list(stats.intervals) == [180]
+
+    def test_predict_next_feed(self, tmp_path):
+        """Test last/next feed queries stay current as feeds are added."""
+        # Setup
+        data_service = DataService(str(tmp_path), change_feed = True)
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        service = FeedingStatsService(data_service)
+        data_service.subscribe_changes(service.on_change)
+        
+        log_controller.add_feeding_log(baby.id, "2023-02-01", "06:00", "bottle")
+        assert service.predict_next_feed(baby.id) is None
+        
+        # Execute
+        log_controller.add_feeding_log(baby.id, "2023-02-01", "09:00", "bottle")
+        
+        # Assert
+        assert service.get_last_feed(baby.id) == datetime(2023, 2, 1, 9)
+        assert service.predict_next_feed(baby.id) == datetime(2023, 2, 1, 12)
+
+    def test_context_service_follows_changes(self, tmp_path):
+        """Test that the context's service applies new feeds and rebuilds after a delete."""
+        # Setup
+        context = AppContext(str(tmp_path))
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "06:00", "bottle")
+        service = context.feeding_stats_service
+        assert service.get_last_feed(baby.id) == datetime(2023, 2, 1, 6)
+
+        # Execute
+        log = context.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "09:00", "bottle")
+        added = service.get_last_feed(baby.id)
+        stored = context.data_service.load_baby(baby.id)
+        stored.daily_logs = [entry for entry in stored.daily_logs if entry.id != log.id]
+        context.data_service.save_baby(stored)
+
+        # Assert
+        assert added == datetime(2023, 2, 1, 9)
+        assert service.get_last_feed(baby.id) == datetime(2023, 2, 1, 6)
+
+    def test_backfilled_feed_edit_keeps_stats(self, tmp_path):
+        """Test that editing a feed the statistics ignored does not rebuild them."""
+        # Setup
+        context = AppContext(str(tmp_path))
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "08:00", "bottle")
+        context.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "11:00", "bottle")
+        service = context.feeding_stats_service
+        stats = service.get_stats(baby.id)
+        log = context.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "09:00", "bottle")
+
+        # Execute
+        stored = context.data_service.load_baby(baby.id)
+        stored.daily_logs = [entry for entry in stored.daily_logs if entry.id != log.id]
+        context.data_service.save_baby(stored)
+
+        # Assert
+        assert log.id not in service.applied_ids[baby.id]
+        assert service.get_stats(baby.id) is stats
@@ -0,0 +1,86 @@
+# tests/test_services/test_heatmap_service.py
+
+import pytest
+from datetime import date
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.data_service import DataService
+from services.heatmap_service import HeatmapService
+
+# Wednesday of the open week in these tests
+TODAY = date(2023, 3, 15)
+
+class TestHeatmapService:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create a baby with logs in a closed week and the open week."""
+        data_service = DataService(str(tmp_path), change_feed = True)
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        log_controller.add_logs(baby.id, [
+            # Monday 2023-03-06
+            {"log_type": "feeding", "date": "2023-03-06", "time": "22:10", "feeding_type": "bottle", "amount": 120},
+            {"log_type": "feeding", "date": "2023-03-06", "time": "22:40", "feeding_type": "bottle", "amount": 90},
+            {"log_type": "diaper", "date": "2023-03-07", "time": "08:05", "diaper_type": "wet"},
+            # Sunday 23:30 to Monday 01:15, across the week boundary
+            {"log_type": "sleep", "date": "2023-03-12", "start_time": "23:30", "end_time": "01:15"},
+        ])
+        service = HeatmapService(data_service)
+        data_service.subscribe_changes(service.on_change)
+        return data_service, log_controller, service, baby
+
+    def test_bins_events(self, setup):
+        """Test that events land in their weekday and hour cells."""
+        # Setup
+        data_service, log_controller, service, baby = setup
+
+        # Execute
+        result = service.heatmap(baby.id, date(2023, 3, 6), date(2023, 3, 15), today = TODAY)
+
+        # Assert
+        assert result["feeding"]["counts"][0][22] == 2
+        assert result["feeding"]["amounts"][0][22] == 210
+        assert result["diaper"]["counts"][1][8] == 1
+        assert result["sleep"]["counts"][6][23] == 1
+        assert result["sleep"]["minutes"][6][23] == 30
+        assert result["sleep"]["minutes"][0][0] == 60
+        assert result["sleep"]["minutes"][0][1] == 15
+
+    def test_window_clips_spanning_sleep(self, setup):
+        """Test that only the minutes inside the window are counted."""
+        # Setup
+        data_service, log_controller, service, baby = setup
+
+        # Execute
+        result = service.heatmap(baby.id, date(2023, 3, 13), date(2023, 3, 15), today = TODAY)
+
+        # Assert
+        assert result["sleep"]["counts"][6][23] == 0
+        assert result["sleep"]["minutes"][6][23] == 0
+        assert result["sleep"]["minutes"][0][0] == 60
+
+    def test_closed_weeks_cached_and_invalidated(self, setup):
+        """Test that closed weeks are cached until one of their logs changes."""
+        # Setup
+        data_service, log_controller, service, baby = setup
+        service.heatmap(baby.id, date(2023, 3, 6), date(2023, 3, 15), today = TODAY)
+        cached_weeks = set(service.cache[baby.id]["weeks"])
+
+        # Execute
+        log_controller.add_logs(baby.id, [{"log_type": "diaper", "date": "2023-03-08", "time": "09:00", "diaper_type": "dirty"}])
+        after_add = set(service.cache[baby.id]["weeks"])
+        result = service.heatmap(baby.id, date(2023, 3, 6), date(2023, 3, 15), today = TODAY)
+
+        # Assert
+        assert cached_weeks == {date(2023, 3, 6)}
+        assert after_add == set()
+        assert result["diaper"]["counts"][2][9] == 1
+
+    def test_missing_baby(self, setup):
+        """Test that an unknown baby returns None."""
+        # Setup
+        data_service, log_controller, service, baby = setup
+
+        # Execute / Assert
+        assert service.heatmap("nonexistent", today = TODAY) is None
+        assert "nonexistent" not in service.cache
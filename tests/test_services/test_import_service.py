@@ -0,0 +1,100 @@
+# tests/test_services/test_import_service.py
+
+import json
+import pytest
+from datetime import date, datetime, time
+from models.baby import Baby
+from services.data_service import DataService
+from services.import_service import ImportService
+
+class TestImportService:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Data service backed by a temporary directory."""
+        return DataService(str(tmp_path / "data"))
+
+    def test_import_csv(self, data_service, tmp_path):
+        """Test importing mixed record types from CSV."""
+        # Setup
+        baby = Baby("Test Baby", datetime(2023, 1, 1))
+        data_service.save_baby(baby)
+        
+        csv_path = tmp_path / "import.csv"
+        csv_path.write_text(
+            "record_type,baby_id,date,time,start_time,end_time,feeding_type,amount,diaper_type,weight,notes\n"
+            f"feeding,{baby.id},2023-02-01,08:30,,,bottle,120,,,\n"
+            f"sleep,{baby.id},2023-02-01,,22:00,02:00,,,,,\n"
+            f"diaper,{baby.id},2023-02-01,09:00,,,,,wet,,rash\n"
+            f"growth,{baby.id},2023-02-01,,,,,,,4.2,\n"
+            f"feeding,{baby.id},2023-02-01,,,,bottle,,,,\n"
+            f"feeding,unknown,2023-02-01,08:30,,,bottle,,,,\n"
+        )
+        
+        # Execute
+        summary = ImportService(data_service).import_file(str(csv_path), batch_size = 2)
+        
+        # Assert
+        assert summary["imported"] == 4
+        assert summary["babies"] == 1
+        assert [number for number, _ in summary["errors"]] == [5, 6]
+        
+        loaded = data_service.load_baby(baby.id)
+        assert len(loaded.daily_logs) == 3
+        assert len(loaded.growth_records) == 1
+        assert loaded.growth_records[0].weight == 4.2
+        
+        feeding = loaded.daily_logs[0]
+        assert feeding.date == date(2023, 2, 1)
+        assert feeding.time == time(8, 30)
+        assert feeding.amount == 120.0
+        
+        sleep = loaded.daily_logs[1]
+        assert sleep.start_time == time(22, 0)
+        assert sleep.end_time == time(2, 0)
+
+    def test_import_jsonl(self, data_service, tmp_path):
+        """Test importing from JSONL."""
+        # Setup
+        baby = Baby("Test Baby", datetime(2023, 1, 1))
+        data_service.save_baby(baby)
+        
+        jsonl_path = tmp_path / "import.jsonl"
+        rows = [
+            {"record_type": "diaper", "baby_id": baby.id, "date": "2023-02-01", "time": f"{hour:02d}:00", "diaper_type": "wet"}
+            for hour in range(24)
+        ]
+        jsonl_path.write_text("\n".join(json.dumps(row) for row in rows))
+        
+        # Execute
+        summary = ImportService(data_service).import_file(str(jsonl_path))
+        
+        # Assert
+        assert summary == {"imported": 24, "babies": 1, "errors": []}
+        assert len(data_service.load_baby(baby.id).daily_logs) == 24
+
+    def test_import_jsonl_bad_lines(self, data_service, tmp_path):
+        """Test that malformed JSON and non-object lines are reported per row."""
+        # Setup
+        baby = Baby("Test Baby", datetime(2023, 1, 1))
+        data_service.save_baby(baby)
+
+        jsonl_path = tmp_path / "import.jsonl"
+        row = {"record_type": "diaper", "baby_id": baby.id, "date": "2023-02-01", "time": "09:00", "diaper_type": "wet"}
+        jsonl_path.write_text("\n".join([json.dumps(row), '{"record_type": "diaper",', "[1, 2]", json.dumps(row)]))
+
+        # Execute
+        summary = ImportService(data_service).import_file(str(jsonl_path))
+
+        # Assert
+        assert summary["imported"] == 2
+        assert [number for number, _ in summary["errors"]] == [2, 3]
+        assert "object" in summary["errors"][1][1]
+
+    def test_import_rows_rejects_non_objects(self, data_service):
+        """Test that rows that are not dictionaries are recorded as errors."""
+        # Execute
+        summary = ImportService(data_service).import_rows([["feeding"], 42])
+
+        # Assert
+        assert summary["imported"] == 0
+        assert [number for number, _ in summary["errors"]] == [1, 2]
@@ -0,0 +1,148 @@
+# tests/test_services/test_integrity_service.py
+
+import json
+import os
+import pytest
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.data_service import DataService
+from services.integrity_service import IntegrityService
+
+class TestIntegrityService:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create a healthy baby with one log."""
+        data_service = DataService(str(tmp_path))
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        DailyLogController(data_service).add_logs(baby.id, [
+            {"log_type": "diaper", "date": "2023-01-15", "time": "09:00", "diaper_type": "wet"},
+        ])
+        return data_service, baby
+
+    def _edit(self, data_service, baby_id, edit):
+        """Apply edit(baby_dict) to a stored baby file."""
+        path = data_service._find_baby_file_path(baby_id)
+        with open(path, 'r') as f:
+            baby_dict = json.load(f)
+        edit(baby_dict)
+        with open(path, 'w') as f:
+            json.dump(baby_dict, f)
+
+    def test_clean_directory(self, setup):
+        """Test that healthy files report no problems."""
+        # Setup
+        data_service, baby = setup
+
+        # Execute
+        report = IntegrityService(data_service).check_all()
+
+        # Assert
+        assert report["files"] == 1
+        assert report["ok"] == 1
+        assert report["files_with_problems"] == []
+
+    def test_repair_references_and_duplicates(self, setup):
+        """Test that wrong baby_ids, duplicates and bad records are repaired."""
+        # Setup
+        data_service, baby = setup
+
+        def corrupt(baby_dict):
+            log = baby_dict["daily_logs"][0]
+            log["baby_id"] = "someone-else"
+            baby_dict["daily_logs"].append(dict(log))
+            baby_dict["daily_logs"].append(dict(log, notes = "different"))
+            baby_dict["daily_logs"].append(dict(log, id = "x", log_type = "bath"))
+            del baby_dict["notes"]
+        self._edit(data_service, baby.id, corrupt)
+        service = IntegrityService(data_service)
+
+        # Execute
+        report = service.check_all(repair = True, quarantine = True)
+
+        # Assert
+        assert report["actions"] == {"repaired": 1}
+        assert report["problems"]["baby_id_mismatch"] == 3
+        assert report["problems"]["duplicate_id"] == 2
+        assert report["problems"]["unknown_log_type"] == 1
+        logs = data_service.load_baby(baby.id).daily_logs
+        assert len(logs) == 2
+        assert {log.baby_id for log in logs} == {baby.id}
+        assert len({log.id for log in logs}) == 2
+        assert os.path.exists(os.path.join(service.quarantine_dir, f"baby_{baby.id}.dropped.json"))
+        assert service.check_all()["ok"] == 1
+
+    def test_quarantine_unreadable(self, setup):
+        """Test that unparseable files are moved out of the data directory."""
+        # Setup
+        data_service, baby = setup
+        bad_path = os.path.join(data_service.data_dir, "baby_broken.json")
+        with open(bad_path, 'w') as f:
+            f.write("{not json")
+        service = IntegrityService(data_service)
+
+        # Execute
+        report = service.check_all(repair = True, quarantine = True, workers = 2)
+
+        # Assert
+        assert report["files"] == 2
+        assert report["actions"] == {"quarantined": 1}
+        assert report["problems"] == {"unreadable": 1}
+        assert not os.path.exists(bad_path)
+        assert os.path.exists(os.path.join(service.quarantine_dir, "baby_broken.json"))
+        assert [b.id for b in data_service.load_all_babies()] == [baby.id]
+
+    def test_report_only_leaves_files(self, setup):
+        """Test that checking without repair or quarantine changes nothing."""
+        # Setup
+        data_service, baby = setup
+        self._edit(data_service, baby.id, lambda baby_dict: baby_dict.update(id = "other"))
+        path = data_service._find_baby_file_path(baby.id)
+        with open(path, 'r') as f:
+            before = f.read()
+
+        # Execute
+        report = IntegrityService(data_service).check_all()
+
+        # Assert
+        assert report["actions"] == {"reported": 1}
+        assert report["problems"] == {"id_mismatch": 1}
+        with open(path, 'r') as f:
+            assert f.read() == before
+
+    def test_actions_go_through_data_service(self, setup):
+        """Test that repairs and quarantines notify DataService listeners."""
+        # Setup
+        data_service, baby = setup
+        self._edit(data_service, baby.id, lambda baby_dict: baby_dict.pop("notes"))
+        with open(os.path.join(data_service.data_dir, "baby_broken.json"), 'w') as f:
+            f.write("{not json")
+        events = []
+        data_service.add_listener(lambda action, baby_id, saved: events.append((action, baby_id)))
+
+        # Execute
+        IntegrityService(data_service).check_all(repair = True, quarantine = True)
+
+        # Assert
+        assert sorted(events) == sorted([("save", baby.id), ("delete", "broken")])
+
+    def test_repair_guards_unloadable_documents(self, setup):
+        """Test that a repairable file that still cannot load is reported, and dropped records are kept."""
+        # Setup
+        data_service, baby = setup
+        other = BabyController(data_service).create_baby("Other Baby", "2023-02-01")
+
+        def corrupt(baby_dict):
+            baby_dict["birthdate"] = 20230101
+            del baby_dict["gender"]
+        self._edit(data_service, baby.id, corrupt)
+        self._edit(data_service, other.id, lambda baby_dict: baby_dict["daily_logs"].append({"id": "x"}))
+        service = IntegrityService(data_service)
+
+        # Execute
+        report = service.check_all(repair = True)
+
+        # Assert
+        assert report["actions"] == {"reported": 1, "repaired": 1}
+        assert report["problems"]["bad_value"] == 1
+        with open(os.path.join(service.quarantine_dir, f"baby_{other.id}.dropped.json"), 'r') as f:
+            assert json.load(f) == [{"record_type": "daily_logs", "record": {"id": "x"}}]
@@ -0,0 +1,114 @@
+# tests/test_services/test_log_archive.py
+
+import os
+import pytest
+from datetime import date
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.daily_summary_service import DailySummaryService
+from services.data_service import DataService
+from services.export_service import ExportService
+from services.search_service import SearchService
+
+class TestLogArchive:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create a baby with logs spread over three months."""
+        data_service = DataService(str(tmp_path))
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        log_controller.add_logs(baby.id, [
+            {"log_type": "diaper", "date": "2023-01-15", "time": "09:00", "diaper_type": "wet"},
+            {"log_type": "diaper", "date": "2023-02-15", "time": "09:00", "diaper_type": "wet"},
+            {"log_type": "feeding", "date": "2023-03-30", "time": "08:00", "feeding_type": "bottle", "amount": 4},
+        ])
+        return data_service, log_controller, baby
+
+    @pytest.mark.parametrize("codec, extension", [("zlib", ".zlib"), ("lzma", ".xz")])
+    def test_archive_old_logs(self, setup, codec, extension):
+        """Test that old logs leave the baby document but are still returned."""
+        # Setup
+        data_service, log_controller, baby = setup
+        
+        # Execute
+        archived = data_service.archive_daily_logs(baby.id, 30, codec, today = date(2023, 4, 1))
+        
+        # Assert
+        assert archived == 2
+        assert len(data_service.load_baby(baby.id).daily_logs) == 1
+        assert os.path.exists(os.path.join(data_service.data_dir, "archive", baby.id, "2023-01" + extension))
+        assert [log.date for log in log_controller.get_daily_logs(baby.id)] == [
+            date(2023, 1, 15), date(2023, 2, 15), date(2023, 3, 30)
+        ]
+        assert len(log_controller.get_daily_logs(baby.id, "2023-02-15")) == 1
+
+    def test_range_only_reads_needed_segments(self, setup):
+        """Test that a recent range does not decompress older months."""
+        # Setup
+        data_service, log_controller, baby = setup
+        data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        os.remove(os.path.join(data_service.data_dir, "archive", baby.id, "2023-01.zlib"))
+        
+        # Execute
+        logs = data_service.load_daily_logs(baby.id, date(2023, 2, 1), date(2023, 3, 31))
+        
+        # Assert
+        assert [log.date for log in logs] == [date(2023, 2, 15), date(2023, 3, 30)]
+
+    def test_rearchive_and_export(self, setup, tmp_path):
+        """Test that archiving again merges segments and export includes archived logs."""
+        # Setup
+        data_service, log_controller, baby = setup
+        data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        log_controller.add_diaper_log(baby.id, "2023-01-20", "10:00", "soiled")
+        
+        # Execute
+        archived = data_service.archive_daily_logs(baby.id, 30, "lzma", today = date(2023, 4, 1))
+        counts = ExportService(data_service).export_all(str(tmp_path / "export"))
+        
+        # Assert
+        assert archived == 1
+        assert sorted(os.listdir(os.path.join(data_service.data_dir, "archive", baby.id))) == ["2023-01.xz", "2023-02.zlib"]
+        assert len(data_service.load_daily_logs(baby.id, date(2023, 1, 1), date(2023, 1, 31))) == 2
+        assert counts["daily_logs"][1] == 4
+        assert data_service.delete_baby(baby.id)
+        assert not os.path.exists(os.path.join(data_service.data_dir, "archive", baby.id))
+
+    def test_archived_logs_stay_visible(self, setup, tmp_path):
+        """Test that archiving is not treated as deleting logs by search and summaries."""
+        # Setup
+        data_service, log_controller, baby = setup
+        search_service = SearchService(data_service)
+        data_service.add_listener(search_service.on_baby_changed)
+        log_controller.add_diaper_log(baby.id, "2023-01-16", "10:00", "wet", notes = "small rash")
+        assert len(search_service.search("rash")) == 1
+        
+        # Execute
+        data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        rebuilt = SearchService(data_service)
+        rebuilt.rebuild()
+        
+        # Assert
+        assert len(search_service.search("rash")) == 1
+        assert len(rebuilt.search("rash")) == 1
+        assert DailySummaryService(data_service).get_day(baby.id, date(2023, 1, 15))["diapers"] == 1
+
+    def test_search_keeps_archived_entries_without_reading_archive(self, setup, monkeypatch):
+        """Test that saves after archiving keep archived search entries without decompressing segments."""
+        # Setup
+        data_service, log_controller, baby = setup
+        search_service = SearchService(data_service)
+        data_service.add_listener(search_service.on_baby_changed)
+        log_controller.add_diaper_log(baby.id, "2023-01-16", "10:00", "wet", notes = "small rash")
+        assert len(search_service.search("rash")) == 1
+        data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        reads = []
+        monkeypatch.setattr(data_service, "_read_archive_segment", lambda *args: reads.append(args))
+        
+        # Execute
+        log_controller.add_diaper_log(baby.id, "2023-03-31", "10:00", "wet", notes = "rash again")
+        
+        # Assert
+        assert reads == []
+        assert len(search_service.search("rash")) == 2
+        assert len(SearchService(data_service).search("rash")) == 2
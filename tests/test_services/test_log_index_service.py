@@ -0,0 +1,108 @@
+# tests/test_services/test_log_index_service.py
+
+import os
+import pytest
+from datetime import date
+from utils.app_context import AppContext
+
+class TestLogIndexService:
+    @pytest.fixture
+    def context(self, tmp_path):
+        """Create a context with a baby that has logs on five days."""
+        context = AppContext(str(tmp_path))
+        context.baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_logs(context.baby.id, [
+            {"log_type": "diaper", "date": f"2023-02-0{day}", "time": "09:00", "diaper_type": "wet"}
+            for day in (5, 1, 3, 2, 4)
+        ])
+        return context
+
+    def test_read_range(self, context):
+        """Test that only the requested days are returned, in order."""
+        # Execute
+        logs = context.log_index_service.read_range(context.baby.id, date(2023, 2, 2), date(2023, 2, 3))
+        
+        # Assert
+        assert [log.date for log in logs] == [date(2023, 2, 2), date(2023, 2, 3)]
+        assert context.log_index_service.read_range(context.baby.id, date(2023, 3, 1), date(2023, 3, 2)) == []
+        assert context.log_index_service.read_range("missing", date(2023, 2, 1), date(2023, 2, 1)) is None
+
+    def test_appends_new_logs(self, context):
+        """Test that a new log is appended without rebuilding the files."""
+        # Setup
+        index_service = context.log_index_service
+        index_service.read_range(context.baby.id, date(2023, 2, 1), date(2023, 2, 1))
+        data_path, _ = index_service._get_paths(context.baby.id)
+        size = os.path.getsize(data_path)
+        
+        # Execute
+        context.daily_log_controller.add_feeding_log(context.baby.id, "2023-02-05", "10:00", "bottle", amount = 4)
+        inode = os.stat(data_path).st_ino
+        logs = index_service.read_range(context.baby.id, date(2023, 2, 5), date(2023, 2, 5))
+        
+        # Assert
+        assert [log.log_type for log in logs] == ["diaper", "feeding"]
+        assert os.path.getsize(data_path) > size
+        assert os.stat(data_path).st_ino == inode
+
+    def test_rebuilds_after_other_changes(self, context):
+        """Test that out-of-order logs and writes from elsewhere are picked up."""
+        # Setup
+        index_service = context.log_index_service
+        index_service.read_range(context.baby.id, date(2023, 2, 1), date(2023, 2, 1))
+        
+        # Execute
+        context.daily_log_controller.add_diaper_log(context.baby.id, "2023-01-31", "09:00", "soiled")
+        other_context = AppContext(context.data_dir)
+        other_context.daily_log_controller.add_diaper_log(context.baby.id, "2023-02-06", "09:00", "wet")
+        logs = index_service.read_range(context.baby.id, date(2023, 1, 31), date(2023, 2, 6))
+        
+        # Assert
+        assert len(logs) == 7
+        assert logs[0].diaper_type == "soiled"
+        assert logs[-1].date == date(2023, 2, 6)
+
+    def test_delete_removes_files(self, context):
+        """Test that deleting a baby removes its index files."""
+        # Setup
+        index_service = context.log_index_service
+        index_service.read_range(context.baby.id, date(2023, 2, 1), date(2023, 2, 1))
+        
+        # Execute
+        context.baby_controller.delete_baby(context.baby.id)
+        
+        # Assert
+        assert not any(os.path.exists(path) for path in index_service._get_paths(context.baby.id))
+
+    def test_appends_writes_from_other_processes(self, context):
+        """Test that logs saved by another process are appended from the change feed, not rebuilt."""
+        # Setup
+        index_service = context.log_index_service
+        index_service.read_range(context.baby.id, date(2023, 2, 1), date(2023, 2, 1))
+        data_path, _ = index_service._get_paths(context.baby.id)
+        inode = os.stat(data_path).st_ino
+        other_context = AppContext(context.data_dir)
+        other_context.daily_log_controller.add_diaper_log(context.baby.id, "2023-02-06", "09:00", "wet")
+
+        # Execute
+        context.daily_log_controller.add_diaper_log(context.baby.id, "2023-02-07", "09:00", "soiled")
+        logs = index_service.read_range(context.baby.id, date(2023, 2, 6), date(2023, 2, 7))
+
+        # Assert
+        assert [log.diaper_type for log in logs] == ["wet", "soiled"]
+        assert os.stat(data_path).st_ino == inode
+
+    def test_rebuilds_after_edit(self, context):
+        """Test that a same-size edit to an indexed log is picked up."""
+        # Setup
+        index_service = context.log_index_service
+        index_service.read_range(context.baby.id, date(2023, 2, 1), date(2023, 2, 1))
+        baby = context.data_service.load_baby(context.baby.id)
+        baby.daily_logs[0].diaper_type = "dry"
+
+        # Execute
+        context.data_service.save_baby(baby)
+        logs = index_service.read_range(context.baby.id, baby.daily_logs[0].date, baby.daily_logs[0].date)
+
+        # Assert
+        assert [log.diaper_type for log in logs] == ["dry"]
@@ -0,0 +1,124 @@
+# tests/test_services/test_migration_service.py
+
+import json
+import os
+import pytest
+from services.data_service import DataService
+from services.migration_service import MigrationService, SCHEMA_VERSION, upgrade_document
+
+# A version 1 document: growth records only, no optional fields
+LEGACY_BABY = {
+    "id": "a1",
+    "name": "Old Baby",
+    "birthdate": "2023-01-01T00:00:00",
+    "growth_records": [{"id": "g1", "baby_id": "a1", "date": "2023-02-01T00:00:00", "weight": 4.5}],
+}
+
+# A version 2 document: all record lists, but a sleep log without start_time
+SLEEP_BABY = {
+    "schema_version": 2,
+    "id": "b2",
+    "name": "Sleepy Baby",
+    "birthdate": "2023-01-01T00:00:00",
+    "gender": None,
+    "notes": None,
+    "growth_records": [],
+    "milestones": [],
+    "daily_logs": [{"id": "s1", "baby_id": "b2", "date": "2023-01-10", "time": "21:00:00",
+                    "log_type": "sleep", "end_time": "06:00:00", "quality": "good", "notes": None}],
+}
+
+class TestMigrationService:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Create a data directory holding legacy baby files."""
+        data_service = DataService(str(tmp_path))
+        for baby_dict in (LEGACY_BABY, SLEEP_BABY):
+            with open(os.path.join(str(tmp_path), f"baby_{baby_dict['id']}.json"), 'w') as f:
+                json.dump(baby_dict, f)
+        return data_service
+
+    def _stored(self, data_service, baby_id):
+        """Read a baby file without upgrading it."""
+        with open(data_service._find_baby_file_path(baby_id), 'r') as f:
+            return json.load(f)
+
+    def test_upgrade_document(self):
+        """Test that a version 1 document gains every list and field."""
+        # Setup
+        baby_dict = json.loads(json.dumps(LEGACY_BABY))
+
+        # Execute
+        original = upgrade_document(baby_dict)
+
+        # Assert
+        assert original == 1
+        assert baby_dict["schema_version"] == SCHEMA_VERSION
+        assert baby_dict["milestones"] == [] and baby_dict["daily_logs"] == []
+        assert baby_dict["growth_records"][0]["head_circumference"] is None
+
+    def test_newer_document_rejected(self):
+        """Test that documents from newer code are not silently downgraded."""
+        with pytest.raises(ValueError):
+            upgrade_document({"id": "x", "schema_version": SCHEMA_VERSION + 1})
+
+    def test_load_before_migration(self, data_service):
+        """Test that unmigrated files load through the in-memory upgrade."""
+        # Execute
+        baby = data_service.load_baby("b2")
+
+        # Assert
+        assert baby.daily_logs[0].duration == 540
+        assert "schema_version" not in self._stored(data_service, "a1")
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_run_upgrades_files(self, data_service, workers):
+        """Test that files are rewritten at the current version."""
+        # Execute
+        result = MigrationService(data_service).run(workers)
+
+        # Assert
+        assert result["files"] == 2
+        assert result["migrated"] == {1: 1, 2: 1}
+        assert self._stored(data_service, "a1")["schema_version"] == SCHEMA_VERSION
+        assert self._stored(data_service, "b2")["daily_logs"][0]["start_time"] == "21:00:00"
+        assert data_service.load_baby("a1").growth_records[0].weight == 4.5
+
+    def test_resume_and_complete(self, data_service):
+        """Test that finished shards are skipped and a completed run is a no-op."""
+        # Setup
+        data_service.migrate_to_sharded(depth = 1, width = 1)
+        service = MigrationService(data_service)
+        state = service._load_state()
+        state["done_shards"] = ["a"]  # As if interrupted after the first shard
+        service._save_state(state)
+
+        # Execute
+        resumed = service.run()
+        again = service.run()
+
+        # Assert
+        assert resumed["skipped_shards"] == 1
+        assert resumed["migrated"] == {2: 1}
+        assert "schema_version" not in self._stored(data_service, "a1")
+        assert again["files"] == 0
+        assert service.run(force = True)["migrated"] == {1: 1}
+
+    def test_corrupt_file_skipped(self, data_service):
+        """Test that an unreadable file is reported and retried, not fatal to the run."""
+        # Setup
+        bad_path = os.path.join(data_service.data_dir, "baby_bad.json")
+        with open(bad_path, 'w') as f:
+            f.write("{not json")
+        service = MigrationService(data_service)
+
+        # Execute
+        first = service.run()
+        os.remove(bad_path)
+        second = service.run()
+
+        # Assert
+        assert first["migrated"] == {1: 1, 2: 1}
+        assert [error["path"] for error in first["errors"]] == [bad_path]
+        assert second["errors"] == [] and second["files"] == 2
+        assert service._load_state()["complete"]
@@ -0,0 +1,64 @@
+# tests/test_services/test_milestone_cohort_service.py
+
+import pytest
+from datetime import datetime
+from models.baby import Baby
+from models.milestone import Milestone
+from services.data_service import DataService
+from services.milestone_cohort_service import MilestoneCohortService
+
+class TestMilestoneCohortService:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Data service with two babies and a handful of milestones."""
+        data_service = DataService(str(tmp_path))
+        expected_range = {"min_months": 3, "max_months": 7}
+
+        first = Baby("First", datetime(2023, 1, 1))
+        first.add_milestone(Milestone(first.id, "Rolls over", "physical", datetime(2023, 3, 2), expected_range)) # 60 days
+        first.add_milestone(Milestone(first.id, "Smiles", "social"))
+        data_service.save_baby(first)
+
+        second = Baby("Second", datetime(2023, 1, 1))
+        second.add_milestone(Milestone(second.id, "Rolls over", "physical", datetime(2023, 5, 1), expected_range)) # 120 days
+        second.add_milestone(Milestone(second.id, "Crawls", "physical", datetime(2023, 11, 1), {"min_months": 6, "max_months": 8}))
+        data_service.save_baby(second)
+
+        return data_service
+
+    def test_achievement_status(self):
+        """Test early/on-time/late classification."""
+        birthdate = datetime(2023, 1, 1)
+        expected_range = {"min_months": 3, "max_months": 7}
+
+        assert Milestone("id", "m", "physical", datetime(2023, 2, 1), expected_range).achievement_status(birthdate) == "early"
+        assert Milestone("id", "m", "physical", datetime(2023, 5, 1), expected_range).achievement_status(birthdate) == "on_time"
+        assert Milestone("id", "m", "physical", datetime(2024, 1, 1), expected_range).achievement_status(birthdate) == "late"
+        assert Milestone("id", "m", "physical", datetime(2023, 5, 1)).achievement_status(birthdate) is None
+        assert Milestone("id", "m", "physical", datetime(2023, 5, 1), expected_range).achieved_on_time(birthdate) is True
+
+    def test_evaluate_all(self, data_service):
+        """Test cohort report over all babies."""
+        # Execute
+        report = MilestoneCohortService(data_service).evaluate_all()
+
+        # Assert
+        assert report["babies"] == 2
+
+        rolls_over = report["milestones"]["Rolls over"]
+        assert rolls_over["count"] == 2
+        assert rolls_over["min_months"] == 2
+        assert rolls_over["max_months"] == 4
+        assert rolls_over["median_months"] == 3
+        assert rolls_over["histogram"] == {2: 1, 4: 1}
+
+        assert report["categories"]["physical"]["early"] == 1
+        assert report["categories"]["physical"]["on_time"] == 1
+        assert report["categories"]["physical"]["late"] == 1
+        assert report["categories"]["social"]["pending"] == 1
+
+    def test_evaluate_all_parallel(self, data_service):
+        """Test that process-pool evaluation matches the sequential pass."""
+        service = MilestoneCohortService(data_service)
+
+        assert service.evaluate_all(workers = 2) == service.evaluate_all()
@@ -0,0 +1,91 @@
+# tests/test_services/test_query_service.py
+
+import pytest
+from datetime import date, time
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from controllers.growth_controller import GrowthController
+from services.data_service import DataService
+from services.query_service import QueryService, compile_query
+
+class TestQueryService:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create two babies with feedings, sleeps and growth records."""
+        data_service = DataService(str(tmp_path))
+        baby_controller = BabyController(data_service)
+        log_controller = DailyLogController(data_service)
+        first = baby_controller.create_baby("First Baby", "2023-01-01")
+        second = baby_controller.create_baby("Second Baby", "2023-01-01")
+        log_controller.add_logs(first.id, [
+            {"log_type": "feeding", "date": "2023-03-01", "time": "22:30", "feeding_type": "bottle", "amount": 150},
+            {"log_type": "feeding", "date": "2023-03-01", "time": "20:00", "feeding_type": "bottle", "amount": 150},
+            {"log_type": "feeding", "date": "2023-03-08", "time": "23:00", "feeding_type": "breast", "duration": 15},
+            {"log_type": "sleep", "date": "2023-03-08", "start_time": "13:00", "end_time": "13:20", "quality": "poor",
+             "notes": "Woke up after a Spit up"},
+            {"log_type": "sleep", "date": "2023-03-08", "start_time": "23:30", "end_time": "06:30", "quality": "poor"},
+        ])
+        log_controller.add_logs(second.id, [
+            {"log_type": "feeding", "date": "2023-03-09", "time": "22:15", "feeding_type": "bottle", "amount": 130},
+            {"log_type": "feeding", "date": "2023-01-09", "time": "22:15", "feeding_type": "bottle", "amount": 130},
+        ])
+        growth_controller = GrowthController(data_service)
+        growth_controller.add_growth_record(first.id, "2023-02-01", 4.5, 55)
+        growth_controller.add_growth_record(first.id, "2023-04-01", 6.0, 60)
+        return data_service, first, second
+
+    def test_feeding_query_across_babies(self, setup):
+        """Test that late bottle feeds over 120 in the last week are found for every baby."""
+        # Setup
+        data_service, first, second = setup
+        query = compile_query("feeding feeding_type=bottle amount>120 time>=22:00 date>=-10d", today = date(2023, 3, 10))
+
+        # Execute
+        results = list(QueryService(data_service).run(query))
+
+        # Assert
+        assert [(log.baby_id, log.date) for log in results] == sorted(
+            [(first.id, date(2023, 3, 1)), (second.id, date(2023, 3, 9))]
+        )
+        assert query.start_date == date(2023, 2, 28)
+        assert query.end_date is None
+
+    def test_sleep_duration_and_text(self, setup):
+        """Test that sleep duration and case-insensitive notes filters apply."""
+        # Setup
+        data_service, first, second = setup
+        service = QueryService(data_service)
+
+        # Execute
+        short = list(service.run("sleep quality=poor duration<30", first.id))
+        noted = list(service.run('log notes~"spit up"'))
+
+        # Assert
+        assert [log.start_time for log in short] == [time(13, 0)]
+        assert [log.id for log in noted] == [log.id for log in short]
+
+    def test_growth_range_and_alternatives(self, setup):
+        """Test date ranges on growth records and comma alternatives."""
+        # Setup
+        data_service, first, second = setup
+        service = QueryService(data_service)
+
+        # Execute
+        in_range = list(service.run("growth date=2023-01-15..2023-02-15"))
+        either = compile_query("feeding feeding_type=breast,solid")
+
+        # Assert
+        assert [record.weight for record in in_range] == [4.5]
+        assert [log.duration for log in service.run(either)] == [15]
+
+    @pytest.mark.parametrize("text", [
+        "feeding amount",
+        "feeding weight>3",
+        "growth weight>heavy",
+        'log notes~"unclosed',
+        "sleep end_time>=25:00",
+    ])
+    def test_invalid_queries(self, text):
+        """Test that malformed queries raise ValueError."""
+        with pytest.raises(ValueError):
+            compile_query(text)
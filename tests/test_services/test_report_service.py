@@ -0,0 +1,85 @@
+# tests/test_services/test_report_service.py
+
+import os
+import pytest
+from datetime import date
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from controllers.growth_controller import GrowthController
+from controllers.milestone_controller import MilestoneController
+from services.data_service import DataService
+from services.report_service import ReportService
+
+AS_OF = date(2023, 6, 1)
+
+class TestReportService:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        """Create a baby with growth, milestones and recent logs, and a second baby."""
+        data_service = DataService(str(tmp_path / "data"))
+        baby_controller = BabyController(data_service)
+        baby = baby_controller.create_baby("Test <Baby>", "2023-01-01", "female")
+        baby_controller.create_baby("Other Baby", "2023-02-01")
+        GrowthController(data_service).add_growth_record(baby.id, "2023-03-01", 5.2, 58.5)
+        milestone_controller = MilestoneController(data_service)
+        milestone_controller.add_milestone(baby.id, "Social smile", "social", "2023-02-20", {"min_months": 1, "max_months": 3})
+        milestone_controller.add_milestone(baby.id, "Rolls over", "motor", "2023-05-25", {"min_months": 2, "max_months": 3})
+        milestone_controller.add_milestone(baby.id, "Sits", "motor", None, {"min_months": 4, "max_months": 7})
+        DailyLogController(data_service).add_logs(baby.id, [
+            {"log_type": "feeding", "date": "2023-06-01", "time": "08:00", "feeding_type": "bottle", "amount": 120},
+            {"log_type": "feeding", "date": "2023-06-01", "time": "12:00", "feeding_type": "bottle", "amount": 100},
+            {"log_type": "sleep", "date": "2023-05-31", "start_time": "22:00", "end_time": "06:00"},
+        ])
+        return data_service, baby
+
+    def test_build(self, setup):
+        """Test that the report collects growth, milestone status and daily aggregates."""
+        # Setup
+        data_service, baby = setup
+
+        # Execute
+        report = ReportService(data_service).build(baby.id, AS_OF, days = 2)
+
+        # Assert
+        assert [point["weight"] for point in report["growth"]] == [5.2]
+        statuses = {m["name"]: (m["status"], m["on_time"]) for m in report["milestones"]}
+        assert statuses == {"Social smile": ("on_time", True), "Rolls over": ("late", False), "Sits": ("pending", None)}
+        assert [day["date"] for day in report["daily"]["days"]] == ["2023-05-31", "2023-06-01"]
+        assert report["daily"]["days"][1]["feeding_amount"] == 220
+        assert report["daily"]["averages"]["sleep_minutes"] == 240
+        assert report["age"]["months"] == 5
+
+    def test_render_formats(self, setup):
+        """Test that HTML is self-contained and escaped, and Markdown has tables."""
+        # Setup
+        data_service, baby = setup
+        service = ReportService(data_service)
+
+        # Execute
+        page = service.render(baby.id, "html", AS_OF)
+        markdown = service.render(baby.id, "markdown", AS_OF)
+
+        # Assert
+        assert "<h1>Test &lt;Baby&gt;</h1>" in page
+        assert "<link" not in page and "<script" not in page
+        assert '<td class="late">late</td>' in page
+        assert "| Social smile | social | 1-3 months | 2023-02-20 | 1 | on_time |" in markdown
+        assert service.render("nonexistent") is None
+        with pytest.raises(ValueError):
+            service.render(baby.id, "pdf")
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_render_all(self, setup, tmp_path, workers):
+        """Test that batch mode writes one report per baby."""
+        # Setup
+        data_service, baby = setup
+        output_dir = str(tmp_path / "reports")
+
+        # Execute
+        paths = ReportService(data_service).render_all(output_dir, "markdown", workers, AS_OF)
+
+        # Assert
+        assert len(paths) == 2
+        assert sorted(os.listdir(output_dir)) == sorted(os.path.basename(path) for path in paths.values())
+        with open(paths[baby.id], 'r', encoding = "utf-8") as f:
+            assert f.read().startswith("# Test <Baby>")
@@ -0,0 +1,94 @@
+# tests/test_services/test_search_service.py
+
+import pytest
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from controllers.growth_controller import GrowthController
+from services.data_service import DataService
+from services.search_service import SearchService
+
+class TestSearchService:
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Data service with search indexing wired in."""
+        data_service = DataService(str(tmp_path))
+        data_service.add_listener(SearchService(data_service).on_baby_changed)
+        return data_service
+
+    def test_search(self, data_service):
+        """Test searching notes across record types and babies."""
+        # Setup
+        first = BabyController(data_service).create_baby("First", "2023-01-01", notes = "Prone to RASH")
+        second = BabyController(data_service).create_baby("Second", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        log_controller.add_feeding_log(first.id, "2023-02-01", "08:00", "bottle", notes = "Spit up after feed")
+        log_controller.add_diaper_log(second.id, "2023-02-01", "09:00", "wet", notes = "small rash")
+        log_controller.add_diaper_log(second.id, "2023-02-01", "10:00", "wet", notes = "spit, then woke up")
+        GrowthController(data_service).add_growth_record(first.id, "2023-02-01", 4.2, notes = "healthy")
+        
+        # Execute with a fresh service so results come from the persisted index
+        service = SearchService(data_service)
+        results = service.search("rash", "spit up")
+        
+        # Assert
+        assert sorted(entry["notes"] for entry in results) == ["Prone to RASH", "Spit up after feed", "small rash"]
+        assert [entry["record_type"] for entry in service.search("rash", baby_id = second.id)] == ["diaper_log"]
+        assert service.search("tantrum") == []
+
+    def test_index_follows_updates_and_deletes(self, data_service):
+        """Test that edits and deletes are reflected in the index."""
+        # Setup
+        baby_controller = BabyController(data_service)
+        baby = baby_controller.create_baby("Test Baby", "2023-01-01", notes = "colic")
+        
+        # Execute
+        baby_controller.update_baby(baby.id, notes = "reflux")
+        
+        # Assert
+        service = SearchService(data_service)
+        assert service.search("colic") == []
+        assert len(service.search("reflux")) == 1
+        
+        baby_controller.delete_baby(baby.id)
+        assert SearchService(data_service).search("reflux") == []
+
+    def test_rebuild_without_index_file(self, tmp_path):
+        """Test that the index is built from stored babies when no index file exists."""
+        data_service = DataService(str(tmp_path))
+        BabyController(data_service).create_baby("Test Baby", "2023-01-01", notes = "jaundice")
+        
+        assert len(SearchService(data_service).search("Jaundice")) == 1
+
+    def test_append_without_loading(self, data_service):
+        """Test that a writer that never searched appends to the index without reading it."""
+        # Setup
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01", notes = "colic")
+        assert len(SearchService(data_service).search("colic")) == 1
+        writer = SearchService(data_service)
+        data_service.add_listener(writer.on_baby_changed)
+        
+        # Execute
+        DailyLogController(data_service).add_diaper_log(baby.id, "2023-02-01", "09:00", "wet", notes = "small rash")
+        
+        # Assert
+        assert writer.entries is None
+        assert len(SearchService(data_service).search("rash")) == 1
+
+    def test_compaction_keeps_other_writers_lines(self, data_service):
+        """Test that compacting re-reads lines another process appended."""
+        # Setup
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01", notes = "colic")
+        reader = SearchService(data_service)
+        reader.search("colic")
+        other = SearchService(DataService(data_service.data_dir))
+        other.data_service.add_listener(other.on_baby_changed)
+        DailyLogController(other.data_service).add_diaper_log(baby.id, "2023-02-01", "09:00", "wet", notes = "small rash")
+        
+        # Execute
+        reader._compact()
+        
+        # Assert
+        assert len(reader.search("rash")) == 1
+        assert len(SearchService(data_service).search("rash")) == 1
+        with open(reader.index_path, 'r') as f:
+            assert len(f.readlines()) == 1
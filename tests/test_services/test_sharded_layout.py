@@ -0,0 +1,94 @@
+# tests/test_services/test_sharded_layout.py
+
+import os
+from controllers.baby_controller import BabyController
+from services.data_service import DataService
+
+class TestShardedLayout:
+    def test_migrate_flat_directory(self, tmp_path):
+        """Test that migration moves every file and babies still load."""
+        # Setup
+        data_service = DataService(str(tmp_path))
+        controller = BabyController(data_service)
+        babies = [controller.create_baby(f"Baby {i}", "2023-01-01") for i in range(5)]
+        
+        # Execute
+        moved = data_service.migrate_to_sharded()
+        
+        # Assert
+        assert moved == 5
+        baby = babies[0]
+        assert os.path.exists(tmp_path / baby.id[0] / baby.id[1] / f"baby_{baby.id}.json")
+        assert not os.path.exists(tmp_path / f"baby_{baby.id}.json")
+        assert {b.id for b in DataService(str(tmp_path)).load_all_babies()} == {b.id for b in babies}
+        assert data_service.migrate_to_sharded() == 0
+
+    def test_online_migration(self, tmp_path):
+        """Test that a process opened before migration reads, saves and deletes across both layouts."""
+        # Setup
+        old_service = DataService(str(tmp_path))
+        controller = BabyController(old_service)
+        first = controller.create_baby("First", "2023-01-01")
+        second = controller.create_baby("Second", "2023-01-01")
+        
+        # Execute
+        DataService(str(tmp_path)).migrate_to_sharded()
+        third = controller.create_baby("Third", "2023-01-01")
+        controller.update_baby(first.id, name = "Renamed")
+        
+        # Assert
+        assert os.path.exists(tmp_path / third.id[0] / third.id[1] / f"baby_{third.id}.json")
+        assert controller.get_baby_by_id(first.id).name == "Renamed"
+        assert controller.delete_baby(second.id)
+        paths = list(old_service.iter_baby_file_paths())
+        assert len(paths) == 2
+        assert all(os.path.dirname(path) != str(tmp_path) for path in paths)
+
+    def test_pending_flat_files_are_found(self, tmp_path):
+        """Test that files left in the flat layout are still read and listed per shard."""
+        # Setup
+        data_service = DataService(str(tmp_path))
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        with open(tmp_path / "layout.json", "w") as f:
+            f.write('{"depth": 2, "width": 1}')
+        
+        # Execute
+        sharded_service = DataService(str(tmp_path))
+        shards = list(sharded_service.iter_shards())
+        
+        # Assert
+        assert sharded_service.load_baby(baby.id).name == "Test Baby"
+        assert shards == [str(tmp_path)]
+        assert list(sharded_service.iter_baby_file_paths(shards[0])) == [str(tmp_path / f"baby_{baby.id}.json")]
+
+    def test_copies_in_both_layouts(self, tmp_path):
+        """Test that the newer copy wins and the older one is set aside, not deleted."""
+        # Setup
+        data_service = DataService(str(tmp_path))
+        controller = BabyController(data_service)
+        flat_newer = controller.create_baby("Flat", "2023-01-01")
+        shard_newer = controller.create_baby("Shard", "2023-01-01")
+        flat_paths = {baby.id: str(tmp_path / f"baby_{baby.id}.json") for baby in (flat_newer, shard_newer)}
+        data_service.migrate_to_sharded()
+        sharded_service = DataService(str(tmp_path))
+        shard_paths = {baby_id: sharded_service._get_baby_file_path(baby_id) for baby_id in flat_paths}
+
+        # Both layouts hold a copy; make one side newer for each baby
+        for baby_id, flat_path in flat_paths.items():
+            with open(shard_paths[baby_id], 'r') as f:
+                content = f.read()
+            with open(flat_path, 'w') as f:
+                f.write(content.replace('"name": "', '"name": "Flat copy of '))
+        os.utime(shard_paths[flat_newer.id], ns = (1, 1))
+        os.utime(flat_paths[shard_newer.id], ns = (1, 1))
+
+        # Execute
+        moved = sharded_service.migrate_to_sharded()
+
+        # Assert
+        assert moved == 1
+        assert sharded_service.load_baby(flat_newer.id).name == "Flat copy of Flat"
+        assert sharded_service.load_baby(shard_newer.id).name == "Shard"
+        assert os.path.exists(shard_paths[flat_newer.id] + ".superseded")
+        assert os.path.exists(flat_paths[shard_newer.id] + ".superseded")
+        assert not any(os.path.exists(path) for path in flat_paths.values())
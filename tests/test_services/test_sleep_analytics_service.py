@@ -0,0 +1,95 @@
+# tests/test_services/test_sleep_analytics_service.py
+
+import pytest
+from datetime import date, datetime, time
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from models.sleep_log import SleepLog
+from services.data_service import DataService
+from services.sleep_analytics_service import SleepAnalyticsService, SleepSessionTracker
+from utils.app_context import AppContext
+
+class TestSleepAnalytics:
+    def test_duration_crosses_midnight(self):
+        """Test sleep duration for a sleep crossing midnight."""
+        log = SleepLog("baby", date(2023, 2, 1), time(22, 0), time(2, 30))
+        
+        assert log.end_datetime == datetime(2023, 2, 2, 2, 30)
+        assert log.duration == 270
+
+    def test_merge_segments(self):
+        """Test that adjacent and overlapping segments are merged."""
+        tracker = SleepSessionTracker()
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(13, 0), time(14, 0)))
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(20, 0), time(23, 0)))
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(22, 30), time(1, 0)))
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(14, 0), time(14, 30)))
+        
+        assert tracker.sessions() == [
+            (datetime(2023, 2, 1, 13, 0), datetime(2023, 2, 1, 14, 30)),
+            (datetime(2023, 2, 1, 20, 0), datetime(2023, 2, 2, 1, 0)),
+        ]
+
+    def test_summarize(self):
+        """Test sliding window summary."""
+        # Setup
+        tracker = SleepSessionTracker()
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(18, 0), time(20, 0)))
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 1), time(21, 0), time(5, 0)))
+        tracker.add_sleep_log(SleepLog("baby", date(2023, 2, 2), time(10, 0), time(11, 0)))
+        
+        # Execute
+        summary = tracker.summarize(datetime(2023, 2, 2, 12, 0))
+        
+        # Assert
+        assert summary["total_minutes"] == 11 * 60
+        assert summary["night_minutes"] == 9 * 60
+        assert summary["day_minutes"] == 2 * 60
+        assert summary["longest_stretch_minutes"] == 8 * 60
+        assert summary["wake_windows_minutes"] == [60, 300]
+        
+        assert tracker.daily_totals(date(2023, 2, 1), date(2023, 2, 2)) == {
+            date(2023, 2, 1): 5 * 60,
+            date(2023, 2, 2): 6 * 60,
+        }
+
+    def test_service_updates_incrementally(self, tmp_path):
+        """Test that the service picks up newly added sleep logs."""
+        # Setup
+        data_service = DataService(str(tmp_path), change_feed = True)
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        service = SleepAnalyticsService(data_service)
+        data_service.subscribe_changes(service.on_change)
+        
+        log_controller.add_sleep_log(baby.id, "2023-02-01", "13:00", "14:00")
+        window_end = datetime(2023, 2, 2, 0, 0)
+        assert service.summarize(baby.id, window_end)["total_minutes"] == 60
+        
+        # Execute
+        log_controller.add_sleep_log(baby.id, "2023-02-01", "22:00", "02:00")
+        
+        # Assert
+        assert service.summarize(baby.id, window_end)["total_minutes"] == 180
+        assert SleepAnalyticsService(data_service).summarize(baby.id, window_end)["total_minutes"] == 180
+
+    def test_context_service_follows_changes(self, tmp_path):
+        """Test that the context's service sees archived logs and drops trackers on edits."""
+        # Setup
+        context = AppContext(str(tmp_path))
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_sleep_log(baby.id, "2023-01-10", "13:00", "14:00")
+        log = context.daily_log_controller.add_sleep_log(baby.id, "2023-02-01", "13:00", "14:30")
+        context.data_service.archive_daily_logs(baby.id, 10, today = date(2023, 2, 1))
+        service = context.sleep_analytics_service
+        before = service.daily_totals(baby.id, date(2023, 1, 10), date(2023, 2, 1))
+
+        # Execute
+        stored = context.data_service.load_baby(baby.id)
+        stored.daily_logs = [entry for entry in stored.daily_logs if entry.id != log.id]
+        context.data_service.save_baby(stored)
+        after = service.daily_totals(baby.id, date(2023, 1, 10), date(2023, 2, 1))
+
+        # Assert
+        assert before[date(2023, 1, 10)] == 60 and before[date(2023, 2, 1)] == 90
+        assert after[date(2023, 1, 10)] == 60 and after[date(2023, 2, 1)] == 0
@@ -0,0 +1,125 @@
+# tests/test_services/test_sync_service.py
+
+import pytest
+from datetime import date
+from services.sync_service import HybridLogicalClock, SyncService
+from utils.app_context import AppContext
+
+class TestSyncService:
+    @pytest.fixture
+    def peers(self, tmp_path):
+        """Create two data directories that share one baby."""
+        phone = AppContext(str(tmp_path / "phone"))
+        tablet = AppContext(str(tmp_path / "tablet"))
+        baby = phone.baby_controller.create_baby("Test Baby", "2023-01-01")
+        SyncService(phone.data_service).sync_with(SyncService(tablet.data_service))
+        return phone, tablet, baby
+
+    def test_clock_orders_after_observed(self):
+        """Test that a clock issues timestamps after any it has seen."""
+        # Setup
+        clock = HybridLogicalClock("a")
+        remote = str(HybridLogicalClock("b", "000000000005000-000003-b"))
+        
+        # Execute
+        clock.observe(remote)
+        first = clock.tick(1000)
+        second = clock.tick(900)
+        
+        # Assert
+        assert first > remote
+        assert second > first
+        assert clock.tick(6000) == "000000000006000-000000-a"
+
+    def test_initial_sync_copies_baby(self, peers):
+        """Test that the first sync creates the baby on the other peer."""
+        # Setup
+        phone, tablet, baby = peers
+        
+        # Assert
+        assert tablet.baby_controller.get_baby_by_id(baby.id).name == "Test Baby"
+
+    def test_concurrent_edits_are_merged(self, peers):
+        """Test that logs added on both devices end up on both."""
+        # Setup
+        phone, tablet, baby = peers
+        phone.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        tablet.daily_log_controller.add_feeding_log(baby.id, "2023-02-01", "10:00", "bottle", amount = 4)
+        tablet.growth_controller.add_growth_record(baby.id, "2023-02-01", weight = 4.2)
+        
+        # Execute
+        result = SyncService(phone.data_service).sync_with(SyncService(tablet.data_service))
+        
+        # Assert
+        assert result == {"pulled": 2, "pushed": 1}
+        for context in (phone, tablet):
+            logs = context.daily_log_controller.get_daily_logs(baby.id)
+            assert [log.log_type for log in logs] == ["diaper", "feeding"]
+            assert len(context.growth_controller.get_growth_records(baby.id)) == 1
+        assert SyncService(phone.data_service).sync_with(SyncService(tablet.data_service)) == {"pulled": 0, "pushed": 0}
+
+    def test_conflict_resolves_the_same_way(self, peers):
+        """Test that conflicting edits converge on the later version."""
+        # Setup
+        phone, tablet, baby = peers
+        phone.baby_controller.update_baby(baby.id, name = "Phone Name")
+        tablet_sync = SyncService(tablet.data_service)
+        tablet_sync.scan()
+        tablet.baby_controller.update_baby(baby.id, name = "Tablet Name")
+        
+        # Execute
+        SyncService(phone.data_service).sync_with(tablet_sync)
+        
+        # Assert
+        assert phone.baby_controller.get_baby_by_id(baby.id).name == "Tablet Name"
+        assert tablet.baby_controller.get_baby_by_id(baby.id).name == "Tablet Name"
+
+    def test_delete_propagates(self, peers):
+        """Test that a deleted baby is deleted on the other peer."""
+        # Setup
+        phone, tablet, baby = peers
+        
+        # Execute
+        tablet.baby_controller.delete_baby(baby.id)
+        SyncService(phone.data_service).sync_with(SyncService(tablet.data_service))
+        
+        # Assert
+        assert phone.baby_controller.get_baby_by_id(baby.id) is None
+
+    def test_pull_reads_only_new_entries(self, peers):
+        """Test that a pull starts from the stored cursor."""
+        # Setup
+        phone, tablet, baby = peers
+        phone_sync = SyncService(phone.data_service)
+        tablet_sync = SyncService(tablet.data_service)
+        cursor = tablet_sync.state["cursors"][phone_sync.node_id]
+        phone.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        phone_sync.scan()
+        
+        # Execute
+        entries, _ = phone_sync.changes_since(cursor)
+        
+        # Assert
+        assert [entry["key"].split(":")[0] for entry in entries] == ["daily_logs"]
+
+    def test_delete_reaches_archived_log(self, peers):
+        """Test that a remote delete removes a log archived on this peer."""
+        # Setup
+        phone, tablet, baby = peers
+        log = phone.daily_log_controller.add_diaper_log(baby.id, "2023-02-01", "09:00", "wet")
+        phone_sync = SyncService(phone.data_service)
+        tablet_sync = SyncService(tablet.data_service)
+        phone_sync.sync_with(tablet_sync)
+        phone.data_service.archive_daily_logs(baby.id, today = date(2023, 6, 1))
+        tablet_baby = tablet.data_service.load_baby(baby.id)
+        tablet_baby.daily_logs = []
+        tablet.data_service.save_baby(tablet_baby)
+        
+        # Execute
+        phone_sync.sync_with(tablet_sync)
+        
+        # Assert
+        assert phone.data_service.load_daily_logs(baby.id) == []
+        assert list(phone.data_service.iter_archived_log_dicts(baby.id)) == []
+        assert phone_sync.sync_with(tablet_sync) == {"pulled": 0, "pushed": 0}
+        assert log.id not in [log.id for log in tablet.data_service.load_daily_logs(baby.id)]
@@ -0,0 +1,130 @@
+# tests/test_services/test_tracker_server.py
+
+import threading
+import pytest
+from services.tracker_server import TrackerClient, TrackerServer
+
+class TestTrackerServer:
+    @pytest.fixture
+    def server(self, tmp_path):
+        """Tracker server on a free local port."""
+        server = TrackerServer(("127.0.0.1", 0), str(tmp_path), workers = 4)
+        thread = threading.Thread(target = server.serve_forever, daemon = True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def client(self, server):
+        """Client for the test server."""
+        host, port = server.server_address[:2]
+        return TrackerClient(f"{host}:{port}")
+
+    def test_commands_over_keep_alive_connection(self, server):
+        """Test running writes and reads through one client connection."""
+        # Setup
+        client = self.client(server)
+        
+        # Execute
+        baby = client.call(["baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01"])
+        connection = client.connection
+        client.call(["log", "diaper", "--baby", baby["id"], "--date", "2023-02-01", "--time", "09:00", "--type", "wet"])
+        logs = client.call(["log", "list", "--baby", baby["id"]])
+        
+        # Assert
+        assert client.connection is connection
+        assert [log["diaper_type"] for log in logs] == ["wet"]
+        assert "error" in client.call(["log", "list", "--baby", "missing"])
+        assert "error" in client.call(["serve"])
+        client.close()
+
+    def test_concurrent_writes_are_serialized(self, server):
+        """Test that concurrent clients do not lose each other's writes."""
+        # Setup
+        baby = self.client(server).call(["baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01"])
+        
+        def add_logs(hour):
+            client = self.client(server)
+            for minute in range(10):
+                client.call(["log", "diaper", "--baby", baby["id"], "--date", "2023-02-01",
+                             "--time", f"{hour:02d}:{minute:02d}", "--type", "wet"])
+            client.close()
+        
+        # Execute
+        threads = [threading.Thread(target = add_logs, args = (hour,)) for hour in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # Assert
+        assert len(self.client(server).call(["log", "list", "--baby", baby["id"]])) == 40
+
+    def test_path_commands_refused(self, server, tmp_path):
+        """Test that commands touching server paths are not available to clients."""
+        # Setup
+        client = self.client(server)
+        baby = client.call(["baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01"])
+
+        # Execute
+        results = [
+            client.call(["export", str(tmp_path / "export")]),
+            client.call(["backup", "restore", str(tmp_path / "backups")]),
+            client.call(["report", "baby", baby["id"], "--output", str(tmp_path / "report.html")]),
+            client.call(["fsck", "--repair"]),
+        ]
+
+        # Assert
+        assert all("not available" in result["error"] for result in results)
+        assert not (tmp_path / "export").exists()
+        assert "report" in client.call(["report", "baby", baby["id"]])
+        client.close()
+
+    def test_token_required(self, tmp_path):
+        """Test that non-loopback binds need a token and that the token is checked."""
+        # Setup
+        with pytest.raises(ValueError):
+            TrackerServer(("0.0.0.0", 0), str(tmp_path))
+        server = TrackerServer(("127.0.0.1", 0), str(tmp_path), token = "secret")
+        thread = threading.Thread(target = server.serve_forever, daemon = True)
+        thread.start()
+        host, port = server.server_address[:2]
+
+        # Execute
+        denied = TrackerClient(f"{host}:{port}", token = "wrong").call(["baby", "list"])
+        allowed = TrackerClient(f"{host}:{port}", token = "secret").call(["baby", "list"])
+        server.shutdown()
+        server.server_close()
+
+        # Assert
+        assert "token" in denied["error"]
+        assert allowed == []
+
+    def test_shared_context_is_safe_for_readers(self, tmp_path, monkeypatch):
+        """Test that cached babies are handed out as copies, archives are read once and services are built once."""
+        # Setup
+        from datetime import date
+        from utils.app_context import AppContext
+        context = AppContext(str(tmp_path), cached = True)
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_diaper_log(baby.id, "2023-01-02", "09:00", "wet")
+        context.data_service.archive_daily_logs(baby.id, 30, today = date(2023, 4, 1))
+        reads = []
+        read_segment = context.data_service._read_archive_segment
+        monkeypatch.setattr(context.data_service, "_read_archive_segment", lambda *args: reads.append(args) or read_segment(*args))
+
+        # Execute
+        context.data_service.load_baby(baby.id).name = "Changed"
+        logs = [context.data_service.load_daily_logs(baby.id) for _ in range(3)]
+        services = []
+        threads = [threading.Thread(target = lambda: services.append(context.daily_summary_service)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert context.data_service.load_baby(baby.id).name == "Test Baby"
+        assert [len(day_logs) for day_logs in logs] == [1, 1, 1]
+        assert len(reads) == 1
+        assert all(service is services[0] for service in services)
@@ -0,0 +1,112 @@
+# tests/test_views/test_command_view.py
+
+import io
+import json
+from datetime import date
+from services.data_service import DataService
+from views.command_view import CommandView
+
+class TestCommandView:
+    def run(self, tmp_path, *argv):
+        """Run a command line and return exit status and parsed JSON lines."""
+        output = io.StringIO()
+        status = CommandView(str(tmp_path / "data"), output).run(list(argv))
+        return status, [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_single_commands(self, tmp_path):
+        """Test adding and listing through individual commands."""
+        # Execute
+        status, [baby] = self.run(tmp_path, "baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01")
+        assert status == 0
+        
+        status, [log] = self.run(tmp_path, "log", "feeding", "--baby", baby["id"], "--date", "2023-02-01",
+                                 "--time", "08:30", "--type", "bottle", "--amount", "120")
+        assert status == 0
+        
+        status, [logs] = self.run(tmp_path, "log", "list", "--baby", baby["id"])
+        
+        # Assert
+        assert status == 0
+        assert [entry["id"] for entry in logs] == [log["id"]]
+        assert logs[0]["amount"] == 120.0
+
+    def test_errors(self, tmp_path):
+        """Test that errors are reported as JSON with a non-zero status."""
+        status, [result] = self.run(tmp_path, "log", "list", "--baby", "missing")
+        assert status == 1
+        assert "not found" in result["error"]
+        
+        status, [result] = self.run(tmp_path, "baby", "frobnicate")
+        assert status == 2
+        assert "error" in result
+
+    def test_batch(self, tmp_path):
+        """Test running many commands from one batch file."""
+        # Setup
+        status, [baby] = self.run(tmp_path, "baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01")
+        batch_path = tmp_path / "commands.txt"
+        batch_path.write_text(
+            "# comment\n"
+            f"log diaper --baby {baby['id']} --date 2023-02-01 --time 09:00 --type wet --notes 'small rash'\n"
+            f"log sleep --baby {baby['id']} --date 2023-02-01 --start 22:00 --end 01:00\n"
+            "log diaper --baby nope --date 2023-02-01 --time 09:00 --type wet\n"
+            "search rash\n"
+        )
+        
+        # Execute
+        status, results = self.run(tmp_path, "--batch", str(batch_path))
+        
+        # Assert
+        assert status == 1
+        assert len(results) == 4
+        assert results[0]["diaper_type"] == "wet"
+        assert results[1]["end_time"] == "01:00:00"
+        assert "error" in results[2]
+        assert [entry["notes"] for entry in results[3]] == ["small rash"]
+
+    def test_batch_continues_after_file_errors(self, tmp_path):
+        """Test that a command failing with a file error is reported and the batch carries on."""
+        # Setup
+        batch_path = tmp_path / "commands.txt"
+        batch_path.write_text(f"import {tmp_path / 'nosuch.csv'}\nbaby list\n")
+
+        # Execute
+        status, results = self.run(tmp_path, "--batch", str(batch_path))
+
+        # Assert
+        assert status == 1
+        assert "nosuch.csv" in results[0]["error"]
+        assert results[1] == []
+
+    def test_report_sees_writes_from_other_processes(self, tmp_path):
+        """Test that reports include writes made by other processes after the aggregates were built."""
+        # Setup
+        data_dir = str(tmp_path / "data")
+        view = CommandView(data_dir)
+        baby = view.call(["baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01"])
+        view.call(["report", "baby", baby["id"], "--format", "markdown"])
+        today = date.today().isoformat()
+
+        # Execute
+        CommandView(data_dir).call(["log", "diaper", "--baby", baby["id"], "--date", today, "--time", "00:00", "--type", "wet"])
+        report = view.call(["report", "baby", baby["id"], "--format", "markdown"])
+
+        # Assert
+        assert f"| {today} | 0 | 0 | 0 | 0 | 0.0 | 1 | 1 | 0 |" in report["report"]
+
+    def test_baby_show_includes_archived_logs(self, tmp_path):
+        """Test that baby show lists logs moved to the archive."""
+        # Setup
+        status, [baby] = self.run(tmp_path, "baby", "add", "--name", "Test Baby", "--birthdate", "2023-01-01")
+        status, [old] = self.run(tmp_path, "log", "feeding", "--baby", baby["id"], "--date", "2023-01-05",
+                                 "--time", "08:00", "--type", "bottle")
+        status, [new] = self.run(tmp_path, "log", "feeding", "--baby", baby["id"], "--date", "2023-03-30",
+                                 "--time", "08:00", "--type", "bottle")
+        DataService(str(tmp_path / "data")).archive_daily_logs(baby["id"], 30, today = date(2023, 4, 1))
+
+        # Execute
+        status, [shown] = self.run(tmp_path, "baby", "show", baby["id"])
+
+        # Assert
+        assert status == 0
+        assert [log["id"] for log in shown["daily_logs"]] == [old["id"], new["id"]]
@@ -0,0 +1,63 @@
+# tests/test_views/test_desktop_view.py
+
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+from utils.app_context import AppContext
+from views.desktop_view import COLUMNS, DesktopView, LazyTableModel
+
+@pytest.fixture(scope = "module")
+def app():
+    """Create the Qt application once for the module."""
+    return QApplication.instance() or QApplication([])
+
+class TestDesktopView:
+    def test_fetches_in_batches(self, app, tmp_path):
+        """Test that rows are read in date order, one batch per fetchMore."""
+        # Setup
+        context = AppContext(str(tmp_path))
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.daily_log_controller.add_logs(baby.id, [
+            {"log_type": "diaper", "date": f"2023-02-{day:02d}", "time": "09:00", "diaper_type": "wet"}
+            for day in range(10, 0, -1)
+        ])
+        records = context.data_service.iter_records(baby.id, "daily_logs")
+        model = LazyTableModel(COLUMNS["daily_logs"], batch_size = 4)
+        
+        # Execute
+        model.set_records(records)
+        
+        # Assert
+        assert model.rowCount() == 0
+        assert model.canFetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 4
+        assert model.data(model.index(0, 0)) == "2023-02-01"
+        assert model.data(model.index(3, 0)) == "2023-02-04"
+        model.fetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 10
+        assert not model.canFetchMore()
+        assert model.data(model.index(9, 3)) == "wet"
+
+    def test_window_lists_babies(self, app, tmp_path):
+        """Test that the window loads the first baby's records."""
+        # Setup
+        context = AppContext(str(tmp_path))
+        baby = context.baby_controller.create_baby("Test Baby", "2023-01-01")
+        context.growth_controller.add_growth_record(baby.id, "2023-02-01", weight = 4.2)
+        
+        # Execute
+        window = DesktopView(context)
+        model = window.models["growth_records"]
+        while model.canFetchMore():
+            model.fetchMore()
+        
+        # Assert
+        assert window.baby_selector.currentData() == baby.id
+        assert model.rowCount() == 1
+        assert model.data(model.index(0, 1)) == "4.2"
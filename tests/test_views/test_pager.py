@@ -0,0 +1,86 @@
+# tests/test_views/test_pager.py
+
+import io
+from datetime import date, timedelta
+from controllers.baby_controller import BabyController
+from controllers.daily_log_controller import DailyLogController
+from services.data_service import DataService
+from views.pager import Pager
+
+class TestPager:
+    def test_pages_are_fetched_and_formatted_lazily(self):
+        """Test that only the items needed for the visible page are pulled and formatted."""
+        # Setup
+        pulled = []
+        formatted = []
+        
+        def items():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        
+        def format_item(number, item):
+            formatted.append(item)
+            return [f"{number}: {item}"]
+        
+        output = io.StringIO()
+        pager = Pager(items(), format_item, page_size = 10, title = "Items", output = output)
+        
+        # Execute
+        pager.show()
+        
+        # Assert
+        assert formatted == list(range(10))
+        assert len(pulled) == 11 # one extra to know there is a next page
+        assert output.getvalue().startswith("Items\n1: 0\n")
+        assert "-- Page 1 (more) --" in output.getvalue()
+
+    def test_navigation(self):
+        """Test next, prev and jump to date."""
+        # Setup
+        start = date(2023, 1, 1)
+        days = [start + timedelta(days = i) for i in range(25)]
+        pager = Pager(days, lambda number, day: [day.isoformat()], page_size = 10,
+                      date_key = lambda day: day, output = io.StringIO())
+        
+        # Execute / Assert
+        assert pager.prev_page() is False
+        assert pager.next_page() is True
+        assert pager.next_page() is True
+        assert pager.next_page() is False
+        assert "-- Page 3 (end) --" in pager.render_page()
+        
+        assert pager.jump_to_date(date(2023, 1, 15)) is True
+        assert pager.page == 1
+        assert pager.jump_to_date(date(2024, 1, 1)) is False
+
+    def test_group_headings(self):
+        """Test that group headings are repeated at the top of each page."""
+        items = [("a", 1), ("a", 2), ("b", 3)]
+        pager = Pager(items, lambda number, item: [str(item[1])], page_size = 2,
+                      group_key = lambda item: item[0], format_group = lambda key: f"## {key} ##")
+        
+        assert pager.render_page(0).splitlines()[:4] == ["", "## a ##", "1", "2"]
+        assert pager.render_page(1).splitlines()[:3] == ["", "## b ##", "3"]
+
+    def test_controller_streams_into_pager(self, tmp_path):
+        """Test that a baby's log history is handed to the pager as a stream, archived logs first."""
+        # Setup
+        data_service = DataService(str(tmp_path))
+        baby = BabyController(data_service).create_baby("Test Baby", "2023-01-01")
+        log_controller = DailyLogController(data_service)
+        log_controller.add_logs(baby.id, [
+            {"log_type": "diaper", "date": (date(2023, 1, 1) + timedelta(days = day)).isoformat(), "time": "09:00", "diaper_type": "wet"}
+            for day in range(30)
+        ])
+        data_service.archive_daily_logs(baby.id, 10, today = date(2023, 1, 30))
+        output = io.StringIO()
+
+        # Execute
+        logs = log_controller.iter_daily_logs(baby.id)
+        Pager(logs, lambda number, log: [log.date.isoformat()], page_size = 5, output = output).show()
+
+        # Assert
+        assert iter(logs) is logs
+        assert output.getvalue().startswith("2023-01-01\n")
+        assert list(logs)[-1].date == date(2023, 1, 30)
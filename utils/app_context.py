@@ -0,0 +1,146 @@
+# utils/app_context.py
+
+import threading
+
+class AppContext:
+    def __init__(self, data_dir = "data", cached = False):
+        """
+        Initialize the application context.
+
+        Services and controllers are imported and constructed on first use,
+        so an entry point only pays for the subsystems it touches. Construction
+        is serialized, so threads sharing a context (see TrackerServer) get
+        the same instances.
+
+        Args:
+            data_dir (str, optional): Directory where data is stored. Defaults to "data".
+            cached (bool, optional): Keep loaded babies in memory (for long-running
+                processes). Defaults to False.
+        """
+        self.data_dir = data_dir
+        self.cached = cached
+        self._instances = {}
+        # Reentrant: factories build the subsystems they depend on
+        self._lock = threading.RLock()
+
+    def _get(self, name, factory):
+        """Create a subsystem on first use and reuse it afterwards."""
+        if name not in self._instances:
+            with self._lock:
+                if name not in self._instances:
+                    self._instances[name] = factory()
+        return self._instances[name]
+
+    @property
+    def data_service(self):
+        """DataService with the change feed enabled and search indexing attached."""
+        def create():
+            from services.search_service import SearchService
+            if self.cached:
+                from services.cached_data_service import CachedDataService
+                data_service = CachedDataService(self.data_dir, change_feed = True)
+            else:
+                from services.data_service import DataService
+                data_service = DataService(self.data_dir, change_feed = True)
+            # Keep the search index current for every write
+            self._instances["search_service"] = SearchService(data_service)
+            data_service.add_listener(self._instances["search_service"].on_baby_changed)
+            return data_service
+        return self._get("data_service", create)
+
+    @property
+    def search_service(self):
+        """SearchService kept current by the data service."""
+        self.data_service
+        return self._instances["search_service"]
+
+    @property
+    def age_service(self):
+        """AgeService shared by every view, so its per-day cache is reused."""
+        def create():
+            from services.age_service import AgeService
+            return AgeService()
+        return self._get("age_service", create)
+
+    @property
+    def baby_controller(self):
+        """BabyController, created on first use."""
+        def create():
+            from controllers.baby_controller import BabyController
+            return BabyController(self.data_service)
+        return self._get("baby_controller", create)
+
+    @property
+    def growth_controller(self):
+        """GrowthController, created on first use."""
+        def create():
+            from controllers.growth_controller import GrowthController
+            return GrowthController(self.data_service)
+        return self._get("growth_controller", create)
+
+    @property
+    def milestone_controller(self):
+        """MilestoneController, created on first use."""
+        def create():
+            from controllers.milestone_controller import MilestoneController
+            return MilestoneController(self.data_service)
+        return self._get("milestone_controller", create)
+
+    @property
+    def daily_log_controller(self):
+        """DailyLogController, created on first use."""
+        def create():
+            from controllers.daily_log_controller import DailyLogController
+            return DailyLogController(self.data_service)
+        return self._get("daily_log_controller", create)
+
+    @property
+    def daily_summary_service(self):
+        """DailySummaryService kept current by every save, in this process or another."""
+        def create():
+            from services.daily_summary_service import DailySummaryService
+            summary_service = DailySummaryService(self.data_service)
+            self.data_service.subscribe_changes(summary_service.on_change)
+            summary_service.follow_feed(self.data_service.change_feed)
+            return summary_service
+        return self._get("daily_summary_service", create)
+
+    @property
+    def heatmap_service(self):
+        """HeatmapService whose cached weeks are invalidated by the change feed."""
+        def create():
+            from services.heatmap_service import HeatmapService
+            heatmap_service = HeatmapService(self.data_service)
+            self.data_service.subscribe_changes(heatmap_service.on_change)
+            return heatmap_service
+        return self._get("heatmap_service", create)
+
+    @property
+    def log_index_service(self):
+        """LogIndexService that catches up from the change feed on each read."""
+        def create():
+            from services.log_index_service import LogIndexService
+            log_index_service = LogIndexService(self.data_service)
+            self.data_service.add_listener(log_index_service.on_baby_changed)
+            return log_index_service
+        return self._get("log_index_service", create)
+
+    @property
+    def sleep_analytics_service(self):
+        """SleepAnalyticsService kept current by the data service."""
+        def create():
+            from services.sleep_analytics_service import SleepAnalyticsService
+            sleep_analytics_service = SleepAnalyticsService(self.data_service)
+            self.data_service.subscribe_changes(sleep_analytics_service.on_change)
+            return sleep_analytics_service
+        return self._get("sleep_analytics_service", create)
+
+    @property
+    def feeding_stats_service(self):
+        """FeedingStatsService kept current by the data service."""
+        def create():
+            from services.feeding_stats_service import FeedingStatsService
+            feeding_stats_service = FeedingStatsService(self.data_service)
+            self.data_service.subscribe_changes(feeding_stats_service.on_change)
+            return feeding_stats_service
+        return self._get("feeding_stats_service", create)
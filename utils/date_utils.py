@@ -0,0 +1,96 @@
+# utils/date_utils.py
+
+from calendar import monthrange
+from datetime import datetime
+
+def parse_date_time(date, time):
+    """
+    Parse date and time strings to datetime objects.
+
+    Args:
+        date (datetime or str): Date (YYYY-MM-DD)
+        time (datetime or str): Time (HH:MM)
+
+    Returns:
+        tuple: (datetime.date, datetime.time)
+    """
+    if isinstance(date, str):
+        date = datetime.strptime(date, "%Y-%m-%d").date()
+    elif isinstance(date, datetime):
+        date = date.date()
+
+    if isinstance(time, str):
+        time = datetime.strptime(time, "%H:%M").time()
+    elif isinstance(time, datetime):
+        time = time.time()
+
+    return date, time
+
+
+def to_date(value):
+    """Reduce a datetime to its date; dates pass through."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def add_months(start, months):
+    """
+    Add calendar months to a date, clamping to the end of shorter months.
+
+    Args:
+        start (date or datetime): Starting date
+        months (int): Months to add
+
+    Returns:
+        date: Same day of month, or the month's last day if it is shorter
+    """
+    start = to_date(start)
+    month_index = start.year * 12 + start.month - 1 + months
+    year, month = divmod(month_index, 12)
+    return start.replace(year = year, month = month + 1, day = min(start.day, monthrange(year, month + 1)[1]))
+
+
+def months_between(start, end):
+    """
+    Count whole calendar months from start to end.
+
+    A month is complete on the same day of the following month (or that
+    month's last day, when it is shorter).
+
+    Args:
+        start (date or datetime): Earlier date, e.g. a birthdate
+        end (date or datetime): Later date
+
+    Returns:
+        int: Whole months elapsed (negative if end is before start)
+    """
+    start, end = to_date(start), to_date(end)
+    months = (end.year - start.year) * 12 + end.month - start.month
+    if months > 0 and add_months(start, months) > end:
+        months -= 1
+    elif months < 0 and add_months(start, months) < end:
+        months += 1
+    return months
+
+
+def calendar_age(birthdate, as_of):
+    """
+    Compute an age in calendar years, months and days.
+
+    Args:
+        birthdate (date or datetime): Date of birth
+        as_of (date or datetime): Date to measure the age at
+
+    Returns:
+        dict: Contains years, months, days, total_months and total_days
+    """
+    birthdate, as_of = to_date(birthdate), to_date(as_of)
+    total_months = max(months_between(birthdate, as_of), 0)
+    anniversary = add_months(birthdate, total_months)
+
+    return {
+        "years": total_months // 12,
+        "months": total_months % 12,
+        "days": max((as_of - anniversary).days, 0),
+        "total_months": total_months,
+        "total_days": (as_of - birthdate).days
+    }
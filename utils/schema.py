@@ -0,0 +1,77 @@
+# utils/schema.py
+
+# Version written into every saved baby document; files without one are version 1
+SCHEMA_VERSION = 3
+
+
+def _add_record_lists(baby_dict):
+    """
+    1 -> 2: milestones and daily logs were added after growth records.
+
+    Give every document all three record lists and the optional baby fields.
+    """
+    for record_type in ("growth_records", "milestones", "daily_logs"):
+        baby_dict.setdefault(record_type, [])
+    baby_dict.setdefault("gender", None)
+    baby_dict.setdefault("notes", None)
+
+
+def _fill_record_fields(baby_dict):
+    """
+    2 -> 3: records carry every field their to_dict writes.
+
+    Optional fields default to None, and sleep logs get start_time (which
+    SleepLog.to_dict added alongside time).
+    """
+    defaults = {
+        "growth_records": ("weight", "height", "head_circumference", "notes"),
+        "milestones": ("achieved_date", "expected_range", "notes"),
+    }
+    for record_type, fields in defaults.items():
+        for record_dict in baby_dict[record_type]:
+            for field in fields:
+                record_dict.setdefault(field, None)
+
+    log_fields = {
+        "feeding": ("feeding_type", "amount", "duration"),
+        "sleep": ("end_time", "quality"),
+        "diaper": ("diaper_type",),
+    }
+    for log_dict in baby_dict["daily_logs"]:
+        log_dict.setdefault("notes", None)
+        for field in log_fields.get(log_dict.get("log_type"), ()):
+            log_dict.setdefault(field, None)
+        if log_dict.get("log_type") == "sleep":
+            log_dict.setdefault("start_time", log_dict["time"])
+
+
+# Migrations by the version they upgrade from; each edits a document in place
+MIGRATIONS = {
+    1: _add_record_lists,
+    2: _fill_record_fields,
+}
+
+
+def upgrade_document(baby_dict):
+    """
+    Bring a stored baby document up to SCHEMA_VERSION.
+
+    Args:
+        baby_dict (dict): Document as read from a baby file; modified in place
+
+    Returns:
+        int: Version the document had before upgrading
+
+    Raises:
+        ValueError: If the document is newer than this code understands
+    """
+    version = baby_dict.get("schema_version", 1)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Baby {baby_dict.get('id')} has schema version {version}, newer than {SCHEMA_VERSION}")
+
+    original = version
+    while version < SCHEMA_VERSION:
+        MIGRATIONS[version](baby_dict)
+        version += 1
+    baby_dict["schema_version"] = version
+    return original
@@ -2,8 +2,11 @@
 
 import datetime
 
+from services.age_service import AgeService
+from views.pager import Pager
+
 class CLIView:
-    def __init__(self, baby_controller, growth_controller, milestone_controller, daily_log_controller):
+    def __init__(self, baby_controller, growth_controller, milestone_controller, daily_log_controller, age_service = None):
         """
         Initialize CLI view.
         
@@ -12,14 +15,24 @@ class CLIView:
             growth_controller (GrowthController): Controller for growth records operations
             milestone_controller (MilestoneController): Controller for milestone operations
             daily_log_controller (DailyLogController): Controller for log operations
+            age_service (AgeService, optional): Shared age calculator. Defaults to None (create one).
         """
         self.baby_controller = baby_controller
         self.growth_controller = growth_controller
         self.milestone_controller = milestone_controller
         self.daily_log_controller = daily_log_controller
+        self.age_service = age_service or AgeService()
+        self.page_size = 20
 
     def display_main_menu(self):
         """Display the main menu and get user choice"""
+        self.print_main_menu()
+        
+        choice = input("\nEnter your choice: ")
+        return choice
+
+    def print_main_menu(self):
+        """Print the main menu"""
         print("\n===== Baby Tracker =====")
         print("1. Manage Babies")
         print("2. Track Growth")
@@ -27,9 +40,6 @@ class CLIView:
         print("4. Daily Logs")
         print("5. Reports")
         print("0. Exit")
-        
-        choice = input("\nEnter your choice: ")
-        return choice
 
     def run(self):
         """Run the CLI application."""
@@ -110,8 +120,10 @@ class CLIView:
             print("No babies found.")
             return
 
-        for i, baby in enumerate(babies, 1):
-            age_info = baby.calculate_age()
+        # One batch for every baby, cached for the rest of the day
+        ages = self.age_service.ages([baby.birthdate for baby in babies])
+
+        for i, (baby, age_info) in enumerate(zip(babies, ages), 1):
             age_str = ""
             if age_info["years"] > 0:
                 age_str += f"{age_info['years']} year(s) "
@@ -151,7 +163,7 @@ class CLIView:
         print(f"ID: {baby.id}")
         print(f"Birthdate: {baby.birthdate.strftime('%Y-%m-%d')}")
         
-        age_info = baby.calculate_age()
+        age_info = self.age_service.age(baby.birthdate)
         age_str = ""
         
         if age_info["years"] > 0:
@@ -410,28 +422,32 @@ class CLIView:
 
     def _display_growth_records(self, baby):
         """Display growth record for baby."""
-        records = self.growth_controller.get_growth_records(baby.id)
-        
-        if not records:
-            print(f"\n{baby.name} has no growth records.")
-            return
         
-        print(f"\n===== Growth Records for {baby.name} =====")
-        
-        # Display as table
-        print("\nDate       | Weight (kg) | Height (cm) | Head Circ. (cm) | Notes")
-        print("-" * 75)
-        
-        for record in records:
+        def format_record(number, record):
             date_str = record.date.strftime("%Y-%m-%d")
             weight_str = f"{record.weight:.2f}" if record.weight is not None else "N/A"
             height_str = f"{record.height:.2f}" if record.height is not None else "N/A"
             hc_str = f"{record.head_circumference:.1f}" if record.head_circumference is not None else "N/A"
             notes_str = record.notes if record.notes else ""
             
-            print(f"{date_str} | {weight_str:^11} | {height_str:^11} | {hc_str:^15} | {notes_str}")
-            
-        input("\nPress Enter to continue...")
+            return [f"{date_str} | {weight_str:^11} | {height_str:^11} | {hc_str:^15} | {notes_str}"]
+        
+        # Display as table; records are built only as pages reach them
+        pager = Pager(
+            self.growth_controller.iter_growth_records(baby.id),
+            format_record,
+            self.page_size,
+            title = f"\n===== Growth Records for {baby.name} =====",
+            header = [
+                "\nDate       | Weight (kg) | Height (cm) | Head Circ. (cm) | Notes",
+                "-" * 75
+            ],
+            date_key = lambda record: record.date
+        )
+        if pager.is_empty():
+            print(f"\n{baby.name} has no growth records.")
+            return
+        pager.run()
         
     
     def update_growth_record(self):
@@ -771,35 +787,36 @@ class CLIView:
             print(f"\n{baby.name} has no recorded milestones.")
             return
         
-        print(f"\n===== Milestones for {baby.name} =====")
-        
-        # Group by category
-        categories = {}
+        # Group by category, keeping the controller's order within each category
+        category_order = {}
         for milestone in milestones:
-            if milestone.category not in categories:
-                categories[milestone.category] = []
-            categories[milestone.category].append(milestone)
+            category_order.setdefault(milestone.category, len(category_order))
+        milestones = sorted(milestones, key = lambda m: category_order[m.category])
+        
+        def format_milestone(number, milestone):
+            status = "✓ Achieved" if milestone.is_achieved() else "○ Not achieved"
+            lines = [f"{number}. {milestone.name} - {status}"]
             
-        # Display by category
-        for category, cat_milestones in categories.items():
-            print(f"\n## {category.capitalize()} ##")
-            for i, milestone in enumerate(cat_milestones, 1):
-                status = "✓ Achieved" if milestone.is_achieved() else "○ Not achieved"
-                date_str = milestone.achieved_date.strftime("%Y-%m-%d") if milestone.achieved_date else "N/A"
-                
-                print(f"{i}. {milestone.name} - {status}")
-                if milestone.achieved_date:
-                    print(f"   Date achieved: {date_str}")
-
-                if milestone.expected_range:
-                    min_months = milestone.expected_range.get("min_months", "?")
-                    max_months = milestone.expected_range.get("max_months", "?")
-                    print(f"   Expected age: {min_months}-{max_months} months")
-                
-                if milestone.notes:
-                    print(f"   Notes: {milestone.notes}")
-                    
-        input("\nPress Enter to continue...")
+            if milestone.achieved_date:
+                lines.append(f"   Date achieved: {milestone.achieved_date.strftime('%Y-%m-%d')}")
+            
+            if milestone.expected_range:
+                min_months = milestone.expected_range.get("min_months", "?")
+                max_months = milestone.expected_range.get("max_months", "?")
+                lines.append(f"   Expected age: {min_months}-{max_months} months")
+            
+            if milestone.notes:
+                lines.append(f"   Notes: {milestone.notes}")
+            return lines
+        
+        Pager(
+            milestones,
+            format_milestone,
+            self.page_size,
+            title = f"\n===== Milestones for {baby.name} =====",
+            group_key = lambda milestone: milestone.category,
+            format_group = lambda category: f"## {category.capitalize()} ##"
+        ).run()
 
     def update_milestone(self):
         """Update a milestone."""
@@ -1034,8 +1051,7 @@ class CLIView:
                 baby = babies[choice - 1]
                 
                 # Calculate baby's age in months
-                age_info = baby.calculate_age()
-                months_age = age_info["years"] * 12 + age_info["months"]
+                months_age = self.age_service.months_old(baby.birthdate)
                 
                 # Get milestones suggestions
                 suggestions = self.milestone_controller.get_milestone_suggestions(months_age)
@@ -1423,72 +1439,75 @@ class CLIView:
                             break
                         except ValueError:
                             print("Invalid date format. Please use YYYY-MM-DD.")
-                # Get logs
-                logs = self.daily_log_controller.get_daily_logs(baby.id, date_filter)
+                # Get logs; the full history is streamed as pages reach it
+                if date_filter:
+                    logs = self.daily_log_controller.get_daily_logs(baby.id, date_filter) or []
+                else:
+                    logs = self.daily_log_controller.iter_daily_logs(baby.id)
                 
-                if not logs:
+                if not self._display_daily_logs(baby, logs):
                     if date_filter:
                         print(f"\n{baby.name} has no logs for {date_filter.strftime('%Y-%m-%d')}.")
                     else:
                         print(f"\n{baby.name} has no logs.")
-                    return
-                
-                self._display_daily_logs(baby, logs)
             else:
                 print("Invalid selection.")
         except ValueError:
             print("Please enter a valid number.")
                 
     def _display_daily_logs(self, baby, logs):
-        """Display daily logs for baby."""
-        date_str = logs[0].date.strftime("%Y-%m-%d") if logs else ""
-        print(f"\n===== Daily Logs for {baby.name} on {date_str} =====")
-        
-        # Group logs by date
-        logs_by_date= {}
-        for log in logs:
-            date_str = log.date.strftime("%Y-%m-%d")
-            if date_str not in logs_by_date:
-                logs_by_date[date_str] = []
-            logs_by_date[date_str].append(log)
-            
-        # Display logs by date
-        for date_str, day_logs in sorted(logs_by_date.items()):
-            print(f"\n=== {date_str} ===")
+        """
+        Display daily logs for baby.
+
+        Returns:
+            bool: False if there was nothing to display
+        """
+        
+        def format_log(number, log):
+            time_str = log.time.strftime("%H:%M")
+            lines = []
             
-            # Sort logs by time
-            day_logs.sort(key = lambda log: log.time)
+            if log.log_type == "feeding":
+                feeding_type = log.feeding_type
+                amount_str = f"{log.amount} ml/oz" if log.amount else "not recorded"
+                duration_str = f"{log.duration} minutes" if log.duration else "not recorded"
+                
+                lines.append(f"{time_str} - Feeding ({feeding_type})")
+                if feeding_type == "bottle" or feeding_type == "solid":
+                    lines.append(f"   Amount: {amount_str}")
+                if feeding_type == "breast":
+                    lines.append(f"   Duration: {duration_str}")
             
-            for log in day_logs:
-                time_str = log.time.strftime("%H:%M")
+            elif log.log_type == "sleep":
+                end_time_str = log.end_time.strftime("%H:%M") if log.end_time else "ongoing"
+                duration_str = f"{log.duration:.1f} minutes" if log.duration else "ongoing"
+                quality_str = log.quality if log.quality else "not recorded"
                 
-                if log.log_type == "feeding":
-                    feeding_type = log.feeding_type
-                    amount_str = f"{log.amount} ml/oz" if log.amount else "not recorded"
-                    duration_str = f"{log.duration} minutes" if log.duration else "not recorded"
-                    
-                    print(f"{time_str} - Feeding ({feeding_type})")
-                    if feeding_type == "bottle" or feeding_type == "solid":
-                        print(f"   Amount: {amount_str}")
-                    if feeding_type == "breast":
-                        print(f"   Duration: {duration_str}")
+                lines.append(f"{time_str} - Sleep (until {end_time_str})")
+                lines.append(f"   Duration: {duration_str}")
+                lines.append(f"   Quality: {quality_str}")
+            
+            elif log.log_type == "diaper":
+                lines.append(f"{time_str} - Diaper ({log.diaper_type})")
                 
-                elif log.log_type == "sleep":
-                    end_time_str = log.end_time.strftime("%H:%M") if log.end_time else "ongoing"
-                    duration_str = f"{log.duration:.1f} minutes" if log.duration else "ongoing"
-                    quality_str = log.quality if log.quality else "not recorded"
-                    
-                    print(f"{time_str} - Sleep (until {end_time_str})")
-                    print(f"   Duration: {duration_str}")
-                    print(f"   Quality: {quality_str}")
+            else:
+                lines.append(f"{time_str} - {log.log_type.capitalize()}")
                 
-                elif log.log_type == "diaper":
-                    print(f"{time_str} - Diaper ({log.diaper_type})")
-                    
-                else:
-                    print(f"{time_str} - {log.log_type.capitalize()}")
-                    
-                if log.notes:
-                    print(f"   Notes: {log.notes}")
-                    
-        input("\nPress Enter to continue...")
\ No newline at end of file
+            if log.notes:
+                lines.append(f"   Notes: {log.notes}")
+            return lines
+        
+        # Logs come sorted by date and time, grouped by date
+        pager = Pager(
+            logs,
+            format_log,
+            self.page_size,
+            title = f"\n===== Daily Logs for {baby.name} =====",
+            group_key = lambda log: log.date,
+            format_group = lambda date: f"=== {date.strftime('%Y-%m-%d')} ===",
+            date_key = lambda log: log.date
+        )
+        if pager.is_empty():
+            return False
+        pager.run()
+        return True
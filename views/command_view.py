@@ -0,0 +1,698 @@
+# views/command_view.py
+
+import argparse
+import json
+import os
+import shlex
+import sys
+
+# Commands that run until interrupted; only available from the command line
+LONG_RUNNING_COMMANDS = ("serve", "dashboard", "desktop")
+
+
+class CommandError(Exception):
+    """Raised for invalid command lines instead of exiting the process."""
+
+
+class _CommandParser(argparse.ArgumentParser):
+    def error(self, message):
+        raise CommandError(message)
+
+
+def _is_error(result):
+    """Check whether a command result reports an error."""
+    return isinstance(result, dict) and "error" in result
+
+
+def _strip_option(argv, option):
+    """Remove an option and its value from an argument list."""
+    stripped = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == option:
+            skip = True
+        elif not arg.startswith(option + "="):
+            stripped.append(arg)
+    return stripped
+
+
+class CommandView:
+    def __init__(self, data_dir = "data", output = None, context = None):
+        """
+        Initialize the non-interactive command view.
+
+        Services and controllers come from a lazily built AppContext, so a
+        command only pays for the subsystems it touches.
+
+        Args:
+            data_dir (str, optional): Directory where data is stored. Defaults to "data".
+            output (file, optional): Stream for JSON results. Defaults to sys.stdout.
+            context (AppContext, optional): Context to run commands against. Defaults to None
+                (created on first use).
+        """
+        self.data_dir = data_dir
+        self.output = output or sys.stdout
+        self._context = context
+        self._client = None
+        self.parser = self._build_parser()
+
+    ################## Lazy subsystems ##################
+
+    @property
+    def context(self):
+        """Application context for the selected data directory."""
+        if self._context is None or self._context.data_dir != self.data_dir:
+            from utils.app_context import AppContext
+            self._context = AppContext(self.data_dir)
+        return self._context
+
+    ################## Parser ##################
+
+    def _build_parser(self):
+        """Build the argument parser for all commands."""
+        parser = _CommandParser(prog = "main.py", description = "Baby Tracker command mode. Results are printed as JSON.")
+        parser.add_argument("--data-dir", help = "Data directory (default: data)")
+        parser.add_argument("--batch", metavar = "FILE", help = "Run one command per line from FILE ('-' for stdin)")
+        parser.add_argument("--server", metavar = "HOST:PORT", help = "Send commands to a running tracker server")
+        commands = parser.add_subparsers(dest = "command")
+
+        # baby
+        baby = commands.add_parser("baby", help = "Manage babies").add_subparsers(dest = "action", required = True)
+        baby.add_parser("list").set_defaults(handler = self.baby_list, read_only = True)
+        add = baby.add_parser("add")
+        add.add_argument("--name", required = True)
+        add.add_argument("--birthdate", required = True, help = "YYYY-MM-DD")
+        add.add_argument("--gender")
+        add.add_argument("--notes")
+        add.set_defaults(handler = self.baby_add)
+        show = baby.add_parser("show")
+        show.add_argument("baby_id")
+        show.set_defaults(handler = self.baby_show, read_only = True)
+        delete = baby.add_parser("delete")
+        delete.add_argument("baby_id")
+        delete.set_defaults(handler = self.baby_delete)
+
+        # log
+        log = commands.add_parser("log", help = "Daily logs").add_subparsers(dest = "action", required = True)
+        feeding = log.add_parser("feeding")
+        self._add_log_arguments(feeding)
+        feeding.add_argument("--time", required = True, help = "HH:MM")
+        feeding.add_argument("--type", dest = "feeding_type", required = True, choices = ["breast", "bottle", "solid"])
+        feeding.add_argument("--amount", type = float)
+        feeding.add_argument("--duration", type = int)
+        feeding.set_defaults(handler = self.log_feeding)
+        sleep = log.add_parser("sleep")
+        self._add_log_arguments(sleep)
+        sleep.add_argument("--start", required = True, help = "HH:MM")
+        sleep.add_argument("--end", help = "HH:MM")
+        sleep.add_argument("--quality", choices = ["good", "fair", "poor"])
+        sleep.set_defaults(handler = self.log_sleep)
+        diaper = log.add_parser("diaper")
+        self._add_log_arguments(diaper)
+        diaper.add_argument("--time", required = True, help = "HH:MM")
+        diaper.add_argument("--type", dest = "diaper_type", required = True, choices = ["wet", "soiled", "both"])
+        diaper.set_defaults(handler = self.log_diaper)
+        log_list = log.add_parser("list")
+        log_list.add_argument("--baby", dest = "baby_id", required = True)
+        log_list.add_argument("--date", help = "YYYY-MM-DD")
+        log_list.set_defaults(handler = self.log_list, read_only = True)
+
+        # growth
+        growth = commands.add_parser("growth", help = "Growth records").add_subparsers(dest = "action", required = True)
+        add = growth.add_parser("add")
+        add.add_argument("--baby", dest = "baby_id", required = True)
+        add.add_argument("--date", required = True, help = "YYYY-MM-DD")
+        add.add_argument("--weight", type = float)
+        add.add_argument("--height", type = float)
+        add.add_argument("--head", dest = "head_circumference", type = float)
+        add.add_argument("--notes")
+        add.set_defaults(handler = self.growth_add)
+        growth_list = growth.add_parser("list")
+        growth_list.add_argument("--baby", dest = "baby_id", required = True)
+        growth_list.set_defaults(handler = self.growth_list, read_only = True)
+
+        # milestone
+        milestone = commands.add_parser("milestone", help = "Milestones").add_subparsers(dest = "action", required = True)
+        add = milestone.add_parser("add")
+        add.add_argument("--baby", dest = "baby_id", required = True)
+        add.add_argument("--name", required = True)
+        add.add_argument("--category", required = True)
+        add.add_argument("--achieved", help = "YYYY-MM-DD")
+        add.add_argument("--min-months", type = int)
+        add.add_argument("--max-months", type = int)
+        add.add_argument("--notes")
+        add.set_defaults(handler = self.milestone_add)
+        milestone_list = milestone.add_parser("list")
+        milestone_list.add_argument("--baby", dest = "baby_id", required = True)
+        milestone_list.set_defaults(handler = self.milestone_list, read_only = True)
+
+        # import / export / search
+        import_parser = commands.add_parser("import", help = "Bulk import logs and growth records")
+        import_parser.add_argument("file")
+        import_parser.add_argument("--format", dest = "file_format", choices = ["csv", "jsonl"])
+        import_parser.set_defaults(handler = self.import_file, local_only = True)
+        export = commands.add_parser("export", help = "Export all data to flat files")
+        export.add_argument("output_dir")
+        export.add_argument("--format", dest = "file_format", choices = ["csv", "jsonl"], default = "csv")
+        export.add_argument("--compress", action = "store_true")
+        export.set_defaults(handler = self.export_all, local_only = True)
+        search = commands.add_parser("search", help = "Search notes")
+        search.add_argument("phrases", nargs = "+")
+        search.add_argument("--baby", dest = "baby_id")
+        search.set_defaults(handler = self.search, read_only = True)
+        query = commands.add_parser("query", help = "Filter daily logs or growth records with a query")
+        query.add_argument("query", help = 'e.g. "feeding feeding_type=bottle amount>120 time>=22:00 date>=-7d"')
+        query.add_argument("--baby", dest = "baby_id")
+        query.add_argument("--limit", type = int)
+        query.set_defaults(handler = self.query, read_only = True)
+        heatmap = commands.add_parser("heatmap", help = "Weekday x hour activity matrices for a baby")
+        heatmap.add_argument("baby_id")
+        heatmap.add_argument("--start", help = "YYYY-MM-DD (default: four weeks before --end)")
+        heatmap.add_argument("--end", help = "YYYY-MM-DD (default: today)")
+        heatmap.set_defaults(handler = self.heatmap, read_only = True)
+        stats = commands.add_parser("stats", help = "Feeding and sleep statistics for a baby").add_subparsers(dest = "action", required = True)
+        stats_feeding = stats.add_parser("feeding")
+        stats_feeding.add_argument("baby_id")
+        stats_feeding.set_defaults(handler = self.stats_feeding, read_only = True)
+        stats_sleep = stats.add_parser("sleep")
+        stats_sleep.add_argument("baby_id")
+        stats_sleep.add_argument("--end", help = "Window end, YYYY-MM-DDTHH:MM (default: now)")
+        stats_sleep.add_argument("--hours", type = int, default = 24, help = "Window length")
+        stats_sleep.add_argument("--days", type = int, default = 7, help = "Days of daily totals, ending on the window's last day")
+        stats_sleep.set_defaults(handler = self.stats_sleep, read_only = True)
+        report = commands.add_parser("report", help = "Checkup reports").add_subparsers(dest = "action", required = True)
+        report_baby = report.add_parser("baby")
+        report_baby.add_argument("baby_id")
+        report_baby.add_argument("--output", help = "File to write (default: include the report in the result)")
+        report_all = report.add_parser("all")
+        report_all.add_argument("output_dir")
+        report_all.add_argument("--workers", type = int, default = os.cpu_count())
+        for report_parser in (report_baby, report_all):
+            report_parser.add_argument("--format", dest = "file_format", choices = ["html", "markdown"], default = "html")
+            report_parser.add_argument("--days", type = int, default = 14, help = "Days of daily aggregates")
+        report_baby.set_defaults(handler = self.report_baby, read_only = True)
+        report_all.set_defaults(handler = self.report_all, read_only = True, local_only = True)
+        changes = commands.add_parser("changes", help = "Read change events after a named cursor")
+        changes.add_argument("--cursor", required = True, help = "Cursor name; its position is saved")
+        changes.add_argument("--limit", type = int)
+        changes.set_defaults(handler = self.changes)
+
+        # storage
+        shard = commands.add_parser("shard", help = "Move baby files into nested shard directories")
+        shard.add_argument("--depth", type = int, default = 2)
+        shard.add_argument("--width", type = int, default = 1)
+        shard.set_defaults(handler = self.shard, local_only = True)
+        archive = commands.add_parser("archive", help = "Compress old daily logs into the archive tier")
+        archive.add_argument("--baby", dest = "baby_id", help = "Only this baby (default: all babies)")
+        archive.add_argument("--days", type = int, default = 90, help = "Archive logs older than this many days")
+        archive.add_argument("--codec", choices = ["zlib", "lzma"], default = "zlib")
+        archive.set_defaults(handler = self.archive, local_only = True)
+        sync = commands.add_parser("sync", help = "Two-way sync with another data directory")
+        sync.add_argument("peer_dir")
+        sync.set_defaults(handler = self.sync, local_only = True)
+        backup = commands.add_parser("backup", help = "Incremental backups").add_subparsers(dest = "action", required = True)
+        create = backup.add_parser("create")
+        create.add_argument("backup_dir")
+        create.set_defaults(handler = self.backup_create, local_only = True)
+        backup_list = backup.add_parser("list")
+        backup_list.add_argument("backup_dir")
+        backup_list.set_defaults(handler = self.backup_list, read_only = True, local_only = True)
+        restore = backup.add_parser("restore")
+        restore.add_argument("backup_dir")
+        restore.add_argument("--snapshot", help = "Snapshot ID (default: latest)")
+        restore.add_argument("--as-of", dest = "as_of", help = "Latest snapshot at or before this time (ISO format)")
+        restore.add_argument("--baby", dest = "baby_id", help = "Restore one baby into the data directory")
+        restore.add_argument("--target", help = "Empty directory to restore the whole snapshot into")
+        restore.set_defaults(handler = self.backup_restore, local_only = True)
+        migrate = commands.add_parser("migrate", help = "Upgrade stored baby files to the current schema version (run while nothing else writes the data directory)")
+        migrate.add_argument("--workers", type = int, default = os.cpu_count())
+        migrate.add_argument("--force", action = "store_true", help = "Rescan files even if a previous run completed")
+        migrate.set_defaults(handler = self.migrate, local_only = True)
+        fsck = commands.add_parser("fsck", help = "Check baby files for schema and reference problems")
+        fsck.add_argument("--repair", action = "store_true", help = "Fix repairable files in place")
+        fsck.add_argument("--quarantine", action = "store_true", help = "Move files that are not repaired out of the data directory")
+        fsck.add_argument("--workers", type = int, default = os.cpu_count())
+        fsck.set_defaults(handler = self.fsck, local_only = True)
+
+        # server
+        serve = commands.add_parser("serve", help = "Run a local tracker server with a shared in-memory cache")
+        serve.add_argument("--host", default = "127.0.0.1")
+        serve.add_argument("--port", type = int, default = 8765)
+        serve.add_argument("--workers", type = int, default = 8)
+        serve.add_argument("--token", help = "Token clients must send (default: $TRACKER_TOKEN); required off loopback")
+        serve.set_defaults(handler = self.serve)
+
+        dashboard = commands.add_parser("dashboard", help = "Run the web dashboard")
+        dashboard.add_argument("--host", default = "127.0.0.1")
+        dashboard.add_argument("--port", type = int, default = 8080)
+        dashboard.set_defaults(handler = self.dashboard)
+
+        desktop = commands.add_parser("desktop", help = "Open the desktop log browser")
+        desktop.set_defaults(handler = self.desktop)
+
+        return parser
+
+    def _add_log_arguments(self, parser):
+        """Arguments shared by every log type."""
+        parser.add_argument("--baby", dest = "baby_id", required = True)
+        parser.add_argument("--date", required = True, help = "YYYY-MM-DD")
+        parser.add_argument("--notes")
+
+    ################## Running ##################
+
+    def run(self, argv):
+        """
+        Run a command line (or a batch file of command lines).
+
+        Args:
+            argv (list): Arguments, without the program name
+
+        Returns:
+            int: Process exit status
+        """
+        try:
+            args = self.parser.parse_args(argv)
+        except CommandError as e:
+            self._write({"error": str(e)})
+            return 2
+
+        if args.data_dir:
+            self.data_dir = args.data_dir
+
+        if args.server:
+            from services.tracker_server import TrackerClient
+            self._client = TrackerClient(args.server)
+            argv = _strip_option(argv, "--server")
+
+        if args.batch:
+            return self.run_batch(args.batch)
+
+        if not args.command:
+            self._write({"error": "No command given"})
+            return 2
+
+        if args.command in LONG_RUNNING_COMMANDS:
+            return args.handler(args)
+
+        result = self._dispatch(argv)
+        self._write(result)
+        return 1 if _is_error(result) else 0
+
+    def run_batch(self, file_path):
+        """
+        Run one command per line, writing one JSON result per line.
+
+        Blank lines and lines starting with '#' are skipped. A failing
+        command is reported and the batch carries on.
+
+        Args:
+            file_path (str): Path of the batch file, '-' for stdin
+
+        Returns:
+            int: 0 if every command succeeded, 1 otherwise
+        """
+        status = 0
+        f = sys.stdin if file_path == "-" else open(file_path, 'r')
+        try:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    result = self._dispatch(shlex.split(line))
+                except (ValueError, OSError) as e:
+                    result = {"error": str(e)}
+                if _is_error(result):
+                    result = dict(result, command = line)
+                    status = 1
+                self._write(result)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+        self.output.flush()
+        return status
+
+    def _dispatch(self, argv):
+        """Run a command locally, or on the server when --server was given."""
+        if self._client is not None:
+            return self._client.call(argv)
+        return self.call(argv)
+
+    def call(self, argv, lock = None, remote = False):
+        """
+        Parse and run a single command without writing any output.
+
+        Global options (--data-dir, --batch, --server) are not honoured here.
+
+        Args:
+            argv (list): Command arguments
+            lock (ReadWriteLock, optional): Held for reading while running read-only commands
+                and for writing while running commands that modify data, so concurrent
+                callers never see or interleave partial writes. Defaults to None.
+            remote (bool, optional): The command came from a remote client; commands that
+                touch paths on this machine are refused. Defaults to False.
+
+        Returns:
+            object: JSON-serializable result; a dict with an 'error' key on failure
+        """
+        try:
+            args = self.parser.parse_args(argv)
+        except (CommandError, SystemExit) as e:
+            return {"error": str(e)}
+
+        if not args.command or args.batch or args.command in LONG_RUNNING_COMMANDS:
+            return {"error": "Expected a single command"}
+
+        if remote and (getattr(args, "local_only", False) or getattr(args, "output", None)):
+            return {"error": f"Command not available over the server: {args.command}"}
+
+        if lock is None:
+            return self._run_handler(args)
+
+        with lock.reading() if getattr(args, "read_only", False) else lock.writing():
+            return self._run_handler(args)
+
+    def _run_handler(self, args):
+        """Run a parsed command's handler, turning bad input and file errors into an error result."""
+        try:
+            return args.handler(args)
+        except (ValueError, OSError) as e:
+            return {"error": str(e)}
+
+    def _write(self, result):
+        """Write a result as a single line of JSON."""
+        self.output.write(json.dumps(result, default = str) + "\n")
+
+    ################## Handlers ##################
+
+    def _not_found(self, what, identifier):
+        """Error result for a missing baby or record."""
+        return {"error": f"{what} not found: {identifier}"}
+
+    def baby_list(self, args):
+        """List all babies."""
+        return [baby.to_dict() for baby in self.context.baby_controller.get_all_babies()]
+
+    def baby_add(self, args):
+        """Create a baby."""
+        baby = self.context.baby_controller.create_baby(args.name, args.birthdate, args.gender, args.notes)
+        return baby.to_dict()
+
+    def baby_show(self, args):
+        """Show a baby with all of its records."""
+        baby = self.context.baby_controller.get_baby_by_id(args.baby_id)
+        if not baby:
+            return self._not_found("Baby", args.baby_id)
+        baby_dict = baby.to_dict()
+        baby_dict["age"] = self.context.age_service.age(baby.birthdate)
+        baby_dict["growth_records"] = [record.to_dict() for record in baby.growth_records]
+        baby_dict["milestones"] = [milestone.to_dict() for milestone in baby.milestones]
+        # Include logs moved to the archive tier
+        baby_dict["daily_logs"] = [log.to_dict() for log in self.context.data_service.load_daily_logs(baby.id)]
+        return baby_dict
+
+    def baby_delete(self, args):
+        """Delete a baby."""
+        if not self.context.baby_controller.delete_baby(args.baby_id):
+            return self._not_found("Baby", args.baby_id)
+        return {"deleted": args.baby_id}
+
+    def log_feeding(self, args):
+        """Add a feeding log."""
+        log = self.context.daily_log_controller.add_feeding_log(
+            args.baby_id, args.date, args.time, args.feeding_type, args.amount, args.duration, args.notes
+        )
+        return log.to_dict() if log else self._not_found("Baby", args.baby_id)
+
+    def log_sleep(self, args):
+        """Add a sleep log."""
+        log = self.context.daily_log_controller.add_sleep_log(
+            args.baby_id, args.date, args.start, args.end, args.quality, args.notes
+        )
+        return log.to_dict() if log else self._not_found("Baby", args.baby_id)
+
+    def log_diaper(self, args):
+        """Add a diaper log."""
+        log = self.context.daily_log_controller.add_diaper_log(
+            args.baby_id, args.date, args.time, args.diaper_type, args.notes
+        )
+        return log.to_dict() if log else self._not_found("Baby", args.baby_id)
+
+    def log_list(self, args):
+        """List daily logs, optionally for one day."""
+        if args.date:
+            # Seek straight to the day's records instead of parsing the whole document
+            from utils.date_utils import parse_date_time
+            day, _ = parse_date_time(args.date, None)
+            logs = self.context.log_index_service.read_range(args.baby_id, day, day)
+        else:
+            logs = self.context.daily_log_controller.get_daily_logs(args.baby_id)
+        if logs is None:
+            return self._not_found("Baby", args.baby_id)
+        return [log.to_dict() for log in logs]
+
+    def growth_add(self, args):
+        """Add a growth record."""
+        record = self.context.growth_controller.add_growth_record(
+            args.baby_id, args.date, args.weight, args.height, args.head_circumference, args.notes
+        )
+        return record.to_dict() if record else self._not_found("Baby", args.baby_id)
+
+    def growth_list(self, args):
+        """List growth records."""
+        records = self.context.growth_controller.get_growth_records(args.baby_id)
+        if records is None:
+            return self._not_found("Baby", args.baby_id)
+        return [record.to_dict() for record in records]
+
+    def milestone_add(self, args):
+        """Add a milestone."""
+        expected_range = None
+        if args.min_months is not None and args.max_months is not None:
+            expected_range = {"min_months": args.min_months, "max_months": args.max_months}
+        milestone = self.context.milestone_controller.add_milestone(
+            args.baby_id, args.name, args.category, args.achieved, expected_range, args.notes
+        )
+        return milestone.to_dict() if milestone else self._not_found("Baby", args.baby_id)
+
+    def milestone_list(self, args):
+        """List milestones."""
+        milestones = self.context.milestone_controller.get_milestones(args.baby_id)
+        if milestones is None:
+            return self._not_found("Baby", args.baby_id)
+        return [milestone.to_dict() for milestone in milestones]
+
+    def import_file(self, args):
+        """Bulk import a CSV or JSONL file."""
+        from services.import_service import ImportService
+        return ImportService(self.context.data_service).import_file(args.file, args.file_format)
+
+    def export_all(self, args):
+        """Export all data to flat files."""
+        from services.export_service import ExportService
+        result = ExportService(self.context.data_service).export_all(args.output_dir, args.file_format, args.compress)
+        return {record_type: {"path": path, "rows": rows} for record_type, (path, rows) in result.items()}
+
+    def search(self, args):
+        """Search notes."""
+        return self.context.search_service.search(*args.phrases, baby_id = args.baby_id)
+
+    def archive(self, args):
+        """Move old daily logs into compressed archive segments."""
+        data_service = self.context.data_service
+        if args.baby_id:
+            baby_ids = [args.baby_id]
+        else:
+            baby_ids = [baby.id for baby in self.context.baby_controller.get_all_babies()]
+
+        archived = {}
+        for baby_id in baby_ids:
+            count = data_service.archive_daily_logs(baby_id, args.days, args.codec)
+            if count is None:
+                return self._not_found("Baby", baby_id)
+            archived[baby_id] = count
+        return {"archived": archived}
+
+    def query(self, args):
+        """Run a query, stopping after --limit matches."""
+        from itertools import islice
+        from services.query_service import QueryService, compile_query
+        if args.baby_id and not self.context.baby_controller.get_baby_by_id(args.baby_id):
+            return self._not_found("Baby", args.baby_id)
+        try:
+            compiled = compile_query(args.query)
+        except ValueError as e:
+            return {"error": str(e)}
+        records = QueryService(self.context.data_service).run(compiled, args.baby_id)
+        return [record.to_dict() for record in islice(records, args.limit)]
+
+    def heatmap(self, args):
+        """Bin feedings, sleeps and diapers by weekday and hour."""
+        from datetime import date
+        try:
+            start_date = date.fromisoformat(args.start) if args.start else None
+            end_date = date.fromisoformat(args.end) if args.end else None
+            result = self.context.heatmap_service.heatmap(args.baby_id, start_date, end_date)
+        except ValueError as e:
+            return {"error": str(e)}
+        if result is None:
+            return self._not_found("Baby", args.baby_id)
+        return result
+
+    def stats_feeding(self, args):
+        """Show the last feed, the predicted next feed and interval statistics."""
+        stats = self.context.feeding_stats_service.get_stats(args.baby_id)
+        if stats is None:
+            return self._not_found("Baby", args.baby_id)
+        return stats.to_dict()
+
+    def stats_sleep(self, args):
+        """Summarize sleep over a window and total it per day."""
+        from datetime import datetime, timedelta
+        window_end = datetime.fromisoformat(args.end) if args.end else datetime.now()
+        service = self.context.sleep_analytics_service
+        summary = service.summarize(args.baby_id, window_end, args.hours)
+        if summary is None:
+            return self._not_found("Baby", args.baby_id)
+        last_day = window_end.date()
+        totals = service.daily_totals(args.baby_id, last_day - timedelta(days = args.days - 1), last_day)
+        summary["daily_totals"] = {day.isoformat(): minutes for day, minutes in totals.items()}
+        return summary
+
+    def _report_service(self):
+        """
+        ReportService on the context's DailySummaryService.
+
+        That service follows the durable change feed, so reports include
+        writes by other processes without rescanning each baby's history.
+        """
+        from services.report_service import ReportService
+        return ReportService(
+            self.context.data_service,
+            summary_service = self.context.daily_summary_service,
+            age_service = self.context.age_service
+        )
+
+    def report_baby(self, args):
+        """Render one baby's checkup report."""
+        try:
+            content = self._report_service().render(args.baby_id, args.file_format, days = args.days)
+        except ValueError as e:
+            return {"error": str(e)}
+        if content is None:
+            return self._not_found("Baby", args.baby_id)
+        if not args.output:
+            return {"format": args.file_format, "report": content}
+        with open(args.output, 'w', encoding = "utf-8") as f:
+            f.write(content)
+        return {"path": args.output}
+
+    def report_all(self, args):
+        """Render a checkup report for every baby, in parallel."""
+        try:
+            paths = self._report_service().render_all(args.output_dir, args.file_format, args.workers, days = args.days)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"reports": paths}
+
+    def changes(self, args):
+        """Read change events after a cursor and advance it."""
+        cursor = self.context.data_service.change_feed.cursor(args.cursor)
+        events = cursor.poll(args.limit)
+        cursor.commit()
+        return [event.to_dict() for event in events]
+
+    def sync(self, args):
+        """Exchange changes with another data directory."""
+        from services.sync_service import SyncService
+        from utils.app_context import AppContext
+        if not os.path.isdir(args.peer_dir):
+            return {"error": f"Peer directory not found: {args.peer_dir}"}
+        peer = SyncService(AppContext(args.peer_dir).data_service)
+        return SyncService(self.context.data_service).sync_with(peer)
+
+    def backup_create(self, args):
+        """Back up the data directory, writing only new chunks."""
+        from services.backup_service import BackupService
+        return BackupService(self.context.data_service, args.backup_dir).backup()
+
+    def backup_list(self, args):
+        """List the snapshots in a backup repository."""
+        from services.backup_service import BackupService
+        return BackupService(self.context.data_service, args.backup_dir).list_snapshots()
+
+    def backup_restore(self, args):
+        """Restore one baby in place, or a whole snapshot into an empty directory."""
+        from datetime import datetime
+        from services.backup_service import BackupService
+        if bool(args.baby_id) == bool(args.target):
+            return {"error": "Give exactly one of --baby or --target"}
+        try:
+            as_of = datetime.fromisoformat(args.as_of) if args.as_of else None
+        except ValueError as e:
+            return {"error": str(e)}
+
+        service = BackupService(self.context.data_service, args.backup_dir)
+        if args.baby_id:
+            result = service.restore_baby(args.baby_id, args.snapshot, as_of)
+            if result is None:
+                return self._not_found("Backed up baby", args.baby_id)
+            return result
+
+        try:
+            result = service.restore_all(args.target, args.snapshot, as_of)
+        except ValueError as e:
+            return {"error": str(e)}
+        if result is None:
+            return self._not_found("Snapshot", args.snapshot or args.as_of or "latest")
+        return result
+
+    def migrate(self, args):
+        """Upgrade baby files in place; resumes where an interrupted run stopped."""
+        from services.migration_service import MigrationService
+        return MigrationService(self.context.data_service).run(args.workers, args.force)
+
+    def fsck(self, args):
+        """Check every baby file and optionally repair or quarantine bad ones."""
+        from services.integrity_service import IntegrityService
+        # Repairs and quarantines go through the data service, which keeps the notes index current
+        return IntegrityService(self.context.data_service).check_all(args.repair, args.quarantine, args.workers)
+
+    def shard(self, args):
+        """Migrate the data directory to the sharded layout."""
+        return {"moved": self.context.data_service.migrate_to_sharded(args.depth, args.width)}
+
+    def serve(self, args):
+        """Run the tracker server until interrupted."""
+        from services.tracker_server import TOKEN_ENV, TrackerServer
+        try:
+            server = TrackerServer((args.host, args.port), self.data_dir, args.workers, args.token or os.environ.get(TOKEN_ENV))
+        except ValueError as e:
+            self._write({"error": str(e)})
+            return 2
+        host, port = server.server_address[:2]
+        self._write({"serving": f"{host}:{port}", "data_dir": self.data_dir})
+        self.output.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    def dashboard(self, args):
+        """Run the web dashboard until interrupted."""
+        from utils.app_context import AppContext
+        from views.dashboard_view import DashboardView
+        self._write({"dashboard": f"http://{args.host}:{args.port}/", "data_dir": self.data_dir})
+        self.output.flush()
+        DashboardView(AppContext(self.data_dir, cached = True)).run(args.host, args.port)
+        return 0
+
+    def desktop(self, args):
+        """Open the desktop log browser until its window is closed."""
+        from views.desktop_view import run_desktop
+        return run_desktop(self.context)
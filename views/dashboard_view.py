@@ -0,0 +1,192 @@
+# views/dashboard_view.py
+
+import datetime
+
+from nicegui import ui
+
+# Today's counters shown as cards: (summary field, label, format)
+TODAY_CARDS = [
+    ("feedings", "Feedings", "{:g}"),
+    ("feeding_amount", "Amount fed", "{:g}"),
+    ("sleeps", "Naps / sleeps", "{:g}"),
+    ("sleep_minutes", "Hours slept", "{:.1f}"),
+    ("diapers", "Diapers", "{:g}"),
+    ("diapers_wet", "Wet", "{:g}"),
+    ("diapers_soiled", "Soiled", "{:g}"),
+]
+
+# Growth series drawn on the chart: (growth point field, label)
+GROWTH_SERIES = [
+    ("weight", "Weight"),
+    ("height", "Height"),
+    ("head_circumference", "Head circumference"),
+]
+
+
+class _DashboardPanel:
+    def __init__(self, context, summary_service):
+        """
+        Build the dashboard for one browser tab.
+
+        The panel reads a baby's pre-aggregated summaries once when the baby
+        is selected, then applies the deltas published by the summary
+        service. NiceGUI sends each element change over the tab's websocket.
+
+        Args:
+            context (AppContext): Application context
+            summary_service (DailySummaryService): Shared per-day aggregates
+        """
+        self.context = context
+        self.summary_service = summary_service
+        self.baby_id = None
+        self.day = datetime.date.today()
+        self.today = {}
+        self.growth = {}
+
+        babies = {baby.id: baby.name for baby in context.baby_controller.get_all_babies()}
+
+        with ui.row().classes("items-center"):
+            ui.label("Baby Tracker").classes("text-h5")
+            ui.select(babies, label = "Baby", on_change = lambda e: self.select_baby(e.value)).classes("w-64")
+
+        with ui.row():
+            self.today_labels = {}
+            for field, label, _ in TODAY_CARDS:
+                with ui.card().classes("items-center"):
+                    ui.label(label).classes("text-caption")
+                    self.today_labels[field] = ui.label("-").classes("text-h6")
+
+        with ui.row().classes("items-center"):
+            self.amount_input = ui.number("Amount", value = 4, min = 0).classes("w-24")
+            ui.button("Log bottle", on_click = self.add_feeding)
+            ui.button("Wet diaper", on_click = lambda: self.add_diaper("wet"))
+            ui.button("Soiled diaper", on_click = lambda: self.add_diaper("soiled"))
+
+        self.chart = ui.echart({
+            "tooltip": {"trigger": "axis"},
+            "legend": {},
+            "xAxis": {"type": "time"},
+            "yAxis": {"type": "value"},
+            "series": [{"name": label, "type": "line", "data": []} for _, label in GROWTH_SERIES],
+        }).classes("w-full h-64")
+
+        ui.label("Milestones").classes("text-h6")
+        self.milestone_label = ui.label("-")
+        self.milestone_progress = ui.linear_progress(value = 0, show_value = False)
+
+        summary_service.subscribe(self.on_summary_changed)
+        ui.context.client.on_delete(lambda: summary_service.unsubscribe(self.on_summary_changed))
+        # Start the counters over when the date changes
+        ui.timer(60, self.check_day)
+
+    def select_baby(self, baby_id):
+        """Load the selected baby's summaries and milestones."""
+        self.baby_id = baby_id
+        self.day = datetime.date.today()
+        self.today = self.summary_service.get_day(baby_id, self.day) or {}
+        self.growth = {point["id"]: point for point in self.summary_service.get_growth(baby_id) or []}
+        self._render_today()
+        self._render_growth()
+        self._render_milestones()
+
+    def on_summary_changed(self, baby_id, delta):
+        """Apply a delta published by the summary service."""
+        if baby_id != self.baby_id:
+            return
+
+        if delta.get("reset"):
+            self.select_baby(baby_id)
+            return
+
+        day_delta = delta.get("days", {}).get(self.day)
+        if day_delta:
+            for field, value in day_delta.items():
+                self.today[field] = self.today.get(field, 0) + value
+            self._render_today()
+
+        if "growth" in delta:
+            for point in delta["growth"]:
+                self.growth[point["id"]] = point
+            for record_id in delta["removed"]:
+                self.growth.pop(record_id, None)
+            self._render_growth()
+
+    def check_day(self):
+        """Reload today's counters once the date has rolled over."""
+        if datetime.date.today() == self.day:
+            return
+        self.day = datetime.date.today()
+        if self.baby_id:
+            self.today = self.summary_service.get_day(self.baby_id, self.day) or {}
+            self._render_today()
+
+    def add_feeding(self):
+        """Log a bottle feeding now."""
+        if not self.baby_id:
+            ui.notify("Select a baby first")
+            return
+        now = datetime.datetime.now()
+        self.context.daily_log_controller.add_feeding_log(
+            self.baby_id, now.date(), now.time(), "bottle", amount = self.amount_input.value
+        )
+
+    def add_diaper(self, diaper_type):
+        """Log a diaper change now."""
+        if not self.baby_id:
+            ui.notify("Select a baby first")
+            return
+        now = datetime.datetime.now()
+        self.context.daily_log_controller.add_diaper_log(self.baby_id, now.date(), now.time(), diaper_type)
+
+    def _render_today(self):
+        """Show today's counters."""
+        for field, _, fmt in TODAY_CARDS:
+            value = self.today.get(field, 0)
+            if field == "sleep_minutes":
+                value = value / 60
+            self.today_labels[field].set_text(fmt.format(value))
+
+    def _render_growth(self):
+        """Redraw the growth chart from the cached points."""
+        points = sorted(self.growth.values(), key = lambda point: point["date"])
+        for series, (field, _) in zip(self.chart.options["series"], GROWTH_SERIES):
+            series["data"] = [[point["date"], point[field]] for point in points if point[field] is not None]
+        self.chart.update()
+
+    def _render_milestones(self):
+        """Show how many of the baby's milestones are achieved."""
+        milestones = self.context.milestone_controller.get_milestones(self.baby_id) or []
+        achieved = sum(1 for milestone in milestones if milestone.is_achieved())
+        self.milestone_label.set_text(f"{achieved} of {len(milestones)} achieved")
+        self.milestone_progress.set_value(achieved / len(milestones) if milestones else 0)
+
+
+class DashboardView:
+    def __init__(self, context):
+        """
+        Initialize the web dashboard.
+
+        Every open tab shares one DailySummaryService, so a baby's history
+        is aggregated once per process rather than once per tab or refresh.
+        The service follows every save through the data service, so the
+        tabs also see imports, syncs and changes made by other views.
+
+        Args:
+            context (AppContext): Application context
+        """
+        self.context = context
+        self.summary_service = context.daily_summary_service
+
+    def run(self, host = "127.0.0.1", port = 8080):
+        """
+        Serve the dashboard until interrupted.
+
+        Args:
+            host (str, optional): Interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 8080.
+        """
+        @ui.page("/")
+        def index():
+            _DashboardPanel(self.context, self.summary_service)
+
+        ui.run(host = host, port = port, title = "Baby Tracker", reload = False, show = False)
@@ -0,0 +1,217 @@
+# views/desktop_view.py
+
+import sys
+from itertools import islice
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import (
+    QApplication, QComboBox, QHeaderView, QMainWindow, QTableView, QTabWidget, QVBoxLayout, QWidget
+)
+
+# Rows converted per fetchMore call
+FETCH_BATCH = 200
+
+
+def _format_log_details(log):
+    """Describe the type-specific fields of a daily log."""
+    if log.log_type == "feeding":
+        details = [log.feeding_type]
+        if log.amount:
+            details.append(f"{log.amount} ml/oz")
+        if log.duration:
+            details.append(f"{log.duration} minutes")
+        return ", ".join(details)
+
+    if log.log_type == "sleep":
+        end_time_str = log.end_time.strftime("%H:%M") if log.end_time else "ongoing"
+        quality_str = f", {log.quality}" if log.quality else ""
+        return f"until {end_time_str}{quality_str}"
+
+    if log.log_type == "diaper":
+        return log.diaper_type
+
+    return ""
+
+
+def _format_optional(value):
+    """Show a missing measurement as an empty cell."""
+    return "" if value is None else str(value)
+
+
+# Table columns per record type: (header, row formatter)
+COLUMNS = {
+    "daily_logs": [
+        ("Date", lambda log: log.date.strftime("%Y-%m-%d")),
+        ("Time", lambda log: log.time.strftime("%H:%M")),
+        ("Type", lambda log: log.log_type.capitalize()),
+        ("Details", _format_log_details),
+        ("Notes", lambda log: log.notes or ""),
+    ],
+    "growth_records": [
+        ("Date", lambda record: record.date.strftime("%Y-%m-%d")),
+        ("Weight", lambda record: _format_optional(record.weight)),
+        ("Height", lambda record: _format_optional(record.height)),
+        ("Head circumference", lambda record: _format_optional(record.head_circumference)),
+        ("Notes", lambda record: record.notes or ""),
+    ],
+    "milestones": [
+        ("Achieved", lambda milestone: milestone.achieved_date.strftime("%Y-%m-%d") if milestone.achieved_date else "pending"),
+        ("Name", lambda milestone: milestone.name),
+        ("Category", lambda milestone: milestone.category),
+        ("Notes", lambda milestone: milestone.notes or ""),
+    ],
+}
+
+# Tabs shown in the window: (record type, title)
+TABS = [
+    ("daily_logs", "Daily Logs"),
+    ("growth_records", "Growth"),
+    ("milestones", "Milestones"),
+]
+
+
+class LazyTableModel(QAbstractTableModel):
+    def __init__(self, columns, batch_size = FETCH_BATCH, parent = None):
+        """
+        Initialize a table model that pulls rows from an iterator on demand.
+
+        The view asks for more rows (canFetchMore/fetchMore) as the user
+        scrolls towards the end. Each batch is converted to display strings
+        and the record objects are dropped, so only text for rows already
+        scrolled past is kept.
+
+        Args:
+            columns (list): (header, formatter) pairs; formatter turns a record into cell text
+            batch_size (int, optional): Rows fetched per fetchMore. Defaults to FETCH_BATCH.
+            parent (QObject, optional): Qt parent. Defaults to None.
+        """
+        super().__init__(parent)
+        self.columns = columns
+        self.batch_size = batch_size
+        self._records = iter(())
+        self._rows = []
+        self._exhausted = True
+
+    def set_records(self, records):
+        """
+        Replace the table contents with a new record iterator.
+
+        Args:
+            records (iterable): Records in display order; consumed lazily
+        """
+        self.beginResetModel()
+        self._records = iter(records)
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+
+    def rowCount(self, parent = QModelIndex()):
+        """Number of rows fetched so far."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent = QModelIndex()):
+        """Number of columns."""
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role = Qt.DisplayRole):
+        """Cell text for fetched rows."""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role = Qt.DisplayRole):
+        """Column headers and 1-based row numbers."""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return section + 1
+
+    def canFetchMore(self, parent = QModelIndex()):
+        """Whether the iterator may still have rows."""
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent = QModelIndex()):
+        """Convert the next batch of records into rows."""
+        if parent.isValid():
+            return
+
+        batch = [
+            tuple(formatter(record) for _, formatter in self.columns)
+            for record in islice(self._records, self.batch_size)
+        ]
+        if len(batch) < self.batch_size:
+            self._exhausted = True
+        if not batch:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._rows.extend(batch)
+        self.endInsertRows()
+
+
+class DesktopView(QMainWindow):
+    def __init__(self, context):
+        """
+        Initialize the desktop log browser.
+
+        One tab per record type; each table reads the selected baby's
+        records from DataService in date order, a batch at a time.
+
+        Args:
+            context (AppContext): Application context
+        """
+        super().__init__()
+        self.context = context
+        self.setWindowTitle("Baby Tracker")
+        self.resize(900, 600)
+
+        self.baby_selector = QComboBox()
+        for baby in context.baby_controller.get_all_babies():
+            self.baby_selector.addItem(baby.name, baby.id)
+        self.baby_selector.currentIndexChanged.connect(self.refresh)
+
+        self.tabs = QTabWidget()
+        self.models = {}
+        for record_type, title in TABS:
+            model = LazyTableModel(COLUMNS[record_type], parent = self)
+            table = QTableView()
+            table.setModel(model)
+            # Fixed row heights keep Qt from measuring every row while scrolling
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            table.horizontalHeader().setStretchLastSection(True)
+            self.models[record_type] = model
+            self.tabs.addTab(table, title)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.baby_selector)
+        layout.addWidget(self.tabs)
+        central = QWidget()
+        central.setLayout(layout)
+        self.setCentralWidget(central)
+
+        self.refresh()
+
+    def refresh(self):
+        """Reload every table for the selected baby."""
+        baby_id = self.baby_selector.currentData()
+        data_service = self.context.data_service
+        for record_type, model in self.models.items():
+            model.set_records(data_service.iter_records(baby_id, record_type) if baby_id else ())
+
+
+def run_desktop(context):
+    """
+    Show the desktop browser until its window is closed.
+
+    Args:
+        context (AppContext): Application context
+
+    Returns:
+        int: Qt exit status
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = DesktopView(context)
+    window.show()
+    return app.exec()
@@ -0,0 +1,188 @@
+# views/pager.py
+
+import datetime
+import sys
+from bisect import bisect_left
+
+
+class Pager:
+    def __init__(self, items, format_item, page_size = 20, title = None, header = None,
+                 group_key = None, format_group = None, date_key = None, output = None):
+        """
+        Initialize a pager over a (possibly lazy) sequence of items.
+
+        Items are pulled from the iterator only as far as the requested page
+        and only the visible page is formatted. Each page is written to the
+        output in a single buffered write.
+
+        Args:
+            items (iterable): Items to page through, already in display order
+            format_item (callable): Called as format_item(number, item), returns a list of lines
+            page_size (int, optional): Items per page. Defaults to 20.
+            title (str, optional): Line shown at the top of every page. Defaults to None.
+            header (list, optional): Lines shown below the title (e.g. table header). Defaults to None.
+            group_key (callable, optional): Items with a different key from the previous
+                item start a new group. Defaults to None.
+            format_group (callable, optional): Called with a group key, returns the group heading line.
+                Defaults to None.
+            date_key (callable, optional): Returns an item's date; enables jump-to-date.
+                Items must be in ascending date order. Defaults to None.
+            output (file, optional): Stream to write pages to. Defaults to sys.stdout.
+        """
+        self._iterator = iter(items)
+        self._fetched = []
+        self._exhausted = False
+        self.format_item = format_item
+        self.page_size = page_size
+        self.title = title
+        self.header = header or []
+        self.group_key = group_key
+        self.format_group = format_group
+        self.date_key = date_key
+        self.output = output or sys.stdout
+        self.page = 0
+
+    def _fetch_until(self, count):
+        """Pull items from the iterator until count items are available or it runs out."""
+        while len(self._fetched) < count and not self._exhausted:
+            try:
+                self._fetched.append(next(self._iterator))
+            except StopIteration:
+                self._exhausted = True
+
+    def is_empty(self):
+        """Check whether there is nothing to display."""
+        self._fetch_until(1)
+        return not self._fetched
+
+    def has_next_page(self):
+        """Check whether a page follows the current one."""
+        return self._has_page_after(self.page)
+
+    def render_page(self, page = None):
+        """
+        Format a page.
+
+        Args:
+            page (int, optional): Zero-based page number. Defaults to None (current page).
+
+        Returns:
+            str: Page text
+        """
+        if page is None:
+            page = self.page
+
+        start = page * self.page_size
+        self._fetch_until(start + self.page_size)
+        page_items = self._fetched[start:start + self.page_size]
+
+        lines = []
+        if self.title:
+            lines.append(self.title)
+        lines.extend(self.header)
+
+        previous_group = None
+        for number, item in enumerate(page_items, start + 1):
+            if self.group_key is not None:
+                group = self.group_key(item)
+                if number == start + 1 or group != previous_group:
+                    lines.append("")
+                    lines.append(self.format_group(group) if self.format_group else str(group))
+                previous_group = group
+            lines.extend(self.format_item(number, item))
+
+        lines.append("")
+        lines.append(f"-- Page {page + 1} {'(more)' if self._has_page_after(page) else '(end)'} --")
+        return "\n".join(lines) + "\n"
+
+    def _has_page_after(self, page):
+        """Check whether a page follows the given one."""
+        self._fetch_until((page + 1) * self.page_size + 1)
+        return len(self._fetched) > (page + 1) * self.page_size
+
+    def show(self):
+        """Write the current page in a single buffered write."""
+        self.output.write(self.render_page())
+        self.output.flush()
+
+    def next_page(self):
+        """Move to the next page if there is one."""
+        if self.has_next_page():
+            self.page += 1
+            return True
+        return False
+
+    def prev_page(self):
+        """Move to the previous page if there is one."""
+        if self.page > 0:
+            self.page -= 1
+            return True
+        return False
+
+    def jump_to_date(self, target):
+        """
+        Move to the page holding the first item on or after a date.
+
+        Args:
+            target (date): Date to jump to
+
+        Returns:
+            bool: True if such an item exists
+        """
+        if self.date_key is None:
+            return False
+
+        def item_date(item):
+            return _as_date(self.date_key(item))
+
+        # Pull whole pages until the last fetched item reaches the target date
+        while not self._exhausted and (not self._fetched or item_date(self._fetched[-1]) < target):
+            self._fetch_until(len(self._fetched) + self.page_size)
+
+        index = bisect_left(self._fetched, target, key = item_date)
+        if index >= len(self._fetched):
+            return False
+
+        self.page = index // self.page_size
+        return True
+
+    def run(self):
+        """Show pages interactively until the user quits."""
+        while True:
+            self.show()
+
+            if self.page == 0 and not self.has_next_page():
+                input("\nPress Enter to continue...")
+                return
+
+            controls = "[n]ext, [p]rev, "
+            if self.date_key is not None:
+                controls += "[j]ump to date, "
+            choice = input(f"{controls}[q]uit: ").strip().lower()
+
+            if choice in ('', 'n'):
+                if not self.next_page():
+                    print("Already at the last page.")
+            elif choice == 'p':
+                if not self.prev_page():
+                    print("Already at the first page.")
+            elif choice == 'j' and self.date_key is not None:
+                date_str = input("Date (YYYY-MM-DD): ")
+                try:
+                    target = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+                except ValueError:
+                    print("Invalid date format. Please use YYYY-MM-DD.")
+                    continue
+                if not self.jump_to_date(target):
+                    print(f"No entries on or after {date_str}.")
+            elif choice == 'q':
+                return
+            else:
+                print("Invalid choice. Please try again.")
+
+
+def _as_date(value):
+    """Normalize a datetime or date to a date."""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value